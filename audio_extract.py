@@ -0,0 +1,97 @@
+import os
+import sqlite3
+import threading
+import subprocess
+
+from result_cache import hash_file, link_or_copy
+
+AUDIO_CACHE_DIR = "audio_cache"
+EXTRACT_FORMAT_OPTIONS = ["flac", "wav"]
+VIDEO_EXTENSIONS = ('.mp4', '.m4v', '.mov', '.mkv', '.webm', '.avi')
+EXTRACT_CODECS = {"flac": "flac", "wav": "pcm_s16le"}
+
+
+def is_video(filename):
+    return filename.lower().endswith(VIDEO_EXTENSIONS)
+
+
+class AudioExtractor:
+    def __init__(self, ffmpeg, cache_dir=AUDIO_CACHE_DIR, audio_format="flac", keep_format=False):
+        self.ffmpeg = ffmpeg
+        self.cache_dir = cache_dir
+        self.audio_format = audio_format if audio_format in EXTRACT_CODECS else EXTRACT_FORMAT_OPTIONS[0]
+        self.keep_format = keep_format
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        os.makedirs(os.path.join(cache_dir, "objects"), exist_ok=True)
+        self.db = sqlite3.connect(os.path.join(cache_dir, "index.db"), check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS sources ("
+            "path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, content_hash TEXT NOT NULL)"
+        )
+        self.db.commit()
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+    def content_hash(self, path):
+        # Hashing reads the whole container once; the digest is remembered
+        # for as long as the file keeps its size and mtime, so later runs do
+        # not read the video at all.
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        with self.lock:
+            row = self.db.execute(
+                "SELECT content_hash FROM sources WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (path, st.st_size, st.st_mtime_ns)
+            ).fetchone()
+        if row is not None:
+            return row[0]
+        digest = hash_file(path)
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO sources (path, size, mtime_ns, content_hash) VALUES (?, ?, ?, ?)",
+                (path, st.st_size, st.st_mtime_ns, digest)
+            )
+            self.db.commit()
+        return digest
+
+    def extract(self, path, track="1"):
+        key = f"{self.content_hash(path)}-t{track}{'-source' if self.keep_format else ''}"
+        entry_dir = os.path.join(self.cache_dir, "objects", key[:2], key)
+        # The executable names its outputs after the input, so the audio is
+        # handed over under the original stem; other names for the same
+        # content are links to the first extraction.
+        stem = os.path.splitext(os.path.basename(path))[0]
+        target = os.path.join(entry_dir, f"{stem}.{self.audio_format}")
+        if os.path.isfile(target):
+            with self.lock:
+                self.hits += 1
+            return target
+
+        os.makedirs(entry_dir, exist_ok=True)
+        existing = [entry.path for entry in os.scandir(entry_dir)
+                    if entry.is_file() and entry.name.endswith("." + self.audio_format)]
+        if existing:
+            link_or_copy(existing[0], target)
+            with self.lock:
+                self.hits += 1
+            return target
+
+        with self.lock:
+            self.misses += 1
+        partial = f"{target}.{threading.get_ident()}.part"
+        command = [self.ffmpeg, "-hide_banner", "-nostats", "-loglevel", "error", "-y", "-i", path,
+                   "-map", f"0:a:{max(0, int(track) - 1)}", "-vn", "-sn", "-dn"]
+        if not self.keep_format:
+            command.extend(["-ac", "1", "-ar", "16000"])
+        command.extend(["-c:a", EXTRACT_CODECS[self.audio_format], "-f", self.audio_format, partial])
+        try:
+            subprocess.run(command, check=True, capture_output=True)
+            os.replace(partial, target)
+        finally:
+            if os.path.exists(partial):
+                os.remove(partial)
+        return target
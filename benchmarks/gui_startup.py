@@ -0,0 +1,36 @@
+import os
+import sys
+import json
+import time
+
+# Launches the GUI the way main_test.py does and reports, in milliseconds
+# since BENCH_LAUNCH_TIME (set by the parent just before starting this
+# process), when the imports finished, when the window was built and when the
+# first paint event arrived. Exits right after the first paint.
+
+LAUNCHED = float(os.environ.get('BENCH_LAUNCH_TIME', time.time()))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import QEvent, QObject, QTimer
+
+import main_test
+
+marks = {'imported_ms': (time.time() - LAUNCHED) * 1000}
+
+
+class FirstPaint(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and 'first_paint_ms' not in marks:
+            marks['first_paint_ms'] = (time.time() - LAUNCHED) * 1000
+            QTimer.singleShot(0, app.quit)
+        return False
+
+
+app, window = main_test.launch(sys.argv[:1])
+marks['window_built_ms'] = (time.time() - LAUNCHED) * 1000
+first_paint = FirstPaint()
+app.installEventFilter(first_paint)
+QTimer.singleShot(30000, app.quit)
+app.exec()
+print(json.dumps({key: round(value, 2) for key, value in marks.items()}))
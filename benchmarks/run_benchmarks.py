@@ -0,0 +1,394 @@
+import os
+import sys
+import json
+import time
+import wave
+import shutil
+import argparse
+import functools
+import threading
+import http.server
+import importlib.util
+import platform
+import tempfile
+import statistics
+import subprocess
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+
+
+def parse_int_list(value):
+    return [int(part) for part in value.split(',') if part.strip()]
+
+
+def make_corpus(directory, count, seconds, sample_rate=16000):
+    os.makedirs(directory, exist_ok=True)
+    frames = b"\0\0" * int(sample_rate * seconds)
+    files = []
+    for index in range(count):
+        path = os.path.join(directory, f"clip_{index:05d}.wav")
+        with wave.open(path, 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(sample_rate)
+            wav.writeframes(frames)
+        files.append(path)
+    return files
+
+
+def make_wrapper(bin_dir, name, script):
+    os.makedirs(bin_dir, exist_ok=True)
+    if os.name == 'nt':
+        path = os.path.join(bin_dir, name + ".cmd")
+        with open(path, 'w') as f:
+            f.write(f'@"{sys.executable}" "{script}" %*\n')
+    else:
+        path = os.path.join(bin_dir, name)
+        with open(path, 'w') as f:
+            f.write(f'#!/bin/sh\nexec "{sys.executable}" "{script}" "$@"\n')
+        os.chmod(path, 0o755)
+    return path
+
+
+def max_rss_bytes():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def result(name, params, metrics):
+    return {'name': name, 'params': params, 'metrics': metrics}
+
+
+def bench_pipeline(args, corpus, exe_path, work_dir):
+    from transcription import DEFAULT_SETTINGS, TranscriptionPipeline
+
+    results = []
+    for workers, files_per_run in [(w, n) for w in args.workers for n in args.files_per_run]:
+        output_dir = os.path.join(work_dir, f"output_w{workers}_n{files_per_run}")
+        settings = dict(DEFAULT_SETTINGS)
+        settings.update({
+            'exe_path': exe_path,
+            'output_dir': output_dir,
+            'max_workers': str(workers),
+            'files_per_run': str(files_per_run),
+            'output_format': 'srt txt',
+        })
+        failures = []
+        pipeline = TranscriptionPipeline(
+            corpus, settings,
+            on_file_finished=lambda filename, status: status == "failed" and failures.append(filename),
+        )
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        pipeline.run()
+        wall = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+        # With a fixed stub runtime the ideal batch time is known exactly, so
+        # anything above it is orchestration overhead, including the simulated
+        # model load of every process started.
+        rounds = -(-len(corpus) // workers)
+        ideal = rounds * args.runtime
+        results.append(result('pipeline', {
+            'files': len(corpus),
+            'workers': workers,
+            'files_per_run': files_per_run,
+            'stub_runtime_s': args.runtime,
+            'stub_startup_s': args.startup,
+            'fail_rate': args.fail_rate,
+        }, {
+            'wall_s': round(wall, 4),
+            'files_per_s': round(len(corpus) / wall, 3),
+            'overhead_per_file_ms': round((wall - ideal) / len(corpus) * 1000, 3),
+            'failed_files': len(failures),
+            'peak_python_memory_bytes': peak,
+            'max_rss_bytes': max_rss_bytes(),
+        }))
+        print(f"pipeline workers={workers} files_per_run={files_per_run}: {wall:.2f}s", file=sys.stderr)
+    return results
+
+
+def bench_downloads(args, work_dir):
+    from download_cache import DownloadCache
+    from transcription import download_audio
+
+    results = []
+    urls = [f"https://example.invalid/watch?v={index}" for index in range(args.urls)]
+    for downloads in args.downloads:
+        download_dir = os.path.join(work_dir, f"downloads_d{downloads}")
+        cache = DownloadCache(download_dir)
+
+        def fetch_all():
+            with ThreadPoolExecutor(max_workers=downloads) as executor:
+                return list(executor.map(lambda url: download_audio(url, download_dir, cache), urls))
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        paths = fetch_all()
+        wall = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # A second pass over the same URLs should be served from the download
+        # cache without starting yt-dlp at all.
+        started = time.perf_counter()
+        warm_paths = fetch_all()
+        warm_wall = time.perf_counter() - started
+        cache.close()
+
+        ideal = -(-len(urls) // downloads) * args.download_delay
+        results.append(result('download_audio', {
+            'urls': len(urls),
+            'downloads': downloads,
+            'stub_delay_s': args.download_delay,
+        }, {
+            'wall_s': round(wall, 4),
+            'urls_per_s': round(len(urls) / wall, 3),
+            'overhead_per_url_ms': round((wall - ideal) / len(urls) * 1000, 3),
+            'warm_wall_s': round(warm_wall, 4),
+            'warm_per_url_ms': round(warm_wall / len(urls) * 1000, 3),
+            'distinct_paths': len(set(paths)),
+            'warm_paths_match': warm_paths == paths,
+            'peak_python_memory_bytes': peak,
+        }))
+        print(f"download_audio downloads={downloads}: {wall:.2f}s, warm {warm_wall:.3f}s", file=sys.stderr)
+    return results
+
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class QuietServer(http.server.ThreadingHTTPServer):
+    # yt-dlp drops the connection of its first request once it has sniffed
+    # the content type.
+    def handle_error(self, request, client_address):
+        pass
+
+
+def serve_directory(directory):
+    server = QuietServer(("127.0.0.1", 0), functools.partial(QuietHandler, directory=directory))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def bench_engine(args, work_dir):
+    from download_cache import DownloadCache
+    from ytdlp_engine import DownloadEngine, engine_available
+
+    if not engine_available():
+        print("download_engine: skipped, the yt_dlp package is not installed", file=sys.stderr)
+        return []
+
+    # The in-process engine talks to a real HTTP server, so it is measured
+    # against fixture media served from localhost.
+    media = make_corpus(os.path.join(work_dir, "media"), args.urls, args.seconds)
+    server = serve_directory(os.path.dirname(media[0]))
+    urls = [f"http://127.0.0.1:{server.server_port}/{os.path.basename(path)}" for path in media]
+    results = []
+    try:
+        for downloads in args.downloads:
+            download_dir = os.path.join(work_dir, f"engine_d{downloads}")
+            cache = DownloadCache(download_dir)
+            engine = DownloadEngine(download_dir, cache)
+
+            # The engine is driven from a pool of `downloads` threads, like
+            # the pipeline's downloader pool.
+            def fetch_all():
+                with ThreadPoolExecutor(max_workers=downloads) as executor:
+                    return list(executor.map(engine.download, urls))
+
+            tracemalloc.start()
+            started = time.perf_counter()
+            paths = fetch_all()
+            wall = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            started = time.perf_counter()
+            warm_paths = fetch_all()
+            warm_wall = time.perf_counter() - started
+            engine.close()
+            cache.close()
+
+            results.append(result('download_engine', {
+                'urls': len(urls),
+                'downloads': downloads,
+                'media_seconds': args.seconds,
+            }, {
+                'wall_s': round(wall, 4),
+                'urls_per_s': round(len(urls) / wall, 3),
+                'per_url_ms': round(wall / len(urls) * 1000, 3),
+                'warm_wall_s': round(warm_wall, 4),
+                'distinct_paths': len(set(paths)),
+                'warm_paths_match': warm_paths == paths,
+                'peak_python_memory_bytes': peak,
+            }))
+            print(f"download_engine downloads={downloads}: {wall:.2f}s, warm {warm_wall:.3f}s", file=sys.stderr)
+    finally:
+        server.shutdown()
+        server.server_close()
+    return results
+
+
+def time_command(command, repeat, env):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        timings.append(time.perf_counter() - started)
+    return round(statistics.median(timings) * 1000, 2)
+
+
+def bench_startup(args, env):
+    commands = {
+        'python': [sys.executable, "-c", "pass"],
+        'import_transcription': [sys.executable, "-c", "import transcription"],
+        'cli_help': [sys.executable, "-m", "cli", "--help"],
+    }
+    if importlib.util.find_spec("PyQt6") is not None:
+        commands['import_main_test'] = [sys.executable, "-c", "import main_test"]
+    metrics = {f"{name}_ms": time_command(command, args.repeat, env) for name, command in commands.items()}
+    metrics['import_transcription_over_python_ms'] = round(metrics['import_transcription_ms'] - metrics['python_ms'], 2)
+    print(f"startup: {metrics}", file=sys.stderr)
+    return [result('startup', {'repeat': args.repeat}, metrics)]
+
+
+def bench_gui_startup(args, env):
+    if importlib.util.find_spec("PyQt6") is None:
+        print("gui_startup: skipped, PyQt6 is not installed", file=sys.stderr)
+        return []
+    runs = []
+    for _ in range(args.repeat):
+        run_env = dict(env, BENCH_LAUNCH_TIME=repr(time.time()))
+        completed = subprocess.run([sys.executable, os.path.join(BENCH_DIR, "gui_startup.py")], env=run_env,
+                                   capture_output=True, text=True, check=False)
+        lines = completed.stdout.strip().splitlines()
+        if completed.returncode or not lines:
+            print(f"gui_startup: launch failed\n{completed.stderr}", file=sys.stderr)
+            return []
+        runs.append(json.loads(lines[-1]))
+    metrics = {key: round(statistics.median(run[key] for run in runs), 2) for key in runs[0]}
+    print(f"gui_startup: {metrics}", file=sys.stderr)
+    return [result('gui_startup', {'repeat': args.repeat}, metrics)]
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(base_file, results):
+    with open(base_file, encoding='utf-8') as f:
+        base = json.load(f)
+    baseline = {(r['name'], json.dumps(r['params'], sort_keys=True)): r['metrics'] for r in base['results']}
+    for entry in results:
+        old = baseline.get((entry['name'], json.dumps(entry['params'], sort_keys=True)))
+        if old is None:
+            continue
+        for metric, value in entry['metrics'].items():
+            previous = old.get(metric)
+            if isinstance(value, (int, float)) and isinstance(previous, (int, float)) and previous:
+                change = (value - previous) / abs(previous) * 100
+                print(f"{entry['name']} {entry['params']} {metric}: {previous} -> {value} ({change:+.1f}%)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the transcription pipeline against stub executables.")
+    parser.add_argument("--files", type=int, default=40, help="Synthetic media files in the corpus.")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Length of each synthetic WAV file.")
+    parser.add_argument("--runtime", type=float, default=0.1, help="Stub transcription time per file in seconds.")
+    parser.add_argument("--startup", type=float, default=0.0,
+                        help="Stub start-up time per process in seconds, standing in for the model load.")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Fraction of files the stub fails.")
+    parser.add_argument("--workers", type=parse_int_list, default=[1, 2, 4, 8],
+                        help="Comma-separated max_workers values to measure.")
+    parser.add_argument("--files-per-run", type=parse_int_list, default=[1],
+                        help="Comma-separated files_per_run values to measure.")
+    parser.add_argument("--urls", type=int, default=20, help="URLs for the download benchmark.")
+    parser.add_argument("--download-delay", type=float, default=0.05, help="Stub download time per URL in seconds.")
+    parser.add_argument("--downloads", type=parse_int_list, default=[1, 2, 4],
+                        help="Comma-separated download concurrency values to measure.")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions for the startup timings.")
+    parser.add_argument("--only", choices=["pipeline", "downloads", "engine", "startup", "gui"], action="append",
+                        help="Run only the named benchmark. May be repeated.")
+    parser.add_argument("--output", default="benchmark-results.json", help="Where to write the JSON results.")
+    parser.add_argument("--compare", metavar="BASE_JSON", help="Print changes against an earlier results file.")
+    args = parser.parse_args(argv)
+    selected = set(args.only or ["pipeline", "downloads", "engine", "startup", "gui"])
+    output = os.path.abspath(args.output)
+    base_file = os.path.abspath(args.compare) if args.compare else None
+
+    work_dir = tempfile.mkdtemp(prefix="whisper-bench-")
+    bin_dir = os.path.join(work_dir, "bin")
+    exe_path = make_wrapper(bin_dir, "faster-whisper-xxl", os.path.join(BENCH_DIR, "stub_whisper.py"))
+    make_wrapper(bin_dir, "yt-dlp", os.path.join(BENCH_DIR, "stub_ytdlp.py"))
+
+    env = dict(os.environ)
+    env['PATH'] = bin_dir + os.pathsep + env.get('PATH', '')
+    env['PYTHONPATH'] = REPO_DIR + os.pathsep + env.get('PYTHONPATH', '')
+    env['STUB_WHISPER_RUNTIME'] = str(args.runtime)
+    env['STUB_WHISPER_STARTUP'] = str(args.startup)
+    env['STUB_WHISPER_FAIL_RATE'] = str(args.fail_rate)
+    env['STUB_YTDLP_DELAY'] = str(args.download_delay)
+    os.environ.update(env)
+    sys.path.insert(0, REPO_DIR)
+
+    # Everything runs inside the scratch directory so config.ini, logs,
+    # downloads and outputs never touch the working tree.
+    previous_cwd = os.getcwd()
+    os.chdir(work_dir)
+    try:
+        results = []
+        if "startup" in selected:
+            results += bench_startup(args, env)
+        if "gui" in selected:
+            results += bench_gui_startup(args, env)
+        if "pipeline" in selected:
+            corpus = make_corpus(os.path.join(work_dir, "corpus"), args.files, args.seconds)
+            results += bench_pipeline(args, corpus, exe_path, work_dir)
+        if "downloads" in selected:
+            results += bench_downloads(args, work_dir)
+        if "engine" in selected:
+            results += bench_engine(args, work_dir)
+    finally:
+        os.chdir(previous_cwd)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    report = {
+        'created': datetime.now(timezone.utc).isoformat(),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'results': results,
+    }
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}", file=sys.stderr)
+
+    if base_file:
+        compare(base_file, results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+import os
+import sys
+import json
+import time
+import wave
+import zlib
+
+# Stand-in for faster-whisper-xxl used by the benchmarks. It accepts the same
+# command line, prints the same kind of progress output and writes one file per
+# requested output format, but only sleeps instead of running a model.
+#
+#   STUB_WHISPER_RUNTIME    seconds spent per input file (default 0.1)
+#   STUB_WHISPER_RTF        if set, runtime = media duration * RTF instead
+#   STUB_WHISPER_SEGMENTS   segment lines printed per file (default 10)
+#   STUB_WHISPER_FAIL_RATE  fraction of inputs that fail, chosen by name (default 0)
+#   STUB_WHISPER_STARTUP    extra seconds spent once per process, e.g. model load (default 0)
+
+
+def env_float(name, default):
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def parse_args(argv):
+    inputs = []
+    options = {}
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg.startswith('--'):
+            values = []
+            while i + 1 < len(argv) and not argv[i + 1].startswith('--'):
+                i += 1
+                values.append(argv[i])
+            options.setdefault(arg[2:], []).extend(values)
+        elif not options:
+            inputs.append(arg)
+        i += 1
+    return inputs, options
+
+
+def media_duration(path):
+    try:
+        with wave.open(path, 'rb') as wav:
+            return wav.getnframes() / float(wav.getframerate())
+    except (wave.Error, EOFError, OSError):
+        return 60.0
+
+
+def format_timestamp(seconds):
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(int(minutes), 60)
+    if hours:
+        return f"{hours:02d}:{minutes:02d}:{seconds:06.3f}"
+    return f"{minutes:02d}:{seconds:06.3f}"
+
+
+def should_fail(path, fail_rate):
+    return fail_rate > 0 and (zlib.crc32(os.path.basename(path).encode('utf-8')) % 10000) < fail_rate * 10000
+
+
+def subtitle_timestamp(seconds, separator):
+    milliseconds = round(seconds * 1000)
+    return (f"{milliseconds // 3600000:02d}:{milliseconds // 60000 % 60:02d}:"
+            f"{milliseconds // 1000 % 60:02d}{separator}{milliseconds % 1000:03d}")
+
+
+OUTPUT_WRITERS = {
+    'txt': lambda segments: "".join(f"{text}\n" for _, _, text in segments),
+    'srt': lambda segments: "".join(
+        f"{i + 1}\n{subtitle_timestamp(start, ',')} --> {subtitle_timestamp(end, ',')}\n{text}\n\n"
+        for i, (start, end, text) in enumerate(segments)),
+    'vtt': lambda segments: "WEBVTT\n\n" + "".join(
+        f"{subtitle_timestamp(start, '.')} --> {subtitle_timestamp(end, '.')}\n{text}\n\n"
+        for start, end, text in segments),
+    'tsv': lambda segments: "start\tend\ttext\n" + "".join(
+        f"{round(start * 1000)}\t{round(end * 1000)}\t{text}\n" for start, end, text in segments),
+    'json': lambda segments: json.dumps({"segments": [
+        {"start": round(start, 3), "end": round(end, 3), "text": " " + text} for start, end, text in segments
+    ]}) + "\n",
+}
+
+
+def json_with_words(segments):
+    # What --word_timestamps True adds: the segment's words spread evenly
+    # over its time range.
+    result = []
+    for start, end, text in segments:
+        words = text.split()
+        step = (end - start) / len(words)
+        result.append({"start": round(start, 3), "end": round(end, 3), "text": " " + text, "words": [
+            {"start": round(start + i * step, 3), "end": round(start + (i + 1) * step, 3), "word": " " + word,
+             "probability": 1.0} for i, word in enumerate(words)
+        ]})
+    return json.dumps({"segments": result}) + "\n"
+
+
+def write_outputs(path, output_dir, formats, segments, words=False):
+    if output_dir == "source":
+        output_dir = os.path.dirname(path) or "."
+    os.makedirs(output_dir, exist_ok=True)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    if "all" in formats:
+        formats = list(OUTPUT_WRITERS)
+    for fmt in formats:
+        with open(os.path.join(output_dir, f"{stem}.{fmt}"), 'w', encoding='utf-8') as f:
+            if fmt == "json" and words:
+                f.write(json_with_words(segments))
+            else:
+                f.write(OUTPUT_WRITERS.get(fmt, OUTPUT_WRITERS['txt'])(segments))
+
+
+def main(argv):
+    inputs, options = parse_args(argv)
+    if not inputs:
+        print("error: no input files", file=sys.stderr)
+        return 2
+
+    runtime = env_float('STUB_WHISPER_RUNTIME', 0.1)
+    rtf = os.environ.get('STUB_WHISPER_RTF')
+    segments = max(1, int(env_float('STUB_WHISPER_SEGMENTS', 10)))
+    fail_rate = env_float('STUB_WHISPER_FAIL_RATE', 0.0)
+    time.sleep(env_float('STUB_WHISPER_STARTUP', 0.0))
+
+    output_dir = (options.get('output_dir') or ["."])[0]
+    formats = options.get('output_format') or ["txt"]
+    words = (options.get('word_timestamps') or ["False"])[0] == "True"
+
+    failed = 0
+    for path in inputs:
+        if not os.path.isfile(path):
+            print(f"File not found: {path}", flush=True)
+            failed += 1
+            continue
+        duration = media_duration(path)
+        print(f"Starting transcription on: {path}", flush=True)
+        print(f"Processing audio with duration {format_timestamp(duration)}", flush=True)
+        file_runtime = duration * float(rtf) if rtf else runtime
+        step = duration / segments
+        written = []
+        for index in range(segments):
+            time.sleep(file_runtime / segments)
+            written.append((index * step, (index + 1) * step, f"stub segment {index + 1}"))
+            print(f"[{format_timestamp(index * step)} --> {format_timestamp((index + 1) * step)}] stub segment {index + 1}",
+                  flush=True)
+        if should_fail(path, fail_rate):
+            print(f"Simulated failure for {path}", flush=True)
+            failed += 1
+            continue
+        write_outputs(path, output_dir, formats, written, words)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,79 @@
+import os
+import sys
+import time
+import shutil
+import hashlib
+
+# Stand-in for yt-dlp used by the benchmarks. It honours --output with the
+# %(extractor)s, %(extractor_key)s, %(id)s and %(ext)s fields, copies
+# STUB_YTDLP_SOURCE (or writes a small file) to the resulting path after
+# STUB_YTDLP_DELAY seconds, and reports the destination the way yt-dlp does:
+# progress lines by default, or only the --print after_move template.
+# Files that already exist are not downloaded again.
+
+EXTRACTOR_KEY = "Stub"
+
+
+def fill(template, fields):
+    for key, value in fields.items():
+        template = template.replace(f"%({key})s", value)
+    return template
+
+
+def main(argv):
+    template = "%(id)s.%(ext)s"
+    report = None
+    urls = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ("-o", "--output"):
+            i += 1
+            template = argv[i]
+        elif arg == "--print":
+            i += 1
+            when, sep, value = argv[i].partition(':')
+            report = value if sep and when == "after_move" else argv[i]
+        elif arg in ("-f", "--format", "-P", "--paths", "--download-archive"):
+            i += 1
+        elif not arg.startswith('-'):
+            urls.append(arg)
+        i += 1
+
+    delay = float(os.environ.get('STUB_YTDLP_DELAY', '0.05'))
+    source = os.environ.get('STUB_YTDLP_SOURCE')
+    for url in urls:
+        fields = {
+            'id': hashlib.sha1(url.encode('utf-8')).hexdigest()[:11],
+            'ext': "wav",
+            'extractor': EXTRACTOR_KEY.lower(),
+            'extractor_key': EXTRACTOR_KEY,
+        }
+        path = fill(template, fields)
+        fields['filepath'] = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if report is None:
+            print(f"[stub] Extracting URL: {url}", flush=True)
+
+        if os.path.exists(path):
+            if report is None:
+                print(f"[download] {path} has already been downloaded", flush=True)
+        else:
+            time.sleep(delay)
+            if source:
+                shutil.copyfile(source, path + ".part")
+            else:
+                with open(path + ".part", 'wb') as f:
+                    f.write(b"\0" * 1024)
+            os.replace(path + ".part", path)
+            if report is None:
+                print(f"[download] Destination: {path}", flush=True)
+                print("[download] 100% of 1.00KiB", flush=True)
+
+        if report is not None:
+            print(fill(report, fields), flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,231 @@
+import os
+import re
+import json
+import shutil
+import threading
+import subprocess
+from dataclasses import dataclass
+
+from subtitles import format_time, read_cues
+
+SILENCE_NOISE = "-30dB"
+SILENCE_MIN_SECONDS = 0.4
+SILENCE_PATTERN = re.compile(r'silence_(start|end):\s*(-?\d+(?:\.\d+)?)')
+MERGED_FORMATS = ("srt", "vtt", "tsv", "json", "txt")
+
+
+@dataclass(frozen=True, slots=True)
+class Chunk:
+    path: str
+    start: float
+    end: float
+    keep_start: float
+    keep_end: float
+
+    def keeps(self, start, end):
+        # Chunks overlap, so a segment near a cut comes out of both
+        # neighbours; each copy is kept only by the chunk whose own range
+        # holds the segment's midpoint.
+        middle = self.start + (start + end) / 2
+        return self.keep_start <= middle < self.keep_end
+
+
+def ffmpeg_path():
+    return shutil.which("ffmpeg")
+
+
+def find_silences(ffmpeg, path, start, length):
+    command = [ffmpeg, "-hide_banner", "-nostats", "-ss", f"{start:.3f}", "-t", f"{length:.3f}", "-i", path,
+               "-vn", "-af", f"silencedetect=noise={SILENCE_NOISE}:d={SILENCE_MIN_SECONDS}", "-f", "null", "-"]
+    result = subprocess.run(command, capture_output=True, text=True, encoding='utf-8', errors='replace')
+    silences = []
+    silence_start = None
+    for kind, value in SILENCE_PATTERN.findall(result.stderr):
+        if kind == "start":
+            silence_start = float(value)
+        elif silence_start is not None:
+            silences.append((start + max(0.0, silence_start), start + float(value)))
+            silence_start = None
+    return silences
+
+
+def find_cut(ffmpeg, path, target, window):
+    # Only a window around each planned cut is decoded, not the whole file.
+    silences = find_silences(ffmpeg, path, max(0.0, target - window), 2 * window)
+    if not silences:
+        return target
+    return min(((a + b) / 2 for a, b in silences), key=lambda middle: abs(middle - target))
+
+
+def plan_cuts(duration, chunk_seconds):
+    count = max(1, round(duration / chunk_seconds))
+    return [duration * k / count for k in range(1, count)]
+
+
+def plan_chunks(directory, stem, duration, cuts, overlap):
+    bounds = [0.0, *sorted(cuts), duration]
+    chunks = []
+    for index, (cut_start, cut_end) in enumerate(zip(bounds, bounds[1:])):
+        chunks.append(Chunk(
+            path=os.path.join(directory, f"{stem}.part{index:03d}.wav"),
+            start=max(0.0, cut_start - overlap),
+            end=min(duration, cut_end + overlap),
+            keep_start=cut_start if index else float("-inf"),
+            keep_end=cut_end if index < len(bounds) - 2 else float("inf"),
+        ))
+    return chunks
+
+
+def extract_chunk(ffmpeg, path, chunk, keep_format=False):
+    command = [ffmpeg, "-hide_banner", "-nostats", "-loglevel", "error", "-y",
+               "-ss", f"{chunk.start:.3f}", "-t", f"{chunk.end - chunk.start:.3f}", "-i", path, "-vn"]
+    if not keep_format:
+        command.extend(["-ac", "1", "-ar", "16000"])
+    command.extend(["-c:a", "pcm_s16le", chunk.path])
+    subprocess.run(command, check=True, capture_output=True)
+
+
+class SplitJob:
+    def __init__(self, position, filename, work_dir, chunks, command_args):
+        self.position = position
+        self.filename = filename
+        self.work_dir = work_dir
+        self.chunks = chunks
+        self.command_args = command_args
+        self.outputs = [None] * len(chunks)
+        self.fractions = [0.0] * len(chunks)
+        self.errors = []
+        self.remaining = len(chunks)
+        self.lock = threading.Lock()
+        self.content_hash = None
+
+    @property
+    def output_dir(self):
+        return os.path.join(self.work_dir, "out")
+
+    def command_for(self, index):
+        return [self.command_args[0], self.chunks[index].path, *self.command_args[2:]]
+
+    def progress(self, index, fraction):
+        self.fractions[index] = fraction
+        return sum(self.fractions) / len(self.fractions)
+
+    def chunk_finished(self, index, outputs=None, error=None):
+        with self.lock:
+            self.outputs[index] = outputs or []
+            self.fractions[index] = 1.0
+            if error is not None:
+                self.errors.append(error)
+            self.remaining -= 1
+            return self.remaining == 0
+
+
+def merge_srt(parts):
+    blocks = []
+    for chunk, path in parts:
+        for start, end, settings, text in read_cues(path):
+            if chunk.keeps(start, end):
+                times = f"{format_time(chunk.start + start, ',')} --> {format_time(chunk.start + end, ',')}"
+                blocks.append("\n".join([str(len(blocks) + 1), times + settings, *text]))
+    return "\n\n".join(blocks) + "\n\n" if blocks else ""
+
+
+def merge_vtt(parts):
+    cues = []
+    for chunk, path in parts:
+        for start, end, settings, text in read_cues(path):
+            if chunk.keeps(start, end):
+                times = (f"{format_time(chunk.start + start, '.', False)} --> "
+                         f"{format_time(chunk.start + end, '.', False)}")
+                cues.append("\n".join([times + settings, *text]))
+    return "WEBVTT\n\n" + "".join(cue + "\n\n" for cue in cues)
+
+
+def merge_tsv(parts):
+    header = "start\tend\ttext"
+    rows = []
+    for chunk, path in parts:
+        with open(path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        if lines and not lines[0].split('\t')[0].isdigit():
+            header = lines.pop(0)
+        for line in lines:
+            fields = line.split('\t')
+            if len(fields) < 3 or not fields[0].isdigit() or not fields[1].isdigit():
+                continue
+            start, end = int(fields[0]) / 1000, int(fields[1]) / 1000
+            if chunk.keeps(start, end):
+                offset = round(chunk.start * 1000)
+                rows.append("\t".join([str(int(fields[0]) + offset), str(int(fields[1]) + offset), *fields[2:]]))
+    return "\n".join([header, *rows]) + "\n"
+
+
+def merged_segments(parts):
+    merged = {}
+    segments = []
+    for chunk, path in parts:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        for key, value in data.items():
+            merged.setdefault(key, value)
+        for segment in data.get('segments') or []:
+            if not chunk.keeps(segment.get('start', 0.0), segment.get('end', 0.0)):
+                continue
+            segment = dict(segment, id=len(segments))
+            segment['start'] = round(chunk.start + segment.get('start', 0.0), 3)
+            segment['end'] = round(chunk.start + segment.get('end', 0.0), 3)
+            if segment.get('words'):
+                segment['words'] = [dict(word, start=round(chunk.start + word.get('start', 0.0), 3),
+                                         end=round(chunk.start + word.get('end', 0.0), 3))
+                                    for word in segment['words']]
+            segments.append(segment)
+    merged['segments'] = segments
+    merged['text'] = "".join(segment.get('text', '') for segment in segments)
+    return merged
+
+
+def merge_json(parts):
+    return json.dumps(merged_segments(parts), ensure_ascii=False)
+
+
+def merge_txt(parts):
+    return "".join(segment.get('text', '').strip() + "\n" for segment in merged_segments(parts)['segments'])
+
+
+MERGERS = {
+    "srt": merge_srt,
+    "vtt": merge_vtt,
+    "tsv": merge_tsv,
+    "json": merge_json,
+    "txt": merge_txt,
+}
+
+
+def stitch_outputs(split, output_dir, formats):
+    # Chunk outputs are grouped by what follows the chunk's stem (".srt",
+    # "_en.vtt", ...) and each group is merged into one file named after the
+    # original input. Plain text is rebuilt from the JSON segments, which
+    # carry the timestamps needed to drop the overlap.
+    stem = os.path.splitext(os.path.basename(split.filename))[0]
+    groups = {}
+    for chunk, outputs in zip(split.chunks, split.outputs):
+        chunk_stem = os.path.splitext(os.path.basename(chunk.path))[0]
+        for output in outputs:
+            groups.setdefault(os.path.basename(output)[len(chunk_stem):], []).append((chunk, output))
+
+    written = []
+    os.makedirs(output_dir, exist_ok=True)
+    for suffix in groups:
+        fmt = suffix.rsplit('.', 1)[-1]
+        if fmt not in formats or fmt not in MERGERS:
+            continue
+        parts = groups[suffix]
+        if fmt == "txt":
+            parts = groups.get(suffix[:-len(fmt)] + "json")
+            if parts is None:
+                continue
+        destination = os.path.join(output_dir, stem + suffix)
+        with open(destination, 'w', encoding='utf-8') as f:
+            f.write(MERGERS[fmt](parts))
+        written.append(destination)
+    return written
@@ -0,0 +1,298 @@
+import sys
+import sqlite3
+import argparse
+import configparser
+
+import job_journal
+from job_journal import JobJournal
+from job_service import JobServer, JobService
+from transcription import (
+    CONFIG_FILE,
+    DEFAULT_SETTINGS,
+    SCHEDULE_POLICIES,
+    TranscriptionPipeline,
+    TranscriptionSettings,
+    expand_folders,
+    open_folder_watch,
+    search_transcripts,
+    setting_bool,
+    setting_int,
+    setup_logging,
+)
+
+
+def read_settings(config_file):
+    settings = dict(DEFAULT_SETTINGS)
+    parser = configparser.ConfigParser()
+    parser.read(config_file)
+    if parser.has_section('Settings'):
+        settings.update(parser['Settings'])
+    return settings
+
+
+def read_job_file(job_file):
+    parser = configparser.ConfigParser()
+    if not parser.read(job_file):
+        raise FileNotFoundError(f"Job file not found: {job_file}")
+    settings = dict(parser['Settings']) if parser.has_section('Settings') else {}
+    files = [line.strip() for line in parser.get('Job', 'files', fallback='').splitlines() if line.strip()]
+    return settings, files
+
+
+def parse_overrides(pairs):
+    overrides = {}
+    for pair in pairs:
+        key, sep, value = pair.partition('=')
+        if not sep or not key.strip():
+            raise ValueError(f"Expected KEY=VALUE, got: {pair}")
+        overrides[key.strip()] = value
+    return overrides
+
+
+def watch_folders(args, settings, journal, report_progress, report_error, report_file):
+    # Every group of files that settled together runs as its own batch, so
+    # each one is journaled and files that arrive meanwhile wait for the next.
+    try:
+        watcher = open_folder_watch(settings.values, args.watch)
+    except OSError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    if not args.quiet:
+        print(f"Watching {', '.join(watcher.roots)} ({watcher.mode()}); press Ctrl+C to stop.", file=sys.stderr)
+        if watcher.fallback:
+            print(f"Polling the folders: {watcher.fallback}.", file=sys.stderr)
+    def file_finished(filename, status):
+        watcher.finished(filename, status)
+        report_file(filename, status)
+
+    failed = 0
+    try:
+        while not watcher.stopped.is_set():
+            files = watcher.next_batch(timeout=1.0)
+            if not files:
+                continue
+            pipeline = TranscriptionPipeline(
+                files,
+                settings,
+                on_progress=report_progress,
+                on_error=report_error,
+                on_file_finished=file_finished,
+                journal=journal,
+                origin=job_journal.WATCH,
+            )
+            pipeline.run()
+            failed += pipeline.failed_jobs
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.stop()
+        if journal is not None:
+            journal.close()
+    if watcher.error is not None:
+        print(f"error: watching stopped: {watcher.error}", file=sys.stderr)
+        return 2
+    return 1 if failed else 0
+
+
+def serve_jobs(args, settings, journal):
+    # Jobs get the server's settings with their own overrides on top; the
+    # number of jobs run at once is service_jobs, each with max_workers
+    # parallel files.
+    service = JobService(settings.values, journal, max_jobs=setting_int(settings.values, 'service_jobs', default=2))
+    host = args.host or settings.get('service_host') or "127.0.0.1"
+    port = args.port if args.port is not None else int(settings.get('service_port') or 8765)
+    try:
+        server = JobServer((host, port), service, quiet=args.quiet)
+    except OSError as e:
+        print(f"error: cannot listen on {host}:{port}: {e}", file=sys.stderr)
+        service.close()
+        journal.close()
+        return 2
+    print(f"Serving transcription jobs on http://{host}:{server.server_port}/jobs", file=sys.stderr, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        journal.close()
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m cli",
+        description="Run a transcription batch without the GUI.",
+    )
+    parser.add_argument("files", nargs="*",
+                        help="Audio/video files, folders of them or http(s) URLs to transcribe.")
+    parser.add_argument("--config", default=CONFIG_FILE,
+                        help=f"Settings file to read (default: {CONFIG_FILE}).")
+    parser.add_argument("--job", help="Job file with optional [Settings] overrides and a [Job] files list.")
+    parser.add_argument("--set", dest="overrides", action="append", default=[], metavar="KEY=VALUE",
+                        help="Override a single setting, e.g. --set model=large-v3. May be repeated.")
+    parser.add_argument("--output-dir", help="Folder where results are saved.")
+    parser.add_argument("--workers", help="Number of files transcribed at the same time.")
+    parser.add_argument("--downloads", help="Number of URLs downloaded at the same time.")
+    parser.add_argument("--files-per-run", help="Number of files passed to one run of the executable.")
+    parser.add_argument("--schedule", choices=SCHEDULE_POLICIES,
+                        help="Order of the files: as given, longest first or shortest first.")
+    parser.add_argument("--extract-audio", action="store_true",
+                        help="Extract the selected audio track of video files once and transcribe that (needs ffmpeg).")
+    parser.add_argument("--split", action="store_true",
+                        help="Split long recordings at silences and transcribe the pieces in parallel (needs ffmpeg).")
+    parser.add_argument("--strip-silence", action="store_true",
+                        help="Cut long silences out of the audio before transcribing (needs ffmpeg and numpy).")
+    parser.add_argument("--dedupe", action="store_true",
+                        help="Reuse cached transcripts of re-encoded copies of a recording (needs ffmpeg and numpy).")
+    parser.add_argument("--search", metavar="QUERY",
+                        help="Search the transcripts in the output folder and print the matching segments.")
+    parser.add_argument("--watch", action="append", default=[], metavar="DIR",
+                        help="Keep watching a folder and transcribe every media file that arrives in it. May be repeated.")
+    parser.add_argument("--serve", action="store_true",
+                        help="Run a local HTTP service that accepts, reports on and cancels transcription jobs.")
+    parser.add_argument("--host", help="Address the service listens on (default: service_host, 127.0.0.1).")
+    parser.add_argument("--port", type=int, help="Port the service listens on (default: service_port, 8765).")
+    parser.add_argument("--no-expand", action="store_true",
+                        help="Treat playlist and channel links as single items instead of expanding their entries.")
+    parser.add_argument("--resume", action="store_true",
+                        help="Resume the last unfinished batch from the journal with its original settings.")
+    parser.add_argument("--retry-failed", action="store_true",
+                        help="With --resume, also transcribe the files of the batch that failed.")
+    parser.add_argument("--no-journal", action="store_true", help="Do not record the batch in the job journal.")
+    parser.add_argument("--dry-run", action="store_true", help="Print the commands instead of running them.")
+    parser.add_argument("--quiet", action="store_true", help="Only print per-file results and errors.")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    settings = read_settings(args.config)
+    files = list(args.files)
+    try:
+        if args.job:
+            job_settings, job_files = read_job_file(args.job)
+            settings.update(job_settings)
+            files = job_files + files
+        settings.update(parse_overrides(args.overrides))
+    except (OSError, ValueError, configparser.Error) as e:
+        parser.error(str(e))
+
+    if args.output_dir is not None:
+        settings['output_dir'] = args.output_dir
+    if args.workers is not None:
+        settings['max_workers'] = args.workers
+    if args.downloads is not None:
+        settings['max_downloads'] = args.downloads
+    if args.files_per_run is not None:
+        settings['files_per_run'] = args.files_per_run
+    if args.schedule is not None:
+        settings['schedule'] = args.schedule
+    if args.extract_audio:
+        settings['extract_audio'] = 'True'
+    if args.split:
+        settings['split_long_files'] = 'True'
+    if args.strip_silence:
+        settings['strip_silence'] = 'True'
+    if args.dedupe:
+        settings['dedupe_audio'] = 'True'
+    setup_logging(setting_bool(settings, 'enable_logging'))
+
+    if args.search is not None:
+        try:
+            hits = search_transcripts(settings, args.search)
+        except sqlite3.Error as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 2
+        for hit in hits:
+            start = "" if hit.start_ms is None else hit.start_ms
+            end = "" if hit.end_ms is None else hit.end_ms
+            print(f"{hit.source or hit.path}\t{start}\t{end}\t{hit.speaker or ''}\t{hit.text}")
+        return 0 if hits else 1
+
+    journal = None
+    batch_id = None
+    if not args.no_journal and not args.dry_run:
+        journal = JobJournal(settings.get('journal_file') or DEFAULT_SETTINGS['journal_file'])
+
+    if args.retry_failed and not args.resume:
+        parser.error("--retry-failed only applies to --resume")
+    if args.resume:
+        if journal is None:
+            parser.error("--resume needs the job journal")
+        batch_id = journal.incomplete_batch()
+        if batch_id is None:
+            print("Nothing to resume.", file=sys.stderr)
+            return 0
+        settings = journal.batch_settings(batch_id)
+    elif args.watch:
+        if args.dry_run:
+            parser.error("--watch cannot be combined with --dry-run")
+    elif args.serve:
+        if journal is None:
+            parser.error("--serve needs the job journal")
+    else:
+        files = expand_folders(files)
+        if not files:
+            parser.error("no files given; pass them as arguments or in a job file")
+
+    try:
+        settings = TranscriptionSettings.from_mapping(settings)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    if args.dry_run:
+        for filename in files:
+            print(" ".join(settings.command_for(filename)))
+        return 0
+
+    def report_progress(progress, message):
+        if not args.quiet:
+            print(f"[{progress:3d}%] {message}", file=sys.stderr, flush=True)
+
+    def report_error(message):
+        print(f"error: {message}", file=sys.stderr, flush=True)
+
+    def report_file(filename, status):
+        print(f"{status}\t{filename}", flush=True)
+
+    def report_expanded(url, entries):
+        if not args.quiet:
+            print(f"Expanded {url} into {len(entries)} entries", file=sys.stderr, flush=True)
+
+    if args.watch:
+        return watch_folders(args, settings, journal, report_progress, report_error, report_file)
+    if args.serve:
+        return serve_jobs(args, settings, journal)
+
+    pipeline = TranscriptionPipeline(
+        files,
+        settings,
+        on_progress=report_progress,
+        on_error=report_error,
+        on_file_finished=report_file,
+        journal=journal,
+        batch_id=batch_id,
+        retry_failed=args.retry_failed,
+        expand_urls=not args.no_expand,
+        on_expanded=report_expanded,
+    )
+    try:
+        if not pipeline.run():
+            return 2
+    finally:
+        if journal is not None:
+            journal.close()
+    if pipeline.cache_stats and not args.quiet:
+        stats = pipeline.cache_stats
+        print(f"Result cache: {stats['hits']} hit(s), {stats['misses']} miss(es), "
+              f"hit rate {stats['hit_rate']:.0%}", file=sys.stderr)
+    return 1 if pipeline.failed_jobs else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+import os
+import time
+import sqlite3
+import threading
+
+DOWNLOAD_DIR = "downloads"
+INDEX_FILE = "index.db"
+
+# Downloads land at a path made of the extractor and the video ID, so the same
+# video always maps to the same file and an interrupted download leaves a
+# .part file that the next attempt continues.
+DOWNLOAD_TEMPLATE = os.path.join("%(extractor_key)s", "%(id)s.%(ext)s")
+
+
+class DownloadCache:
+    def __init__(self, download_dir=DOWNLOAD_DIR):
+        self.download_dir = download_dir
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        os.makedirs(download_dir, exist_ok=True)
+        self.db = sqlite3.connect(os.path.join(download_dir, INDEX_FILE), check_same_thread=False)
+        self.db.executescript(
+            "CREATE TABLE IF NOT EXISTS media ("
+            "  extractor TEXT NOT NULL,"
+            "  video_id TEXT NOT NULL,"
+            "  path TEXT NOT NULL,"
+            "  size INTEGER NOT NULL,"
+            "  downloaded_at REAL NOT NULL,"
+            "  PRIMARY KEY (extractor, video_id));"
+            "CREATE TABLE IF NOT EXISTS urls ("
+            "  url TEXT PRIMARY KEY,"
+            "  extractor TEXT NOT NULL,"
+            "  video_id TEXT NOT NULL);"
+        )
+        self.db.commit()
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+    def lookup_url(self, url):
+        with self.lock:
+            return self.checked_path(self.db.execute(
+                "SELECT m.extractor, m.video_id, m.path FROM urls u"
+                " JOIN media m ON m.extractor = u.extractor AND m.video_id = u.video_id"
+                " WHERE u.url = ?",
+                (url,)
+            ).fetchone())
+
+    def checked_path(self, row):
+        # Files removed from the download folder by hand are forgotten.
+        if row is not None and os.path.isfile(row[2]):
+            self.hits += 1
+            return row[2]
+        if row is not None:
+            self.db.execute("DELETE FROM media WHERE extractor = ? AND video_id = ?", row[:2])
+            self.db.commit()
+        self.misses += 1
+        return None
+
+    def store(self, url, extractor, video_id, path):
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO media (extractor, video_id, path, size, downloaded_at) VALUES (?, ?, ?, ?, ?)",
+                (extractor, video_id, path, os.path.getsize(path), time.time())
+            )
+            if url:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO urls (url, extractor, video_id) VALUES (?, ?, ?)",
+                    (url, extractor, video_id)
+                )
+            self.db.commit()
@@ -0,0 +1,189 @@
+import os
+import sqlite3
+import tempfile
+import threading
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError:
+    np = None
+
+from silence_strip import decode_pcm
+
+FINGERPRINT_FILE = "fingerprints.db"
+SAMPLE_RATE = 8000
+FRAME_LENGTH = 4096
+HOP_LENGTH = 1024
+BLOCK_FRAMES = 512
+BAND_COUNT = 33
+BAND_LOW = 300.0
+BAND_HIGH = 2000.0
+PEAK_FRAMES = 4
+PEAK_BANDS = 3
+FAN_OUT = 4
+MAX_PAIR_FRAMES = 16
+MAX_PAIR_BANDS = 12
+# Landmarks carry the few seconds they start in, so two recordings only
+# match when the same sounds occur at the same time in both.
+TIME_BUCKET_FRAMES = 32
+SKETCH_SIZE = 64
+MAX_CANDIDATES = 16
+MIX = 0x9E3779B97F4A7C15
+
+
+@dataclass(frozen=True, slots=True)
+class Fingerprint:
+    duration: float
+    sketch: tuple
+
+
+def fingerprint_available():
+    return np is not None
+
+
+def band_levels(samples):
+    # Log energy of 33 logarithmic bands between 300 and 2000 Hz for every
+    # 0.5 s frame (0.128 s apart), computed a block of frames at a time.
+    frames = (len(samples) - FRAME_LENGTH) // HOP_LENGTH + 1
+    if frames < 1:
+        return np.empty((0, BAND_COUNT), dtype=np.float32)
+    window = np.hanning(FRAME_LENGTH).astype(np.float32)
+    bins = np.fft.rfftfreq(FRAME_LENGTH, 1 / SAMPLE_RATE)
+    edges = np.searchsorted(bins, np.geomspace(BAND_LOW, BAND_HIGH, BAND_COUNT + 1))
+    levels = np.empty((frames, BAND_COUNT), dtype=np.float32)
+    for start in range(0, frames, BLOCK_FRAMES):
+        stop = min(frames, start + BLOCK_FRAMES)
+        block = samples[start * HOP_LENGTH:(stop - 1) * HOP_LENGTH + FRAME_LENGTH].astype(np.float32)
+        power = np.abs(np.fft.rfft(sliding_window_view(block, FRAME_LENGTH)[::HOP_LENGTH] * window, axis=1)) ** 2
+        levels[start:stop] = np.add.reduceat(power[:, :edges[-1]], edges[:-1], axis=1)
+    return 10 * np.log10(levels + 1e-9)
+
+
+def local_max(levels):
+    padded = np.pad(levels, ((PEAK_FRAMES, PEAK_FRAMES), (0, 0)), constant_values=-np.inf)
+    across_time = sliding_window_view(padded, 2 * PEAK_FRAMES + 1, axis=0).max(axis=-1)
+    padded = np.pad(across_time, ((0, 0), (PEAK_BANDS, PEAK_BANDS)), constant_values=-np.inf)
+    return sliding_window_view(padded, 2 * PEAK_BANDS + 1, axis=1).max(axis=-1)
+
+
+def landmarks(levels):
+    # Spectral peaks survive re-encoding far better than fine detail does;
+    # each peak is paired with the next few peaks after it, and a pair of
+    # bands, their distance in time and the time bucket of the first peak
+    # make one landmark.
+    if not len(levels):
+        return np.empty(0, dtype=np.int64)
+    times, bands = np.nonzero((levels == local_max(levels)) & (levels > np.median(levels)))
+    tokens = []
+    for step in range(1, FAN_OUT + 1):
+        gaps = times[step:] - times[:-step]
+        shifts = bands[step:] - bands[:-step]
+        valid = (gaps > 0) & (gaps <= MAX_PAIR_FRAMES) & (np.abs(shifts) <= MAX_PAIR_BANDS)
+        tokens.append((times[:-step][valid] // TIME_BUCKET_FRAMES) << 16 | bands[:-step][valid] << 10
+                      | bands[step:][valid] << 4 | (gaps[valid] - 1))
+    return np.unique(np.concatenate(tokens).astype(np.int64))
+
+
+def sketch(tokens):
+    # Bottom-k MinHash: the k smallest hashed landmarks of a recording. The
+    # share of common values among the k smallest of two sketches combined
+    # estimates how many landmarks the recordings share.
+    hashed = (tokens.astype(np.uint64) * np.uint64(MIX)) >> np.uint64(1)
+    return tuple(np.unique(hashed)[:SKETCH_SIZE].astype(np.int64).tolist())
+
+
+def similarity(first, second):
+    first, second = set(first), set(second)
+    smallest = sorted(first | second)[:SKETCH_SIZE]
+    if not smallest:
+        return 0.0
+    return sum(1 for value in smallest if value in first and value in second) / len(smallest)
+
+
+def fingerprint_file(ffmpeg, path):
+    handle, raw = tempfile.mkstemp(suffix=".pcm")
+    os.close(handle)
+    samples = None
+    try:
+        decode_pcm(ffmpeg, path, raw, SAMPLE_RATE, 1)
+        if os.path.getsize(raw) < 2:
+            return Fingerprint(0.0, ())
+        samples = np.memmap(raw, dtype='<i2', mode='r')
+        duration = len(samples) / SAMPLE_RATE
+        return Fingerprint(duration, sketch(landmarks(band_levels(samples))))
+    finally:
+        samples = None
+        os.remove(raw)
+
+
+class FingerprintIndex:
+    def __init__(self, ffmpeg, db_file, min_similarity=0.5):
+        self.ffmpeg = ffmpeg
+        self.min_similarity = min_similarity
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(db_file, check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints ("
+            "id INTEGER PRIMARY KEY, content_hash TEXT UNIQUE NOT NULL, duration REAL NOT NULL, sketch TEXT NOT NULL)"
+        )
+        # Candidates are found through the sketch values they share, so a
+        # lookup reads a few short posting lists however large the index is.
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS sketch_values ("
+            "value INTEGER NOT NULL, entry INTEGER NOT NULL, PRIMARY KEY (value, entry)) WITHOUT ROWID"
+        )
+        self.db.commit()
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+    def fingerprint(self, path):
+        return fingerprint_file(self.ffmpeg, path)
+
+    def contains(self, content_hash):
+        with self.lock:
+            return self.db.execute("SELECT 1 FROM fingerprints WHERE content_hash = ?",
+                                   (content_hash,)).fetchone() is not None
+
+    def add(self, content_hash, fingerprint):
+        if not fingerprint.sketch:
+            return
+        with self.lock:
+            row = self.db.execute("SELECT id, sketch FROM fingerprints WHERE content_hash = ?",
+                                  (content_hash,)).fetchone()
+            if row is not None:
+                self.db.executemany("DELETE FROM sketch_values WHERE value = ? AND entry = ?",
+                                    ((int(value), row[0]) for value in row[1].split()))
+            cursor = self.db.execute(
+                "INSERT OR REPLACE INTO fingerprints (content_hash, duration, sketch) VALUES (?, ?, ?)",
+                (content_hash, fingerprint.duration, " ".join(map(str, fingerprint.sketch)))
+            )
+            self.db.executemany("INSERT OR IGNORE INTO sketch_values (value, entry) VALUES (?, ?)",
+                                ((value, cursor.lastrowid) for value in fingerprint.sketch))
+            self.db.commit()
+
+    def find(self, fingerprint):
+        # Returns (content_hash, similarity) of every indexed recording of
+        # about the same length that is similar enough, best match first.
+        if not fingerprint.sketch:
+            return []
+        placeholders = ",".join("?" * len(fingerprint.sketch))
+        tolerance = max(1.0, fingerprint.duration * 0.01)
+        with self.lock:
+            rows = self.db.execute(
+                f"SELECT f.content_hash, f.duration, f.sketch FROM fingerprints f JOIN ("
+                f"SELECT entry, COUNT(*) AS shared FROM sketch_values WHERE value IN ({placeholders}) "
+                f"GROUP BY entry ORDER BY shared DESC LIMIT {MAX_CANDIDATES}) c ON c.entry = f.id",
+                fingerprint.sketch
+            ).fetchall()
+        matches = []
+        for content_hash, duration, stored in rows:
+            if abs(duration - fingerprint.duration) > tolerance:
+                continue
+            score = similarity(fingerprint.sketch, map(int, stored.split()))
+            if score >= self.min_similarity:
+                matches.append((content_hash, score))
+        return sorted(matches, key=lambda match: -match[1])
@@ -0,0 +1,427 @@
+import os
+import sys
+import errno
+import time
+import queue
+import ctypes
+import ctypes.util
+import select
+import sqlite3
+import struct
+import threading
+
+WATCH_STATE_FILE = "watch_state.db"
+SETTLE_SECONDS = 5.0
+POLL_INTERVAL = 2.0
+BATCH_FILES = 200
+# inotify only reports changes made through the local kernel; files written
+# by other machines to a share mounted with one of these never show up.
+NETWORK_FILESYSTEMS = ("nfs", "nfs4", "cifs", "smb3", "smbfs", "9p", "fuse.sshfs", "afs", "ceph", "glusterfs")
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_CREATE | IN_CLOSE_WRITE | IN_MOVED_TO | IN_DELETE_SELF | IN_ONLYDIR
+EVENT_HEADER = struct.Struct("iIII")
+
+RESCAN = None
+# Files that end like this are not remembered, so they are tried again
+# after a restart.
+UNFINISHED_STATUSES = ("failed", "cancelled")
+
+
+def load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1, libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+def inotify_available():
+    return load_libc() is not None
+
+
+def mount_type(path):
+    # The longest mount point in /proc/mounts that contains the path.
+    path = os.path.realpath(path)
+    best, fstype = "", None
+    try:
+        with open("/proc/mounts", encoding="utf-8") as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount_point = fields[1].replace("\\040", " ")
+                if (path == mount_point or path.startswith(mount_point.rstrip("/") + "/")) \
+                        and len(mount_point) > len(best):
+                    best, fstype = mount_point, fields[2]
+    except OSError:
+        return None
+    return fstype
+
+
+def walk_directories(root, recursive):
+    # Yields (directory, [file paths]) for root and, when recursive, every
+    # directory below it.
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        files = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                pending.append(entry.path)
+                        elif entry.is_file():
+                            files.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        yield directory, files
+
+
+class InotifyBackend:
+    def __init__(self, roots, recursive):
+        self.libc = load_libc()
+        if self.libc is None:
+            raise OSError("inotify is not available")
+        self.recursive = recursive
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.paths = {}
+        self.roots = roots
+
+    def close(self):
+        os.close(self.fd)
+
+    def watch(self, directory):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, f"Could not watch {directory}: {os.strerror(error)}")
+        # A directory that was moved keeps its watch; it is only renamed here.
+        self.paths[wd] = directory
+
+    def scan(self, root):
+        # New directories are watched before they are listed, so a file
+        # created in between is reported twice rather than not at all.
+        files = []
+        for directory, names in walk_directories(root, self.recursive):
+            try:
+                self.watch(directory)
+            except OSError as e:
+                if e.errno == errno.ENOSPC:
+                    raise
+                continue
+            files.extend(names)
+        return files
+
+    def start(self):
+        files = []
+        for root in self.roots:
+            files.extend(self.scan(root))
+        return files
+
+    def changes(self, timeout):
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            data = os.read(self.fd, 256 * 1024)
+        except BlockingIOError:
+            return []
+        changed = []
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            name = data[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length].rstrip(b"\0")
+            offset += EVENT_HEADER.size + length
+            if mask & IN_Q_OVERFLOW:
+                changed.append(RESCAN)
+                continue
+            if mask & IN_IGNORED:
+                self.paths.pop(wd, None)
+                continue
+            directory = self.paths.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, os.fsdecode(name))
+            if mask & IN_ISDIR:
+                if self.recursive and mask & (IN_CREATE | IN_MOVED_TO):
+                    changed.extend(self.scan(path))
+            else:
+                changed.append(path)
+        return changed
+
+
+class PollingBackend:
+    # Every directory is stat'ed on each pass, but only the ones whose mtime
+    # changed (an entry was added, removed or renamed) are listed again.
+    def __init__(self, roots, recursive, interval=POLL_INTERVAL):
+        self.roots = roots
+        self.recursive = recursive
+        self.interval = interval
+        self.directories = {}
+        self.last_pass = time.monotonic()
+
+    def close(self):
+        pass
+
+    def scan(self, root):
+        # The mtime is taken before the listing, so an entry added while
+        # the directory is read shows up on the next pass.
+        files = []
+        pending = [root]
+        while pending:
+            directory = pending.pop()
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+                names, subdirectories = self.list_directory(directory)
+            except OSError:
+                continue
+            self.directories[directory] = (mtime_ns, names)
+            files.extend(names)
+            if self.recursive:
+                pending.extend(subdirectories)
+        return files
+
+    def start(self):
+        files = []
+        for root in self.roots:
+            files.extend(self.scan(root))
+        return files
+
+    def list_directory(self, directory):
+        names, subdirectories = set(), []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(entry.path)
+                    elif entry.is_file():
+                        names.add(entry.path)
+                except OSError:
+                    continue
+        return names, subdirectories
+
+    def changes(self, timeout):
+        time.sleep(timeout)
+        if time.monotonic() - self.last_pass < self.interval:
+            return []
+        self.last_pass = time.monotonic()
+        changed = []
+        for directory, (mtime_ns, names) in list(self.directories.items()):
+            try:
+                current = os.stat(directory).st_mtime_ns
+            except OSError:
+                del self.directories[directory]
+                continue
+            if current == mtime_ns:
+                continue
+            try:
+                listed, subdirectories = self.list_directory(directory)
+            except OSError:
+                continue
+            self.directories[directory] = (current, listed)
+            changed.extend(listed - names)
+            if self.recursive:
+                for subdirectory in subdirectories:
+                    if subdirectory not in self.directories:
+                        changed.extend(self.scan(subdirectory))
+        return changed
+
+
+class WatchState:
+    # Files that were transcribed once are remembered with their size and
+    # mtime, so a restart does not transcribe the whole folder again.
+    def __init__(self, db_file=WATCH_STATE_FILE):
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(db_file, check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS arrivals ("
+            "path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, seen_at REAL NOT NULL)"
+        )
+        self.db.commit()
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+    def is_new(self, path, size, mtime_ns):
+        with self.lock:
+            row = self.db.execute("SELECT size, mtime_ns FROM arrivals WHERE path = ?", (path,)).fetchone()
+        return row is None or tuple(row) != (size, mtime_ns)
+
+    def record(self, arrivals):
+        now = time.time()
+        with self.lock:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO arrivals (path, size, mtime_ns, seen_at) VALUES (?, ?, ?, ?)",
+                ((path, size, mtime_ns, now) for path, size, mtime_ns in arrivals)
+            )
+            self.db.commit()
+
+
+class FolderWatcher:
+    def __init__(self, directories, accept, settle_seconds=SETTLE_SECONDS, recursive=True,
+                 use_polling=False, poll_interval=POLL_INTERVAL, state_file=WATCH_STATE_FILE):
+        self.roots = [os.path.abspath(directory) for directory in directories]
+        self.accept = accept
+        self.settle_seconds = settle_seconds
+        self.recursive = recursive
+        self.use_polling = use_polling
+        self.poll_interval = poll_interval
+        self.state_file = state_file
+        self.pending = {}
+        self.handed = {}
+        self.lock = threading.Lock()
+        self.ready = queue.Queue()
+        self.stopped = threading.Event()
+        self.thread = None
+        self.state = None
+        self.backend = None
+        self.fallback = None
+        self.error = None
+
+    def open_backend(self):
+        if not self.use_polling and inotify_available():
+            network = [root for root in self.roots if mount_type(root) in NETWORK_FILESYSTEMS]
+            if not network:
+                backend = InotifyBackend(self.roots, self.recursive)
+                try:
+                    return backend, backend.start()
+                except OSError as e:
+                    backend.close()
+                    self.fallback = f"inotify could not watch every folder ({e})"
+            else:
+                self.fallback = f"{', '.join(network)} is on a network share, which inotify does not report on"
+        backend = PollingBackend(self.roots, self.recursive, self.poll_interval)
+        return backend, backend.start()
+
+    def start(self):
+        # The folders are listed (and watched) before this returns; files
+        # already in them are handed over like new ones unless they were
+        # handed over before.
+        for root in self.roots:
+            if not os.path.isdir(root):
+                raise FileNotFoundError(f"Watch folder not found: {root}")
+        self.state = WatchState(self.state_file)
+        try:
+            self.backend, files = self.open_backend()
+            self.add_candidates(files)
+        except BaseException:
+            self.state.close()
+            self.state = None
+            raise
+        self.thread = threading.Thread(target=self.run, name="folder-watch", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        with self.lock:
+            if self.state is not None:
+                self.state.close()
+                self.state = None
+
+    def mode(self):
+        return "inotify" if isinstance(self.backend, InotifyBackend) else "polling"
+
+    def run(self):
+        try:
+            tick = max(0.05, min(1.0, self.settle_seconds / 2))
+            while not self.stopped.is_set():
+                changed = self.backend.changes(tick)
+                if RESCAN in changed:
+                    # Events were lost; the tree is listed again and the
+                    # state filters out what was already transcribed.
+                    changed = self.backend.start()
+                self.add_candidates(changed)
+                self.settle()
+        except Exception as e:
+            self.error = e
+        finally:
+            self.backend.close()
+            self.stopped.set()
+
+    def add_candidates(self, paths):
+        # Files that were transcribed before and have not changed since, or
+        # are being transcribed, are dropped right away instead of waiting
+        # out the settle time.
+        for path in paths:
+            if path in self.pending or not self.accept(path):
+                continue
+            with self.lock:
+                if path in self.handed:
+                    continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if self.state.is_new(path, st.st_size, st.st_mtime_ns):
+                self.pending[path] = (st.st_size, st.st_mtime_ns, time.monotonic())
+
+    def settle(self):
+        # A file counts as complete once its size and mtime have not changed
+        # for settle_seconds; copies over the network close and reopen the
+        # file several times, so a close event alone is not enough.
+        now = time.monotonic()
+        arrived = []
+        for path, (size, mtime_ns, since) in list(self.pending.items()):
+            try:
+                st = os.stat(path)
+            except OSError:
+                del self.pending[path]
+                continue
+            if (st.st_size, st.st_mtime_ns) != (size, mtime_ns):
+                self.pending[path] = (st.st_size, st.st_mtime_ns, now)
+                continue
+            if now - since < self.settle_seconds or st.st_size == 0:
+                continue
+            del self.pending[path]
+            if self.state.is_new(path, size, mtime_ns):
+                arrived.append((path, size, mtime_ns))
+        arrived.sort()
+        for path, size, mtime_ns in arrived:
+            with self.lock:
+                self.handed[path] = (size, mtime_ns)
+            self.ready.put(path)
+
+    def finished(self, path, status):
+        # Files are remembered only once the pipeline is through with them;
+        # those handed over but not transcribed when watching or the process
+        # stopped are picked up again on the next start.
+        with self.lock:
+            arrival = self.handed.pop(path, None)
+            if arrival is None or status in UNFINISHED_STATUSES or self.state is None:
+                return
+            self.state.record([(path, *arrival)])
+
+    def next_batch(self, timeout=None, max_files=BATCH_FILES):
+        # Waits for the first settled file, then takes whatever else has
+        # settled meanwhile. Returns [] when nothing arrived in time.
+        try:
+            batch = [self.ready.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        while len(batch) < max_files:
+            try:
+                batch.append(self.ready.get_nowait())
+            except queue.Empty:
+                break
+        return batch
@@ -0,0 +1,169 @@
+import json
+import time
+import sqlite3
+import threading
+
+JOURNAL_FILE = "journal.db"
+
+QUEUED = "queued"
+DOWNLOADING = "downloading"
+TRANSCRIBING = "transcribing"
+DONE = "done"
+FAILED = "failed"
+
+IN_FLIGHT_STATES = (DOWNLOADING, TRANSCRIBING)
+
+CLI = "cli"
+GUI = "gui"
+WATCH = "watch"
+SERVICE = "service"
+
+# Watched folders pick their files up again by themselves and service jobs
+# belong to whoever submitted them, so only these are offered for --resume.
+RESUMABLE_ORIGINS = (CLI, GUI)
+
+
+class JobJournal:
+    def __init__(self, path=JOURNAL_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(
+            "CREATE TABLE IF NOT EXISTS batches ("
+            "  id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            "  settings TEXT NOT NULL,"
+            "  created_at REAL NOT NULL,"
+            "  finished_at REAL,"
+            "  origin TEXT);"
+            "CREATE TABLE IF NOT EXISTS items ("
+            "  batch_id INTEGER NOT NULL REFERENCES batches (id),"
+            "  position INTEGER NOT NULL,"
+            "  source TEXT NOT NULL,"
+            "  filename TEXT,"
+            "  state TEXT NOT NULL,"
+            "  outputs TEXT,"
+            "  error TEXT,"
+            "  queued_at REAL NOT NULL,"
+            "  started_at REAL,"
+            "  finished_at REAL,"
+            "  PRIMARY KEY (batch_id, position));"
+            "CREATE TABLE IF NOT EXISTS file_list ("
+            "  position INTEGER PRIMARY KEY,"
+            "  source TEXT NOT NULL);"
+        )
+        # Journals written before batches had an origin get the column with
+        # NULL, so their batches are never resumed by mistake.
+        columns = [row[1] for row in self.db.execute("PRAGMA table_info(batches)")]
+        if "origin" not in columns:
+            self.db.execute("ALTER TABLE batches ADD COLUMN origin TEXT")
+        self.db.commit()
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+    def start_batch(self, sources, settings, origin=CLI):
+        now = time.time()
+        with self.lock:
+            cursor = self.db.execute(
+                "INSERT INTO batches (settings, created_at, origin) VALUES (?, ?, ?)",
+                (json.dumps(dict(settings)), now, origin)
+            )
+            batch_id = cursor.lastrowid
+            self.db.executemany(
+                "INSERT INTO items (batch_id, position, source, state, queued_at) VALUES (?, ?, ?, ?, ?)",
+                [(batch_id, position, source, QUEUED, now) for position, source in enumerate(sources)]
+            )
+            self.db.commit()
+        return batch_id
+
+    def set_state(self, batch_id, position, state, filename=None, outputs=None, error=None):
+        now = time.time()
+        finished_at = now if state in (DONE, FAILED) else None
+        with self.lock:
+            self.db.execute(
+                "UPDATE items SET state = ?, filename = COALESCE(?, filename),"
+                " outputs = COALESCE(?, outputs), error = ?,"
+                " started_at = CASE WHEN ? IN (?, ?) THEN COALESCE(started_at, ?) ELSE started_at END,"
+                " finished_at = ?"
+                " WHERE batch_id = ? AND position = ?",
+                (state, filename, json.dumps(outputs) if outputs is not None else None, error,
+                 state, DOWNLOADING, TRANSCRIBING, now, finished_at, batch_id, position)
+            )
+            self.db.commit()
+
+    def finish_batch(self, batch_id):
+        with self.lock:
+            self.db.execute("UPDATE batches SET finished_at = ? WHERE id = ?", (time.time(), batch_id))
+            self.db.commit()
+
+    def incomplete_batch(self, origins=RESUMABLE_ORIGINS):
+        # A batch is unfinished until finish_batch marks it, whatever the
+        # state of its items; a batch that ran through with failed files is
+        # finished.
+        with self.lock:
+            row = self.db.execute(
+                "SELECT id FROM batches WHERE finished_at IS NULL"
+                f" AND origin IN ({', '.join('?' * len(origins))})"
+                " ORDER BY id DESC LIMIT 1",
+                tuple(origins)
+            ).fetchone()
+        return row[0] if row else None
+
+    def batch_settings(self, batch_id):
+        with self.lock:
+            row = self.db.execute("SELECT settings FROM batches WHERE id = ?", (batch_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def resume_items(self, batch_id, retry_failed=False):
+        # Anything that was downloading or transcribing when the process died is
+        # started over; completed items are left alone, and failed ones too
+        # unless retry_failed is set.
+        now = time.time()
+        states = (QUEUED, *IN_FLIGHT_STATES, *((FAILED,) if retry_failed else ()))
+        with self.lock:
+            self.db.execute(
+                "UPDATE items SET state = ?, started_at = NULL, finished_at = NULL, error = NULL, queued_at = ?"
+                f" WHERE batch_id = ? AND state IN ({', '.join('?' * len(states))})",
+                (QUEUED, now, batch_id, *states)
+            )
+            self.db.execute("UPDATE batches SET finished_at = NULL WHERE id = ?", (batch_id,))
+            self.db.commit()
+            return self.db.execute(
+                "SELECT position, source FROM items WHERE batch_id = ? AND state = ? ORDER BY position",
+                (batch_id, QUEUED)
+            ).fetchall()
+
+    def items(self, batch_id):
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT position, source, filename, state, outputs, error, queued_at, started_at, finished_at"
+                " FROM items WHERE batch_id = ? ORDER BY position",
+                (batch_id,)
+            ).fetchall()
+        keys = ('position', 'source', 'filename', 'state', 'outputs', 'error',
+                'queued_at', 'started_at', 'finished_at')
+        items = [dict(zip(keys, row)) for row in rows]
+        for item in items:
+            item['outputs'] = json.loads(item['outputs']) if item['outputs'] else []
+        return items
+
+    def save_file_list(self, sources):
+        with self.lock:
+            self.db.execute("DELETE FROM file_list")
+            self.db.executemany("INSERT INTO file_list (position, source) VALUES (?, ?)", enumerate(sources))
+            self.db.commit()
+
+    def append_file_list(self, sources, start):
+        # Rows added at the end of the queue are written without rewriting
+        # the ones before them.
+        with self.lock:
+            self.db.execute("DELETE FROM file_list WHERE position >= ?", (start,))
+            self.db.executemany("INSERT INTO file_list (position, source) VALUES (?, ?)", enumerate(sources, start))
+            self.db.commit()
+
+    def load_file_list(self):
+        with self.lock:
+            return [row[0] for row in self.db.execute("SELECT source FROM file_list ORDER BY position")]
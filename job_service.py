@@ -0,0 +1,456 @@
+import os
+import json
+import time
+import uuid
+import shutil
+import threading
+import collections
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, unquote, urlsplit
+
+import job_journal
+from transcription import DEFAULT_SETTINGS, TranscriptionPipeline, TranscriptionSettings, expand_folders, is_url
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+MAX_BODY_BYTES = 1024 * 1024
+EVENT_BACKLOG = 1000
+KEEP_FINISHED_JOBS = 500
+KEEPALIVE_SECONDS = 15
+# Settings that name the executable or the service's own files and limits
+# are the server's; a job cannot override them.
+SERVER_SETTINGS = frozenset((
+    'exe_path', 'enable_logging', 'max_workers', 'max_downloads', 'journal_file', 'cache_dir',
+    'audio_cache_dir', 'download_dir', 'probe_cache_file', 'search_index_file', 'watch_dirs',
+    'watch_state_file', 'window_geometry', 'service_host', 'service_port', 'service_jobs',
+))
+OUTPUT_TYPES = {
+    ".txt": "text/plain; charset=utf-8",
+    ".srt": "application/x-subrip; charset=utf-8",
+    ".vtt": "text/vtt; charset=utf-8",
+    ".tsv": "text/tab-separated-values; charset=utf-8",
+    ".json": "application/json",
+}
+
+
+class ServiceJob:
+    # One submitted batch. Pipeline callbacks update it from worker threads
+    # and every change is published as a numbered event, which the SSE
+    # streams wait for on the condition.
+    def __init__(self, job_id, sources, settings):
+        self.id = job_id
+        self.sources = list(sources)
+        self.settings = settings
+        self.status = QUEUED
+        self.progress = 0
+        self.message = ""
+        self.errors = []
+        self.files = {source: {"status": QUEUED, "progress": 0} for source in self.sources}
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.future = None
+        self.pipeline = None
+        self.cancel_requested = False
+        self.condition = threading.Condition()
+        self.events = collections.deque(maxlen=EVENT_BACKLOG)
+        self.last_event = 0
+
+    @property
+    def finished(self):
+        return self.status in FINISHED_STATES
+
+    def publish(self, event, data):
+        with self.condition:
+            self.last_event += 1
+            self.events.append((self.last_event, event, data))
+            self.condition.notify_all()
+
+    def events_after(self, event_id):
+        with self.condition:
+            return [event for event in self.events if event[0] > event_id]
+
+    def summary(self):
+        with self.condition:
+            return {
+                "id": self.id,
+                "status": self.status,
+                "progress": self.progress,
+                "message": self.message,
+                "total": len(self.sources),
+                "created_at": self.created_at,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+            }
+
+    def start(self, pipeline):
+        with self.condition:
+            self.pipeline = pipeline
+            self.status = RUNNING
+            self.started_at = time.time()
+            self.publish("status", {"status": RUNNING})
+
+    def finish(self, status):
+        with self.condition:
+            self.status = status
+            self.finished_at = time.time()
+            for state in self.files.values():
+                if state["status"] in (QUEUED, RUNNING) and status == CANCELLED:
+                    state["status"] = CANCELLED
+            self.publish("status", {"status": status, "progress": self.progress, "message": self.message})
+
+    def update_progress(self, progress, message):
+        with self.condition:
+            self.progress = progress
+            self.message = message
+            self.publish("progress", {"progress": progress, "message": message})
+
+    def file_progress(self, source, percent):
+        with self.condition:
+            state = self.files.setdefault(source, {"status": QUEUED, "progress": 0})
+            if state == {"status": RUNNING, "progress": percent}:
+                return
+            state.update(status=RUNNING, progress=percent)
+            self.publish("file", dict(state, source=source))
+
+    def file_finished(self, source, status):
+        with self.condition:
+            state = self.files.setdefault(source, {"status": QUEUED, "progress": 0})
+            state["status"] = status
+            if status not in (FAILED, CANCELLED):
+                state["progress"] = 100
+            self.publish("file", dict(state, source=source))
+
+    def add_error(self, message):
+        with self.condition:
+            self.errors.append(message)
+            self.publish("error", {"message": message})
+
+    def expanded(self, url, entries):
+        with self.condition:
+            if url in self.sources:
+                index = self.sources.index(url)
+                self.sources[index:index + 1] = entries
+            self.files.pop(url, None)
+            for entry in entries:
+                self.files.setdefault(entry, {"status": QUEUED, "progress": 0})
+            self.publish("expanded", {"source": url, "entries": entries})
+
+
+class JobService:
+    # Jobs run on a fixed number of threads, each with its own
+    # TranscriptionPipeline, so every job gets the command line the GUI
+    # would build for the same settings. Jobs beyond the pool wait queued.
+    def __init__(self, settings, journal, max_jobs=2):
+        self.settings = dict(settings)
+        self.journal = journal
+        self.jobs = {}
+        self.lock = threading.Lock()
+        self.pool = ThreadPoolExecutor(max_workers=max_jobs, thread_name_prefix="job")
+
+    def job_settings(self, overrides):
+        if not isinstance(overrides, dict):
+            raise ValueError("'settings' must be an object")
+        values = dict(self.settings)
+        for key, value in overrides.items():
+            if key not in DEFAULT_SETTINGS or key in SERVER_SETTINGS:
+                raise ValueError(f"Setting cannot be set per job: {key}")
+            if not isinstance(value, (str, int, float, bool)):
+                raise ValueError(f"Setting {key} must be a string, number or boolean")
+            values[key] = str(value)
+        return TranscriptionSettings.from_mapping(values)
+
+    def submit(self, files, overrides=None):
+        if not isinstance(files, list) or not files \
+                or not all(isinstance(source, str) and source.strip() for source in files):
+            raise ValueError("'files' must be a non-empty list of files, folders or links")
+        settings = self.job_settings(overrides or {})
+        sources = expand_folders([source.strip() for source in files])
+        missing = [source for source in sources if not is_url(source) and not os.path.isfile(source)]
+        if missing:
+            raise ValueError("No such file: " + ", ".join(missing[:5]))
+        if not sources:
+            raise ValueError("The folders hold no audio or video files")
+        job = ServiceJob(uuid.uuid4().hex, sources, settings)
+        with self.lock:
+            self.prune()
+            self.jobs[job.id] = job
+            job.future = self.pool.submit(self.run_job, job)
+        return job
+
+    def prune(self):
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - KEEP_FINISHED_JOBS)]:
+            del self.jobs[job_id]
+
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def summaries(self):
+        with self.lock:
+            jobs = list(self.jobs.values())
+        return [job.summary() for job in jobs]
+
+    def run_job(self, job):
+        with job.condition:
+            if job.cancel_requested:
+                job.finish(CANCELLED)
+                return
+            try:
+                pipeline = TranscriptionPipeline(
+                    job.sources,
+                    job.settings,
+                    on_progress=job.update_progress,
+                    on_error=job.add_error,
+                    on_file_finished=job.file_finished,
+                    journal=self.journal,
+                    on_file_progress=job.file_progress,
+                    expand_urls=True,
+                    on_expanded=job.expanded,
+                    origin=job_journal.SERVICE,
+                )
+            except Exception as e:
+                job.add_error(f"Could not start the job: {e}")
+                job.finish(FAILED)
+                return
+            job.start(pipeline)
+        try:
+            succeeded = pipeline.run()
+        except Exception as e:
+            job.add_error(f"An unexpected error occurred: {e}")
+            succeeded = False
+        if pipeline.cancelled.is_set():
+            job.finish(CANCELLED)
+        elif not succeeded or pipeline.failed_jobs:
+            job.finish(FAILED)
+        else:
+            job.finish(DONE)
+
+    def cancel(self, job_id):
+        job = self.get(job_id)
+        if job is None:
+            return None
+        with job.condition:
+            if job.finished:
+                return job
+            job.cancel_requested = True
+            pipeline = job.pipeline
+            if pipeline is None and job.future.cancel():
+                job.finish(CANCELLED)
+        if pipeline is not None:
+            pipeline.cancel()
+        return job
+
+    def journal_items(self, job):
+        pipeline = job.pipeline
+        if pipeline is None or pipeline.batch_id is None:
+            return {}
+        return {item['source']: item for item in self.journal.items(pipeline.batch_id)}
+
+    def describe(self, job):
+        items = self.journal_items(job)
+        with job.condition:
+            files = []
+            for source in job.sources:
+                item = items.get(source, {})
+                outputs = item.get('outputs') or []
+                files.append(dict(
+                    job.files.get(source, {"status": QUEUED, "progress": 0}),
+                    source=source,
+                    outputs=[os.path.basename(output) for output in outputs],
+                    error=item.get('error'),
+                ))
+            return dict(job.summary(), files=files, errors=list(job.errors))
+
+    def outputs(self, job):
+        return [(item['source'], output) for item in self.journal_items(job).values() for output in item['outputs']]
+
+    def output_path(self, job, name):
+        # Only files the job wrote can be fetched, looked up by their name.
+        for _, output in self.outputs(job):
+            if os.path.basename(output) == name:
+                return output
+        return None
+
+    def close(self):
+        with self.lock:
+            job_ids = [job_id for job_id, job in self.jobs.items() if not job.finished]
+        for job_id in job_ids:
+            self.cancel(job_id)
+        self.pool.shutdown(wait=True)
+
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    server_version = "WhisperTranscription"
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    @property
+    def service(self):
+        return self.server.service
+
+    def route(self):
+        # Returns the job and what follows its id, or None after sending
+        # the error.
+        parts = [unquote(part) for part in urlsplit(self.path).path.split('/') if part]
+        if len(parts) < 2 or parts[0] != "jobs":
+            self.send_json(404, {"error": "Not found"})
+            return None, None
+        job = self.service.get(parts[1])
+        if job is None:
+            self.send_json(404, {"error": f"No such job: {parts[1]}"})
+            return None, None
+        return job, parts[2:]
+
+    def is_jobs(self):
+        return urlsplit(self.path).path.strip('/') == "jobs"
+
+    def send_json(self, status, data, headers=()):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_json(self):
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0 or length > MAX_BODY_BYTES:
+            self.send_json(413 if length > 0 else 400, {"error": "Missing or oversized request body"})
+            return None
+        try:
+            data = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError as e:
+            self.send_json(400, {"error": f"Invalid JSON: {e}"})
+            return None
+        if not isinstance(data, dict):
+            self.send_json(400, {"error": "Expected a JSON object"})
+            return None
+        return data
+
+    def do_GET(self):
+        if self.is_jobs():
+            self.send_json(200, self.service.summaries())
+            return
+        job, rest = self.route()
+        if job is None:
+            return
+        if not rest:
+            self.send_json(200, self.service.describe(job))
+        elif rest == ["events"]:
+            self.stream_events(job)
+        elif rest == ["outputs"]:
+            self.send_json(200, [{
+                "source": source,
+                "name": os.path.basename(output),
+                "url": f"/jobs/{job.id}/outputs/{quote(os.path.basename(output))}",
+            } for source, output in self.service.outputs(job)])
+        elif len(rest) == 2 and rest[0] == "outputs":
+            self.send_output(job, rest[1])
+        else:
+            self.send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        if not self.is_jobs():
+            self.send_json(404, {"error": "Not found"})
+            return
+        data = self.read_json()
+        if data is None:
+            return
+        try:
+            job = self.service.submit(data.get('files'), data.get('settings'))
+        except ValueError as e:
+            self.send_json(400, {"error": str(e)})
+            return
+        self.send_json(201, self.service.describe(job), headers=[("Location", f"/jobs/{job.id}")])
+
+    def do_DELETE(self):
+        job, rest = self.route()
+        if job is None:
+            return
+        if rest:
+            self.send_json(404, {"error": "Not found"})
+            return
+        self.service.cancel(job.id)
+        self.send_json(202, job.summary())
+
+    def send_output(self, job, name):
+        path = self.service.output_path(job, name)
+        try:
+            f = open(path, 'rb') if path is not None else None
+        except OSError:
+            f = None
+        if f is None:
+            self.send_json(404, {"error": f"No such output: {name}"})
+            return
+        with f:
+            self.send_response(200)
+            self.send_header("Content-Type", OUTPUT_TYPES.get(os.path.splitext(path)[1].lower(),
+                                                              "application/octet-stream"))
+            self.send_header("Content-Length", str(os.fstat(f.fileno()).st_size))
+            self.end_headers()
+            shutil.copyfileobj(f, self.wfile)
+
+    def write_event(self, name, data, event_id=None):
+        lines = [] if event_id is None else [f"id: {event_id}"]
+        lines += [f"event: {name}", "data: " + json.dumps(data, ensure_ascii=False), "", ""]
+        self.wfile.write("\n".join(lines).encode('utf-8'))
+
+    def stream_events(self, job):
+        # A stream starts with the job as it is now and then carries every
+        # change until the job ends. Reconnecting clients send the last id
+        # they saw and get what they missed, as far as the backlog reaches.
+        with job.condition:
+            snapshot = self.service.describe(job)
+            last = job.last_event
+        try:
+            last = int(self.headers.get("Last-Event-ID") or last)
+        except ValueError:
+            pass
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        try:
+            self.write_event("job", snapshot)
+            self.wfile.flush()
+            while True:
+                with job.condition:
+                    events = job.events_after(last)
+                    if not events and not job.finished:
+                        job.condition.wait(KEEPALIVE_SECONDS)
+                        events = job.events_after(last)
+                    finished = job.finished
+                for event_id, name, data in events:
+                    self.write_event(name, data, event_id)
+                    last = event_id
+                if not events:
+                    self.wfile.write(b": keepalive\n\n")
+                self.wfile.flush()
+                if finished:
+                    break
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class JobServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, service, quiet=False):
+        super().__init__(address, JobRequestHandler)
+        self.service = service
+        self.quiet = quiet
@@ -0,0 +1,558 @@
+import os
+import json
+import shutil
+import sqlite3
+import struct
+import threading
+import subprocess
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+
+PROBE_CACHE_FILE = "media_info.db"
+
+# Most headers sit in the first few KB; MP4 files written without faststart
+# keep their index (moov) at the end, and Ogg and MP3 need a look at the tail.
+HEAD_BYTES = 64 * 1024
+TAIL_BYTES = 64 * 1024
+MAX_MOOV_BYTES = 32 * 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class MediaInfo:
+    container: str
+    codec: str = None
+    duration: float = None
+    channels: int = None
+    sample_rate: int = None
+
+
+def sniff_container(head):
+    if head[:4] in (b"RIFF", b"RF64") and head[8:12] == b"WAVE":
+        return "wav"
+    if head[4:8] == b"ftyp":
+        return "mp4"
+    if head[:4] == b"\x1a\x45\xdf\xa3":
+        return "matroska"
+    if head[:4] == b"OggS":
+        return "ogg"
+    if head[:4] == b"fLaC":
+        return "flac"
+    if head[:3] == b"ID3" or (len(head) > 1 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0):
+        return "mp3"
+    return None
+
+
+# WAV / RIFF
+
+WAVE_CODECS = {1: "pcm", 3: "pcm_float", 6: "alaw", 7: "mulaw", 0x55: "mp3"}
+
+
+def probe_wav(f, size):
+    header = f.read(12)
+    data_size = None
+    fmt = None
+    while True:
+        chunk = f.read(8)
+        if len(chunk) < 8:
+            break
+        chunk_id, chunk_size = struct.unpack("<4sI", chunk)
+        if chunk_id == b"ds64":
+            # RF64 keeps the real 64-bit data size here.
+            data_size = struct.unpack("<Q", f.read(24)[8:16])[0]
+            f.seek(chunk_size - 24, os.SEEK_CUR)
+        elif chunk_id == b"fmt ":
+            fmt = f.read(min(chunk_size, 40))
+            f.seek(chunk_size - len(fmt), os.SEEK_CUR)
+        elif chunk_id == b"data":
+            if header[:4] == b"RIFF" or data_size is None:
+                data_size = chunk_size
+            # Streamed recordings leave the size unset or too large.
+            data_size = min(data_size, size - f.tell())
+            break
+        else:
+            f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+    if fmt is None or len(fmt) < 16:
+        return MediaInfo("wav")
+    format_tag, channels, sample_rate, byte_rate = struct.unpack("<HHII", fmt[:12])
+    if format_tag == 0xFFFE and len(fmt) >= 26:
+        format_tag = struct.unpack("<H", fmt[24:26])[0]
+    duration = data_size / byte_rate if data_size is not None and byte_rate else None
+    return MediaInfo("wav", WAVE_CODECS.get(format_tag, f"wav_{format_tag:#x}"), duration, channels, sample_rate)
+
+
+# MP4 / M4A / MOV
+
+MP4_CODECS = {"mp4a": "aac", "alac": "alac", "Opus": "opus", "fLaC": "flac", "ac-3": "ac3", "ec-3": "eac3",
+              "avc1": "h264", "hvc1": "hevc", "hev1": "hevc", "av01": "av1", "vp09": "vp9"}
+
+
+def mp4_boxes(data, start=0, end=None):
+    end = len(data) if end is None else end
+    offset = start
+    while offset + 8 <= end:
+        box_size, box_type = struct.unpack(">I4s", data[offset:offset + 8])
+        header = 8
+        if box_size == 1:
+            box_size = struct.unpack(">Q", data[offset + 8:offset + 16])[0]
+            header = 16
+        elif box_size == 0:
+            box_size = end - offset
+        if box_size < header:
+            return
+        yield box_type, offset + header, min(offset + box_size, end)
+        offset += box_size
+
+
+def mp4_child(data, start, end, *path):
+    for name in path:
+        for box_type, child_start, child_end in mp4_boxes(data, start, end):
+            if box_type == name:
+                start, end = child_start, child_end
+                break
+        else:
+            return None
+    return start, end
+
+
+def mp4_time(data, start):
+    # mvhd and mdhd share the layout: version, flags, times, timescale, duration.
+    if data[start] == 1:
+        timescale, duration = struct.unpack(">IQ", data[start + 20:start + 32])
+    else:
+        timescale, duration = struct.unpack(">II", data[start + 12:start + 20])
+    return duration / timescale if timescale else None
+
+
+def probe_mp4(f, size):
+    moov = None
+    offset = 0
+    while offset + 8 <= size:
+        f.seek(offset)
+        header = f.read(16)
+        if len(header) < 8:
+            break
+        box_size, box_type = struct.unpack(">I4s", header[:8])
+        header_size = 8
+        if box_size == 1:
+            box_size = struct.unpack(">Q", header[8:16])[0]
+            header_size = 16
+        elif box_size == 0:
+            box_size = size - offset
+        if box_size < header_size:
+            break
+        if box_type == b"moov":
+            if box_size > MAX_MOOV_BYTES:
+                break
+            f.seek(offset + header_size)
+            moov = f.read(box_size - header_size)
+            break
+        offset += box_size
+    if moov is None:
+        return MediaInfo("mp4")
+
+    duration = None
+    mvhd = mp4_child(moov, 0, len(moov), b"mvhd")
+    if mvhd is not None:
+        duration = mp4_time(moov, mvhd[0])
+    for box_type, start, end in mp4_boxes(moov):
+        if box_type != b"trak":
+            continue
+        mdia = mp4_child(moov, start, end, b"mdia")
+        hdlr = mdia and mp4_child(moov, *mdia, b"hdlr")
+        if hdlr is None or moov[hdlr[0] + 8:hdlr[0] + 12] != b"soun":
+            continue
+        mdhd = mp4_child(moov, *mdia, b"mdhd")
+        if mdhd is not None:
+            duration = mp4_time(moov, mdhd[0]) or duration
+        stsd = mp4_child(moov, *mdia, b"minf", b"stbl", b"stsd")
+        if stsd is None:
+            return MediaInfo("mp4", duration=duration)
+        # stsd: version/flags, entry count, then the first sample entry.
+        for entry_type, entry_start, entry_end in mp4_boxes(moov, stsd[0] + 8, stsd[1]):
+            codec = entry_type.decode("latin-1")
+            channels, _, _, _, sample_rate = struct.unpack(">HHHHI", moov[entry_start + 16:entry_start + 28])
+            return MediaInfo("mp4", MP4_CODECS.get(codec, codec), duration, channels, sample_rate >> 16)
+    return MediaInfo("mp4", duration=duration)
+
+
+# Matroska / WebM
+
+MKV_SEGMENT = 0x18538067
+MKV_CLUSTER = 0x1F43B675
+MKV_INFO = 0x1549A966
+MKV_TRACKS = 0x1654AE6B
+MKV_TIMESTAMP_SCALE = 0x2AD7B1
+MKV_DURATION = 0x4489
+MKV_TRACK_ENTRY = 0xAE
+MKV_TRACK_TYPE = 0x83
+MKV_CODEC_ID = 0x86
+MKV_AUDIO = 0xE1
+MKV_SAMPLING_FREQUENCY = 0xB5
+MKV_CHANNELS = 0x9F
+MKV_AUDIO_TRACK = 2
+
+
+def ebml_vint(data, offset, keep_marker):
+    first = data[offset]
+    length = 1
+    while length <= 8 and not first & (0x80 >> (length - 1)):
+        length += 1
+    if length > 8 or offset + length > len(data):
+        raise ValueError("invalid EBML number")
+    value = first if keep_marker else first & (0xFF >> length)
+    for byte in data[offset + 1:offset + length]:
+        value = (value << 8) | byte
+    unknown = not keep_marker and value == (1 << (7 * length)) - 1
+    return value, offset + length, unknown
+
+
+def ebml_elements(data, start=0, end=None):
+    end = len(data) if end is None else end
+    offset = start
+    while offset < end:
+        element_id, offset, _ = ebml_vint(data, offset, True)
+        element_size, offset, unknown = ebml_vint(data, offset, False)
+        element_end = end if unknown else min(offset + element_size, end)
+        yield element_id, offset, element_end
+        offset = element_end
+
+
+def ebml_uint(data, start, end):
+    return int.from_bytes(data[start:end], "big")
+
+
+def ebml_float(data, start, end):
+    if end - start == 4:
+        return struct.unpack(">f", data[start:end])[0]
+    if end - start == 8:
+        return struct.unpack(">d", data[start:end])[0]
+    return None
+
+
+def probe_matroska(f, size):
+    # Info and Tracks come before the first Cluster in files written by any
+    # common muxer, so the head of the file is enough.
+    data = f.read(HEAD_BYTES)
+    duration = None
+    track = None
+    scale = 1000000
+    try:
+        for element_id, start, end in ebml_elements(data):
+            if element_id != MKV_SEGMENT:
+                continue
+            for child_id, child_start, child_end in ebml_elements(data, start, end):
+                if child_id == MKV_CLUSTER:
+                    break
+                if child_id == MKV_INFO:
+                    for info_id, info_start, info_end in ebml_elements(data, child_start, child_end):
+                        if info_id == MKV_TIMESTAMP_SCALE:
+                            scale = ebml_uint(data, info_start, info_end)
+                        elif info_id == MKV_DURATION:
+                            duration = ebml_float(data, info_start, info_end)
+                elif child_id == MKV_TRACKS and track is None:
+                    for entry_id, entry_start, entry_end in ebml_elements(data, child_start, child_end):
+                        if entry_id == MKV_TRACK_ENTRY:
+                            entry = matroska_track(data, entry_start, entry_end)
+                            if entry.get('type') == MKV_AUDIO_TRACK:
+                                track = entry
+                                break
+            break
+    except (ValueError, IndexError, struct.error):
+        pass
+    track = track or {}
+    codec = track.get('codec')
+    if codec and codec.startswith("A_"):
+        codec = codec[2:].split("/")[0].lower()
+    return MediaInfo("matroska", codec, duration * scale / 1e9 if duration is not None else None,
+                     track.get('channels'), track.get('sample_rate'))
+
+
+def matroska_track(data, start, end):
+    track = {}
+    for element_id, child_start, child_end in ebml_elements(data, start, end):
+        if element_id == MKV_TRACK_TYPE:
+            track['type'] = ebml_uint(data, child_start, child_end)
+        elif element_id == MKV_CODEC_ID:
+            track['codec'] = data[child_start:child_end].rstrip(b"\0").decode("ascii", "replace")
+        elif element_id == MKV_AUDIO:
+            for audio_id, audio_start, audio_end in ebml_elements(data, child_start, child_end):
+                if audio_id == MKV_SAMPLING_FREQUENCY:
+                    track['sample_rate'] = int(ebml_float(data, audio_start, audio_end) or 0) or None
+                elif audio_id == MKV_CHANNELS:
+                    track['channels'] = ebml_uint(data, audio_start, audio_end)
+    return track
+
+
+# Ogg (Vorbis, Opus, FLAC)
+
+def probe_ogg(f, size):
+    head = f.read(HEAD_BYTES)
+    if len(head) < 28:
+        return MediaInfo("ogg")
+    segments = head[26]
+    packet = head[27 + segments:27 + segments + 64]
+    codec = channels = sample_rate = None
+    granule_rate = None
+    pre_skip = 0
+    if packet[:7] == b"\x01vorbis":
+        codec = "vorbis"
+        channels = packet[11]
+        sample_rate = granule_rate = struct.unpack("<I", packet[12:16])[0]
+    elif packet[:8] == b"OpusHead":
+        codec = "opus"
+        channels = packet[9]
+        pre_skip = struct.unpack("<H", packet[10:12])[0]
+        sample_rate = struct.unpack("<I", packet[12:16])[0] or 48000
+        granule_rate = 48000
+    elif packet[:5] == b"\x7fFLAC" and packet[9:13] == b"fLaC":
+        codec = "flac"
+        sample_rate, channels, _ = flac_streaminfo(packet[17:51])
+        granule_rate = sample_rate
+
+    # The last page's granule position is the stream length in samples.
+    f.seek(max(0, size - TAIL_BYTES))
+    tail = f.read(TAIL_BYTES)
+    last = tail.rfind(b"OggS")
+    duration = None
+    if last != -1 and last + 14 <= len(tail) and granule_rate:
+        granule = struct.unpack("<q", tail[last + 6:last + 14])[0]
+        if granule >= 0:
+            duration = max(0, granule - pre_skip) / granule_rate
+    return MediaInfo("ogg", codec, duration, channels, sample_rate)
+
+
+# FLAC
+
+def flac_streaminfo(block):
+    # 20 bits sample rate, 3 bits channels - 1, 5 bits bits per sample - 1,
+    # 36 bits total samples, starting 10 bytes into STREAMINFO.
+    bits = int.from_bytes(block[10:18], "big")
+    sample_rate = bits >> 44
+    channels = ((bits >> 41) & 0x7) + 1
+    total_samples = bits & 0xFFFFFFFFF
+    return sample_rate, channels, total_samples
+
+
+def probe_flac(f, size):
+    head = f.read(42)
+    if len(head) < 42:
+        return MediaInfo("flac", "flac")
+    sample_rate, channels, total_samples = flac_streaminfo(head[8:42])
+    duration = total_samples / sample_rate if sample_rate and total_samples else None
+    return MediaInfo("flac", "flac", duration, channels, sample_rate)
+
+
+# MP3
+
+MP3_BITRATES = {
+    (1, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (1, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (1, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (2, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (2, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+MP3_BITRATES[(2, 3)] = MP3_BITRATES[(2, 2)]
+MP3_SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+
+
+def mp3_frame(header):
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version_bits = (header[1] >> 3) & 0x3
+    layer = 4 - ((header[1] >> 1) & 0x3)
+    bitrate_index = header[2] >> 4
+    rate_index = (header[2] >> 2) & 0x3
+    if version_bits == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    version = 1 if version_bits == 3 else 2
+    sample_rate = MP3_SAMPLE_RATES[version_bits][rate_index]
+    bitrate = MP3_BITRATES[(version, layer)][bitrate_index] * 1000
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate // sample_rate + ((header[2] >> 1) & 1)) * 4
+    else:
+        samples = 1152 if layer == 2 or version == 1 else 576
+        length = samples // 8 * bitrate // sample_rate + ((header[2] >> 1) & 1)
+    channels = 1 if header[3] >> 6 == 3 else 2
+    return {'version': version, 'layer': layer, 'bitrate': bitrate, 'sample_rate': sample_rate,
+            'samples': samples, 'length': length, 'channels': channels}
+
+
+def probe_mp3(f, size):
+    head = f.read(HEAD_BYTES)
+    start = 0
+    if head[:3] == b"ID3" and len(head) >= 10:
+        tag_size = 0
+        for byte in head[6:10]:
+            tag_size = (tag_size << 7) | (byte & 0x7F)
+        start = 10 + tag_size + (10 if head[5] & 0x10 else 0)
+        if start + 1024 > len(head):
+            f.seek(start)
+            head = b"\0" * start + f.read(HEAD_BYTES)
+
+    # Two consecutive valid headers rule out a sync pattern inside other data.
+    frame = None
+    offset = start
+    while offset + 4 <= len(head):
+        offset = head.find(b"\xff", offset)
+        if offset == -1:
+            break
+        frame = mp3_frame(head[offset:offset + 4])
+        if frame is not None and frame['length'] > 0:
+            following = head[offset + frame['length']:offset + frame['length'] + 4]
+            if len(following) < 4 or mp3_frame(following) is not None:
+                break
+        frame = None
+        offset += 1
+    if frame is None:
+        return MediaInfo("mp3")
+
+    codec = f"mp{frame['layer']}"
+    # A Xing/Info or VBRI header in the first frame holds the frame count of
+    # variable bitrate files; otherwise the bitrate is constant.
+    side_info = (32 if frame['channels'] == 2 else 17) if frame['version'] == 1 else \
+        (17 if frame['channels'] == 2 else 9)
+    xing = head[offset + 4 + side_info:offset + 4 + side_info + 12]
+    vbri = head[offset + 36:offset + 36 + 18]
+    frames = None
+    if xing[:4] in (b"Xing", b"Info") and struct.unpack(">I", xing[4:8])[0] & 1:
+        frames = struct.unpack(">I", xing[8:12])[0]
+    elif vbri[:4] == b"VBRI":
+        frames = struct.unpack(">I", vbri[14:18])[0]
+    if frames:
+        duration = frames * frame['samples'] / frame['sample_rate']
+    else:
+        audio_bytes = size - offset
+        f.seek(max(0, size - 128))
+        if f.read(3) == b"TAG":
+            audio_bytes -= 128
+        duration = audio_bytes * 8 / frame['bitrate']
+    return MediaInfo("mp3", codec, duration, frame['channels'], frame['sample_rate'])
+
+
+PROBES = {
+    "wav": probe_wav,
+    "mp4": probe_mp4,
+    "matroska": probe_matroska,
+    "ogg": probe_ogg,
+    "flac": probe_flac,
+    "mp3": probe_mp3,
+}
+
+
+def probe_ffprobe(path):
+    ffprobe = shutil.which("ffprobe")
+    if ffprobe is None:
+        return None
+    try:
+        result = subprocess.run(
+            [ffprobe, "-v", "error", "-show_entries",
+             "format=format_name,duration:stream=codec_type,codec_name,channels,sample_rate",
+             "-of", "json", path],
+            capture_output=True, text=True, timeout=30,
+        )
+        data = json.loads(result.stdout or "{}")
+    except (OSError, subprocess.SubprocessError, ValueError):
+        return None
+    fmt = data.get('format') or {}
+    if not fmt:
+        return None
+    stream = next((s for s in data.get('streams') or [] if s.get('codec_type') == 'audio'), {})
+    try:
+        duration = float(fmt['duration'])
+    except (KeyError, ValueError):
+        duration = None
+    sample_rate = stream.get('sample_rate')
+    return MediaInfo(fmt.get('format_name', '').split(',')[0] or "unknown", stream.get('codec_name'), duration,
+                     stream.get('channels'), int(sample_rate) if sample_rate else None)
+
+
+def probe(path, use_ffprobe=True):
+    with open(path, 'rb') as f:
+        head = f.read(16)
+        container = sniff_container(head)
+        info = None
+        if container is not None:
+            f.seek(0)
+            try:
+                info = PROBES[container](f, os.fstat(f.fileno()).st_size)
+            except (ValueError, IndexError, struct.error, ZeroDivisionError):
+                info = MediaInfo(container)
+    if (info is None or info.duration is None) and use_ffprobe:
+        info = probe_ffprobe(path) or info
+    return info
+
+
+class MediaInfoCache:
+    def __init__(self, db_file=PROBE_CACHE_FILE):
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(db_file, check_same_thread=False)
+        self.db.executescript(
+            "CREATE TABLE IF NOT EXISTS media_info ("
+            "  path TEXT PRIMARY KEY,"
+            "  size INTEGER NOT NULL,"
+            "  mtime_ns INTEGER NOT NULL,"
+            "  container TEXT,"
+            "  codec TEXT,"
+            "  duration REAL,"
+            "  channels INTEGER,"
+            "  sample_rate INTEGER);"
+        )
+        self.db.commit()
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+    def lookup(self, paths):
+        # Rows only count while the file keeps the size and mtime it had when
+        # it was probed; unreadable files are cached too, as a NULL container.
+        found = {}
+        with self.lock:
+            for path, (size, mtime_ns) in paths.items():
+                row = self.db.execute(
+                    "SELECT container, codec, duration, channels, sample_rate FROM media_info"
+                    " WHERE path = ? AND size = ? AND mtime_ns = ?",
+                    (path, size, mtime_ns)
+                ).fetchone()
+                if row is not None:
+                    found[path] = MediaInfo(*row) if row[0] is not None else None
+        return found
+
+    def store(self, results):
+        with self.lock:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO media_info"
+                " (path, size, mtime_ns, container, codec, duration, channels, sample_rate)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(path, size, mtime_ns, *((info.container, info.codec, info.duration, info.channels,
+                                            info.sample_rate) if info is not None else (None,) * 5))
+                 for path, (size, mtime_ns, info) in results.items()]
+            )
+            self.db.commit()
+
+
+def probe_files(paths, cache=None, max_workers=8, use_ffprobe=True):
+    stats = {}
+    for path in dict.fromkeys(paths):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        stats[os.path.abspath(path)] = (path, st.st_size, st.st_mtime_ns)
+    keys = {key: (size, mtime_ns) for key, (_, size, mtime_ns) in stats.items()}
+    found = cache.lookup(keys) if cache is not None else {}
+    missing = [key for key in stats if key not in found]
+
+    def probe_one(key):
+        try:
+            return probe(stats[key][0], use_ffprobe)
+        except OSError:
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        probed = dict(zip(missing, pool.map(probe_one, missing)))
+    if cache is not None and probed:
+        cache.store({key: (*keys[key], info) for key, info in probed.items()})
+    found.update(probed)
+    return {stats[key][0]: info for key, info in found.items()}
@@ -0,0 +1,91 @@
+import os
+import time
+
+from media_probe import sniff_container
+
+SCAN_CHUNK = 1000
+SCAN_INTERVAL = 0.25
+SNIFF_BYTES = 16
+# Files with other extensions are opened and recognised by their first
+# bytes, except for these, which are never media and make up most of the
+# other files in a recording archive.
+SKIPPED_EXTENSIONS = frozenset((
+    ".txt", ".srt", ".vtt", ".tsv", ".json", ".log", ".ini", ".db", ".part", ".tmp",
+    ".jpg", ".jpeg", ".png", ".gif", ".bmp", ".pdf", ".doc", ".docx", ".xls", ".xlsx",
+    ".zip", ".7z", ".rar", ".exe", ".dll", ".html", ".xml", ".nfo", ".lnk", ".ds_store",
+))
+
+
+def normalized_path(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
+def sniff_media(path):
+    try:
+        with open(path, 'rb') as f:
+            return sniff_container(f.read(SNIFF_BYTES)) is not None
+    except OSError:
+        return False
+
+
+def is_media(path, accept):
+    if accept(path):
+        return True
+    extension = os.path.splitext(path)[1].lower()
+    return extension not in SKIPPED_EXTENSIONS and sniff_media(path)
+
+
+def sorted_entries(directory):
+    with os.scandir(directory) as entries:
+        return sorted(entries, key=lambda entry: entry.name.lower())
+
+
+def scan_media(paths, accept, seen=None, chunk_size=SCAN_CHUNK, cancelled=None):
+    # Yields the media files among paths and below the folders in it, as
+    # lists of at most chunk_size, in name order. Paths already in seen
+    # (normalized) are skipped and every yielded path is added to it.
+    # A partial chunk is yielded after SCAN_INTERVAL so that the first
+    # files of a slow share show up early.
+    seen = set() if seen is None else seen
+    chunk = []
+    last = time.monotonic()
+    pending = list(reversed(paths))
+    while pending:
+        if cancelled is not None and cancelled():
+            return
+        path = pending.pop()
+        if os.path.isdir(path):
+            try:
+                entries = sorted_entries(path)
+            except OSError:
+                continue
+            files, directories = [], []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                    elif entry.is_file():
+                        files.append(entry.path)
+                except OSError:
+                    continue
+            pending.extend(reversed(directories))
+        elif os.path.isfile(path):
+            files = [path]
+        else:
+            continue
+        for file_path in files:
+            candidate = normalized_path(file_path)
+            if candidate in seen or not is_media(file_path, accept):
+                continue
+            seen.add(candidate)
+            chunk.append(file_path)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+                last = time.monotonic()
+        if chunk and time.monotonic() - last >= SCAN_INTERVAL:
+            yield chunk
+            chunk = []
+            last = time.monotonic()
+    if chunk:
+        yield chunk
@@ -0,0 +1,104 @@
+import re
+import time
+import threading
+
+# faster-whisper-xxl prints "[00:01.000 --> 00:04.500] text" for every segment,
+# with an hours field once the audio is longer than an hour, and logs the media
+# length before it starts decoding.
+SEGMENT_PATTERN = re.compile(r'\[((?:\d+:)?\d+:\d+(?:\.\d+)?)\s*-->\s*((?:\d+:)?\d+:\d+(?:\.\d+)?)\]')
+DURATION_PATTERN = re.compile(r'audio with duration(?: of)?:?\s*((?:\d+:)?\d+:\d+(?:\.\d+)?)', re.IGNORECASE)
+
+UPDATE_INTERVAL = 0.25
+
+
+def parse_timestamp(text):
+    seconds = 0.0
+    for part in text.split(':'):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def format_duration(seconds):
+    seconds = int(max(0, seconds))
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+class OutputParser:
+    def __init__(self, duration=None):
+        self.duration = duration
+        self.position = 0.0
+
+    def feed(self, line):
+        if self.duration is None:
+            match = DURATION_PATTERN.search(line)
+            if match:
+                self.duration = parse_timestamp(match.group(1))
+                return None
+        match = SEGMENT_PATTERN.search(line)
+        if match is None:
+            return None
+        self.position = max(self.position, parse_timestamp(match.group(2)))
+        return self.position
+
+    def fraction(self):
+        if not self.duration:
+            return None
+        return min(1.0, self.position / self.duration)
+
+
+class BatchProgress:
+    def __init__(self, total, interval=UPDATE_INTERVAL):
+        self.total = total
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+        self.completed = 0
+        self.partial = {}
+        self.file_started = {}
+        self.last_update = 0.0
+
+    def start_file(self, key):
+        with self.lock:
+            self.file_started[key] = time.monotonic()
+            self.partial[key] = 0.0
+
+    def update_file(self, key, fraction, media_position, label):
+        now = time.monotonic()
+        with self.lock:
+            self.partial[key] = fraction
+            if now - self.last_update < self.interval:
+                return None
+            self.last_update = now
+            elapsed = now - self.file_started.get(key, self.started)
+            details = [f"{label} {int(fraction * 100)}%"]
+            if media_position > 0:
+                details.append(f"RTF {elapsed / media_position:.2f}")
+            return self.snapshot(now, details)
+
+    def update_download(self, label, fraction):
+        now = time.monotonic()
+        with self.lock:
+            if now - self.last_update < self.interval:
+                return None
+            self.last_update = now
+            return self.snapshot(now, [f"Downloading {label} {int(fraction * 100)}%"])
+
+    def finish_file(self, key):
+        now = time.monotonic()
+        with self.lock:
+            self.partial.pop(key, None)
+            self.file_started.pop(key, None)
+            self.completed += 1
+            self.last_update = now
+            return self.snapshot(now, [])
+
+    def snapshot(self, now, details):
+        done = self.completed + sum(self.partial.values())
+        fraction = done / self.total if self.total else 1.0
+        message = f"Progress: {self.completed}/{self.total}"
+        if 0 < fraction < 1:
+            elapsed = now - self.started
+            details.append(f"ETA {format_duration(elapsed * (1 - fraction) / fraction)}")
+        if details:
+            message += " - " + " - ".join(details)
+        return int(fraction * 100), message
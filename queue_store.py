@@ -0,0 +1,88 @@
+import math
+from array import array
+
+QUEUED = "queued"
+
+
+class QueueStore:
+    # The queue as parallel arrays: one list of paths, an index from path to
+    # row, and one byte or float per row for status, progress and duration,
+    # so a million rows cost little more than their path strings.
+    def __init__(self):
+        self.paths = []
+        self.rows = {}
+        self.statuses = array('B')
+        self.progress = array('B')
+        self.durations = array('f')
+        self.status_names = [""]
+        self.status_codes = {"": 0}
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __contains__(self, path):
+        return path in self.rows
+
+    def row_of(self, path):
+        return self.rows.get(path)
+
+    def missing(self, paths):
+        # The paths that are not in the queue yet, each once, in order.
+        return [path for path in dict.fromkeys(paths) if path not in self.rows]
+
+    def reindex(self, start=0):
+        self.rows.update(zip(self.paths[start:], range(start, len(self.paths))))
+
+    def extend(self, paths):
+        start = len(self.paths)
+        count = len(paths)
+        self.paths.extend(paths)
+        self.reindex(start)
+        self.statuses.frombytes(bytes(count))
+        self.progress.frombytes(bytes(count))
+        self.durations.extend(array('f', [math.nan]) * count)
+
+    def insert(self, row, paths):
+        count = len(paths)
+        self.paths[row:row] = paths
+        self.statuses[row:row] = array('B', bytes(count))
+        self.progress[row:row] = array('B', bytes(count))
+        self.durations[row:row] = array('f', [math.nan]) * count
+        self.reindex(row)
+
+    def remove(self, row, count=1):
+        for path in self.paths[row:row + count]:
+            del self.rows[path]
+        del self.paths[row:row + count]
+        del self.statuses[row:row + count]
+        del self.progress[row:row + count]
+        del self.durations[row:row + count]
+        self.reindex(row)
+
+    def clear(self):
+        self.__init__()
+
+    def status(self, row):
+        return self.status_names[self.statuses[row]]
+
+    def status_code(self, status):
+        code = self.status_codes.get(status)
+        if code is None:
+            code = self.status_codes[status] = len(self.status_names)
+            self.status_names.append(status)
+        return code
+
+    def set_status(self, row, status):
+        self.statuses[row] = self.status_code(status)
+
+    def reset_states(self, status=QUEUED):
+        count = len(self.paths)
+        self.statuses = array('B', [self.status_code(status)]) * count
+        self.progress = array('B', bytes(count))
+
+    def duration(self, row):
+        value = self.durations[row]
+        return None if math.isnan(value) else value
+
+    def set_duration(self, row, seconds):
+        self.durations[row] = math.nan if seconds is None else seconds
@@ -0,0 +1,198 @@
+import os
+import json
+import time
+import shutil
+import sqlite3
+import hashlib
+import threading
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+HASH_CHUNK_SIZE = 1024 * 1024
+OUTPUT_PREFIX = "out"
+# ioctl that makes destination share the blocks of source copy-on-write
+# (btrfs, XFS, bcachefs).
+FICLONE = 0x40049409
+
+
+def hash_file(path, chunk_size=HASH_CHUNK_SIZE):
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def canonical_options(args, ignored=('--output_dir',)):
+    options = []
+    current = None
+    for arg in args:
+        if arg.startswith('--'):
+            current = [arg]
+            options.append(current)
+        elif current is not None:
+            current.append(arg)
+    options = [option for option in options if option[0] not in ignored]
+    return sorted(options)
+
+
+def hash_options(args, ignored=('--output_dir',)):
+    payload = json.dumps(canonical_options(args, ignored), ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def link_or_copy(source, destination):
+    if os.path.exists(destination):
+        os.remove(destination)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+def copy_file(source, destination):
+    # Outputs handed out of the cache may be edited in place afterwards, so
+    # they must never share an inode with the cached object. A reflink is as
+    # cheap as a hard link where the filesystem supports it.
+    if os.path.exists(destination):
+        os.remove(destination)
+    if fcntl is not None:
+        try:
+            with open(source, 'rb') as src, open(destination, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            shutil.copystat(source, destination)
+            return
+        except OSError:
+            pass
+    shutil.copy2(source, destination)
+
+
+class ResultCache:
+    def __init__(self, cache_dir="cache", max_bytes=2 * 1024 ** 3):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        os.makedirs(os.path.join(cache_dir, "objects"), exist_ok=True)
+        self.db = sqlite3.connect(os.path.join(cache_dir, "index.db"), check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, suffixes TEXT NOT NULL, size INTEGER NOT NULL, "
+            "created REAL NOT NULL, last_used REAL NOT NULL)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)")
+        self.db.commit()
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+    def key_for(self, filename, options_hash):
+        return self.key_for_content(hash_file(filename), options_hash)
+
+    def key_for_content(self, content_hash, options_hash):
+        return f"{content_hash}-{options_hash[:20]}"
+
+    def entry_dir(self, key):
+        return os.path.join(self.cache_dir, "objects", key[:2], key)
+
+    def count(self, hit):
+        # A file may be looked up under several keys; callers count it once
+        # here, so the hit rate is per file rather than per probe.
+        with self.lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def lookup_files(self, key):
+        # Returns {suffix: path inside the cache} for a complete entry.
+        with self.lock:
+            row = self.db.execute("SELECT suffixes FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            entry_dir = self.entry_dir(key)
+            suffixes = json.loads(row[0])
+            if not all(os.path.isfile(os.path.join(entry_dir, OUTPUT_PREFIX + s)) for s in suffixes):
+                self.drop_entry(key)
+                return None
+
+            self.db.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+            self.db.commit()
+        return {suffix: os.path.join(entry_dir, OUTPUT_PREFIX + suffix) for suffix in suffixes}
+
+    def lookup(self, key, filename, output_dir):
+        files = self.lookup_files(key)
+        if files is None:
+            return None
+
+        # Outputs are stored under the suffix that follows the input's stem, so a
+        # renamed copy of the same media gets outputs named after its own stem.
+        os.makedirs(output_dir, exist_ok=True)
+        stem = os.path.splitext(os.path.basename(filename))[0]
+        restored = []
+        for suffix, path in files.items():
+            destination = os.path.join(output_dir, stem + suffix)
+            copy_file(path, destination)
+            restored.append(destination)
+        return restored
+
+    def store(self, key, filename, outputs):
+        if not outputs:
+            return
+        stem = os.path.splitext(os.path.basename(filename))[0]
+        entry_dir = self.entry_dir(key)
+        os.makedirs(entry_dir, exist_ok=True)
+
+        suffixes = []
+        size = 0
+        for output in outputs:
+            suffix = os.path.basename(output)[len(stem):]
+            shutil.copy2(output, os.path.join(entry_dir, OUTPUT_PREFIX + suffix))
+            suffixes.append(suffix)
+            size += os.path.getsize(output)
+
+        now = time.time()
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO entries (key, suffixes, size, created, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, json.dumps(suffixes), size, now, now)
+            )
+            self.db.commit()
+            self.evict()
+
+    def drop_entry(self, key):
+        shutil.rmtree(self.entry_dir(key), ignore_errors=True)
+        self.db.execute("DELETE FROM entries WHERE key = ?", (key,))
+        self.db.commit()
+
+    def evict(self):
+        total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self.db.execute("SELECT key, size FROM entries ORDER BY last_used").fetchall():
+            self.drop_entry(key)
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def stats(self):
+        with self.lock:
+            entries, size = self.db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': entries,
+                'size_bytes': size,
+                'max_bytes': self.max_bytes,
+            }
@@ -0,0 +1,36 @@
+import os
+
+from media_probe import probe_files
+
+SCHEDULE_POLICIES = ["fifo", "longest-first", "shortest-first"]
+
+
+def probe_durations(paths, cache=None, max_workers=8):
+    infos = probe_files(paths, cache=cache, max_workers=max_workers)
+    return {path: info.duration for path, info in infos.items() if info is not None}
+
+
+def schedule_jobs(jobs, policy, durations):
+    # Jobs whose duration is unknown (links that are not downloaded yet,
+    # formats nothing could read) are treated as long: longest-first starts
+    # them early, shortest-first leaves them for last. Ties keep the order
+    # the files were added in.
+    if policy == "longest-first":
+        def sort_key(job):
+            duration = durations.get(job[1])
+            return (0, 0.0) if duration is None else (1, -duration)
+    elif policy == "shortest-first":
+        def sort_key(job):
+            duration = durations.get(job[1])
+            return (1, 0.0) if duration is None else (0, duration)
+    else:
+        return list(jobs)
+    return sorted(jobs, key=sort_key)
+
+
+def describe_schedule(jobs, policy, durations):
+    for slot, (position, source) in enumerate(jobs):
+        duration = durations.get(source)
+        reason = "duration unknown" if duration is None else f"{duration:.1f} s"
+        yield (f"Schedule ({policy}): slot {slot + 1}/{len(jobs)} is {os.path.basename(source) or source} "
+               f"(added as #{position + 1}, {reason}).")
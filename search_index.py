@@ -0,0 +1,222 @@
+import os
+import re
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+
+from subtitles import read_cues
+
+SEARCH_INDEX_FILE = "search_index.db"
+# A transcript usually exists in several formats; only the richest one is
+# indexed, so every segment is found once.
+INDEXED_FORMATS = ("json", "srt", "vtt", "tsv", "txt")
+SPEAKER_PATTERN = re.compile(r'^\[([^\]]+)\]:\s*')
+COMMIT_EVERY = 500
+
+
+@dataclass(frozen=True, slots=True)
+class SearchHit:
+    path: str
+    source: str
+    start_ms: int
+    end_ms: int
+    speaker: str
+    text: str
+    snippet: str
+
+
+def split_speaker(text):
+    match = SPEAKER_PATTERN.match(text)
+    if match:
+        return match.group(1), text[match.end():]
+    return None, text
+
+
+def milliseconds(seconds):
+    return round(float(seconds) * 1000) if isinstance(seconds, (int, float)) else None
+
+
+def json_segments(path):
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    segments = data.get('segments') if isinstance(data, dict) else None
+    for segment in segments or []:
+        speaker, text = split_speaker(str(segment.get('text', '')).strip())
+        if text:
+            yield milliseconds(segment.get('start')), milliseconds(segment.get('end')), \
+                segment.get('speaker') or speaker, text
+
+
+def cue_segments(path):
+    for start, end, _, lines in read_cues(path):
+        speaker, text = split_speaker(" ".join(line.strip() for line in lines if line.strip()))
+        if text:
+            yield round(start * 1000), round(end * 1000), speaker, text
+
+
+def tsv_segments(path):
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            fields = line.rstrip('\n').split('\t')
+            if len(fields) >= 3 and fields[0].isdigit() and fields[1].isdigit():
+                speaker, text = split_speaker("\t".join(fields[2:]).strip())
+                if text:
+                    yield int(fields[0]), int(fields[1]), speaker, text
+
+
+def txt_segments(path):
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            speaker, text = split_speaker(line.strip())
+            if text:
+                yield None, None, speaker, text
+
+
+PARSERS = {
+    "json": json_segments,
+    "srt": cue_segments,
+    "vtt": cue_segments,
+    "tsv": tsv_segments,
+    "txt": txt_segments,
+}
+
+
+def transcript_files(root, recursive=True):
+    # Yields (path, size, mtime_ns) of the richest format of every
+    # transcript below root, walking with scandir so that huge output
+    # folders are listed without a stat call per name.
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        best = {}
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            pending.append(entry.path)
+                        continue
+                    base, extension = os.path.splitext(entry.name)
+                    extension = extension[1:].lower()
+                    if extension not in PARSERS or not entry.is_file():
+                        continue
+                    rank = INDEXED_FORMATS.index(extension)
+                    if base not in best or rank < best[base][0]:
+                        best[base] = (rank, entry.path, entry.stat())
+                except OSError:
+                    continue
+        for _, path, st in best.values():
+            yield path, st.st_size, st.st_mtime_ns
+
+
+def match_expression(query):
+    # Plain words are matched as they are typed; each one is quoted so that
+    # punctuation in the query is not read as FTS5 syntax.
+    return " ".join('"' + token.replace('"', '""') + '"' for token in query.split())
+
+
+class SearchIndex:
+    def __init__(self, db_file=SEARCH_INDEX_FILE):
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(db_file, check_same_thread=False)
+        self.db.executescript(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL, base TEXT NOT NULL, "
+            "size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS files_base ON files (base);"
+            "CREATE TABLE IF NOT EXISTS sources (base TEXT PRIMARY KEY, source TEXT NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS segments ("
+            "id INTEGER PRIMARY KEY, file INTEGER NOT NULL, start_ms INTEGER, end_ms INTEGER, "
+            "speaker TEXT, text TEXT NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS segments_file ON segments (file);"
+            # The full-text table only holds the index; the rows live in
+            # segments and the triggers keep both in step.
+            "CREATE VIRTUAL TABLE IF NOT EXISTS segments_fts USING fts5("
+            "text, speaker, content='segments', content_rowid='id', tokenize='unicode61 remove_diacritics 2');"
+            "CREATE TRIGGER IF NOT EXISTS segments_insert AFTER INSERT ON segments BEGIN "
+            "INSERT INTO segments_fts (rowid, text, speaker) VALUES (new.id, new.text, new.speaker); END;"
+            "CREATE TRIGGER IF NOT EXISTS segments_delete AFTER DELETE ON segments BEGIN "
+            "INSERT INTO segments_fts (segments_fts, rowid, text, speaker) "
+            "VALUES ('delete', old.id, old.text, old.speaker); END;"
+        )
+        self.db.commit()
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+    def record_sources(self, outputs, source):
+        # Outputs only carry the input's stem, so the file they were made
+        # from is remembered when the pipeline writes them.
+        with self.lock:
+            self.db.executemany("INSERT OR REPLACE INTO sources (base, source) VALUES (?, ?)",
+                                ((os.path.splitext(os.path.abspath(output))[0], source) for output in outputs))
+            self.db.commit()
+
+    def known_files(self, root, recursive):
+        prefix = os.path.join(root, "")
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT path, id, size, mtime_ns FROM files WHERE substr(path, 1, ?) = ?", (len(prefix), prefix)
+            ).fetchall()
+        return {path: (file_id, size, mtime_ns) for path, file_id, size, mtime_ns in rows
+                if recursive or os.path.dirname(path) == root}
+
+    def update(self, root, recursive=True):
+        # Only files that are new or whose size or mtime changed are read
+        # again; index rows of files that are gone are dropped. Returns the
+        # number of files (re)indexed and removed.
+        root = os.path.abspath(root)
+        known = self.known_files(root, recursive)
+        indexed = 0
+        for path, size, mtime_ns in transcript_files(root, recursive):
+            row = known.pop(path, None)
+            if row is not None and row[1:] == (size, mtime_ns):
+                continue
+            try:
+                segments = list(PARSERS[os.path.splitext(path)[1][1:].lower()](path))
+            except (OSError, ValueError, UnicodeDecodeError):
+                continue
+            with self.lock:
+                if row is not None:
+                    self.db.execute("DELETE FROM segments WHERE file = ?", (row[0],))
+                    self.db.execute("UPDATE files SET size = ?, mtime_ns = ? WHERE id = ?", (size, mtime_ns, row[0]))
+                    file_id = row[0]
+                else:
+                    file_id = self.db.execute(
+                        "INSERT INTO files (path, base, size, mtime_ns) VALUES (?, ?, ?, ?)",
+                        (path, os.path.splitext(path)[0], size, mtime_ns)
+                    ).lastrowid
+                self.db.executemany(
+                    "INSERT INTO segments (file, start_ms, end_ms, speaker, text) VALUES (?, ?, ?, ?, ?)",
+                    ((file_id, *segment) for segment in segments)
+                )
+                indexed += 1
+                if indexed % COMMIT_EVERY == 0:
+                    self.db.commit()
+        with self.lock:
+            for file_id, _, _ in known.values():
+                self.db.execute("DELETE FROM segments WHERE file = ?", (file_id,))
+                self.db.execute("DELETE FROM files WHERE id = ?", (file_id,))
+            self.db.commit()
+        return indexed, len(known)
+
+    def search(self, query, limit=50):
+        expression = match_expression(query)
+        if not expression:
+            return []
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT f.path, src.source, s.start_ms, s.end_ms, s.speaker, s.text, "
+                "snippet(segments_fts, 0, '[', ']', '...', 12) "
+                "FROM segments_fts JOIN segments s ON s.id = segments_fts.rowid "
+                "JOIN files f ON f.id = s.file LEFT JOIN sources src ON src.base = f.base "
+                "WHERE segments_fts MATCH ? ORDER BY bm25(segments_fts) LIMIT ?",
+                (expression, limit)
+            ).fetchall()
+        return [SearchHit(*row) for row in rows]
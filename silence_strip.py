@@ -0,0 +1,97 @@
+import os
+import wave
+import subprocess
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+FRAME_SECONDS = 0.03
+PADDING_SECONDS = 0.3
+BLOCK_FRAMES = 65536
+# Cutting less than this share of a file is not worth a second copy of it.
+MIN_SAVING = 0.1
+
+
+def strip_available():
+    return np is not None
+
+
+def decode_pcm(ffmpeg, path, destination, sample_rate, channels):
+    command = [ffmpeg, "-hide_banner", "-nostats", "-loglevel", "error", "-y", "-i", path, "-vn",
+               "-ac", str(channels), "-ar", str(sample_rate), "-f", "s16le", "-c:a", "pcm_s16le", destination]
+    subprocess.run(command, check=True, capture_output=True)
+
+
+def frame_levels(samples, frame_length):
+    # Mean power per frame in dBFS, computed a block at a time so a long
+    # recording never has to be held as floats all at once.
+    frames = len(samples) // frame_length
+    levels = np.empty(frames, dtype=np.float32)
+    for start in range(0, frames, BLOCK_FRAMES):
+        stop = min(frames, start + BLOCK_FRAMES)
+        block = samples[start * frame_length:stop * frame_length].astype(np.float32).reshape(-1, frame_length)
+        levels[start:stop] = np.mean(block * block, axis=1)
+    return 10 * np.log10(levels / (32768.0 * 32768.0) + 1e-12)
+
+
+def voiced_ranges(levels, threshold_db, min_silence_frames, padding_frames):
+    # Silent runs of at least min_silence_frames are removed, minus a little
+    # padding on both sides so words are not clipped at the edges.
+    silent = np.concatenate(([False], levels <= threshold_db, [False]))
+    edges = np.flatnonzero(np.diff(silent.astype(np.int8)))
+    run_starts, run_ends = edges[0::2], edges[1::2]
+    long_runs = (run_ends - run_starts) >= min_silence_frames
+    cut_starts = run_starts[long_runs]
+    cut_ends = run_ends[long_runs]
+    cut_starts = np.where(cut_starts == 0, 0, cut_starts + padding_frames)
+    cut_ends = np.where(cut_ends == len(levels), len(levels), cut_ends - padding_frames)
+    valid = cut_ends > cut_starts
+    cut_starts, cut_ends = cut_starts[valid], cut_ends[valid]
+
+    keep_starts = np.concatenate(([0], cut_ends))
+    keep_ends = np.concatenate((cut_starts, [len(levels)]))
+    keep = keep_ends > keep_starts
+    return list(zip(keep_starts[keep].tolist(), keep_ends[keep].tolist()))
+
+
+def strip_silence(ffmpeg, path, destination, threshold_db, min_silence, sample_rate=16000, channels=1):
+    # Returns the kept pieces as (start in the condensed audio, start in the
+    # original) in seconds, [] if the file is silent throughout, or None if
+    # there is too little silence to bother.
+    raw = destination + ".pcm"
+    samples = None
+    try:
+        decode_pcm(ffmpeg, path, raw, sample_rate, channels)
+        if os.path.getsize(raw) == 0:
+            return []
+        samples = np.memmap(raw, dtype='<i2', mode='r')
+        frame_length = max(1, int(sample_rate * FRAME_SECONDS)) * channels
+        levels = frame_levels(samples, frame_length)
+        frame_seconds = frame_length / channels / sample_rate
+        ranges = voiced_ranges(levels, threshold_db, max(1, round(min_silence / frame_seconds)),
+                               round(PADDING_SECONDS / frame_seconds))
+        kept = sum(end - start for start, end in ranges)
+        if not ranges:
+            return []
+        if kept > len(levels) * (1 - MIN_SAVING):
+            return None
+
+        pieces = []
+        position = 0
+        with wave.open(destination, 'wb') as out:
+            out.setnchannels(channels)
+            out.setsampwidth(2)
+            out.setframerate(sample_rate)
+            for start, end in ranges:
+                last = len(samples) if end == len(levels) else end * frame_length
+                out.writeframes(samples[start * frame_length:last].tobytes())
+                pieces.append((position * frame_seconds, start * frame_seconds))
+                position += end - start
+        return pieces
+    finally:
+        # The mapping has to be released before the file can be removed on Windows.
+        samples = None
+        if os.path.exists(raw):
+            os.remove(raw)
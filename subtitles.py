@@ -0,0 +1,274 @@
+import os
+import re
+import json
+import bisect
+from dataclasses import dataclass
+
+CUE_PATTERN = re.compile(r'^\s*((?:\d+:)?\d+:\d+[.,]\d+)\s*-->\s*((?:\d+:)?\d+:\d+[.,]\d+)(.*)$')
+
+
+def parse_time(text):
+    seconds = 0.0
+    for part in text.replace(',', '.').split(':'):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def format_time(seconds, separator, always_include_hours=True):
+    milliseconds = max(0, round(seconds * 1000))
+    hours, milliseconds = divmod(milliseconds, 3600000)
+    minutes, milliseconds = divmod(milliseconds, 60000)
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    prefix = f"{hours:02d}:" if always_include_hours or hours else ""
+    return f"{prefix}{minutes:02d}:{seconds:02d}{separator}{milliseconds:03d}"
+
+
+def read_cues(path):
+    with open(path, encoding='utf-8') as f:
+        blocks = f.read().replace('\r\n', '\n').split('\n\n')
+    for block in blocks:
+        lines = block.strip('\n').split('\n')
+        for i, line in enumerate(lines):
+            match = CUE_PATTERN.match(line)
+            if match:
+                yield parse_time(match.group(1)), parse_time(match.group(2)), match.group(3), lines[i + 1:]
+                break
+
+
+def retime_cues(path, convert, separator, always_include_hours):
+    with open(path, encoding='utf-8') as f:
+        lines = f.read().split('\n')
+    for i, line in enumerate(lines):
+        match = CUE_PATTERN.match(line)
+        if match:
+            start = convert(parse_time(match.group(1)))
+            end = convert(parse_time(match.group(2)))
+            lines[i] = (f"{format_time(start, separator, always_include_hours)} --> "
+                        f"{format_time(end, separator, always_include_hours)}{match.group(3)}")
+    return "\n".join(lines)
+
+
+def retime_tsv(path, convert):
+    with open(path, encoding='utf-8') as f:
+        lines = f.read().split('\n')
+    for i, line in enumerate(lines):
+        fields = line.split('\t')
+        if len(fields) >= 3 and fields[0].isdigit() and fields[1].isdigit():
+            fields[0] = str(round(convert(int(fields[0]) / 1000) * 1000))
+            fields[1] = str(round(convert(int(fields[1]) / 1000) * 1000))
+            lines[i] = "\t".join(fields)
+    return "\n".join(lines)
+
+
+def retime_json(path, convert):
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    for segment in data.get('segments') or []:
+        for item in [segment, *(segment.get('words') or [])]:
+            for key in ('start', 'end'):
+                if isinstance(item.get(key), (int, float)):
+                    item[key] = round(convert(item[key]), 3)
+    return json.dumps(data, ensure_ascii=False)
+
+
+RETIMERS = {
+    "srt": lambda path, convert: retime_cues(path, convert, ',', True),
+    "vtt": lambda path, convert: retime_cues(path, convert, '.', False),
+    "tsv": retime_tsv,
+    "json": retime_json,
+}
+
+
+def retime_outputs(outputs, convert):
+    # Rewrites every timestamp of the timed outputs in place; plain text has
+    # none and is left alone.
+    for output in outputs:
+        retime = RETIMERS.get(os.path.splitext(output)[1][1:].lower())
+        if retime is None:
+            continue
+        content = retime(output, convert)
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+
+class Timeline:
+    # Maps times in audio that had pieces cut out back to the original
+    # recording. Each kept piece is (start in the cut audio, start in the
+    # original).
+    def __init__(self, pieces):
+        self.cut_starts = [cut for cut, _ in pieces]
+        self.original_starts = [original for _, original in pieces]
+
+    def __call__(self, seconds):
+        index = max(0, bisect.bisect_right(self.cut_starts, seconds) - 1)
+        return self.original_starts[index] + seconds - self.cut_starts[index]
+
+
+RENDERED_FORMATS = ("srt", "vtt", "tsv", "txt")
+SENTENCE_ENDINGS = ('.', '!', '?', '\u2026', '\u3002', '\uff01', '\uff1f')
+COMMAS = (',', ';', '\uff0c', '\u3001', '\uff1b')
+
+
+@dataclass(frozen=True, slots=True)
+class Layout:
+    sentence: bool = False
+    one_word: bool = False
+    highlight_words: bool = False
+    max_line_width: int = 1000
+    max_line_count: int = 1
+    max_comma: int = 250
+    max_comma_cent: int = 100
+    max_gap: float = 3.0
+    min_dist_to_end: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class Word:
+    segment: int
+    speaker: str
+    start: float
+    end: float
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class Cue:
+    start: float
+    end: float
+    lines: tuple
+    words: tuple
+
+
+def transcript_words(data):
+    # Raises ValueError for transcripts without word timestamps, which can
+    # only be laid out the way they were written.
+    words = []
+    for index, segment in enumerate(data.get('segments') or []):
+        if not segment.get('words'):
+            if segment.get('text', '').strip():
+                raise ValueError("the transcript has no word timestamps")
+            continue
+        for word in segment['words']:
+            words.append(Word(index, segment.get('speaker'), float(word['start']), float(word['end']), word['word']))
+    return words
+
+
+def sentence_groups(words, layout):
+    comma_width = min(layout.max_comma, layout.max_line_width * layout.max_comma_cent / 100)
+    group = []
+    width = 0
+    for i, word in enumerate(words):
+        group.append(word)
+        width += len(word.text)
+        text = word.text.strip()
+        following = words[i + 1] if i + 1 < len(words) else None
+        if following is None or following.speaker != word.speaker or text.endswith(SENTENCE_ENDINGS) \
+                or following.start - word.end > layout.max_gap or (text.endswith(COMMAS) and width >= comma_width):
+            yield group
+            group = []
+            width = 0
+
+
+def wrap_group(group, layout):
+    # Words are filled into lines of max_line_width characters and lines
+    # into cues of max_line_count, except that a line is not broken when
+    # fewer than min_dist_to_end words of the group would be left over.
+    lines = []
+    line = []
+    width = 0
+    for i, word in enumerate(group):
+        text = word.text.strip()
+        remaining = len(group) - i
+        if line and width + 1 + len(text) > layout.max_line_width and remaining >= layout.min_dist_to_end:
+            lines.append(line)
+            line = []
+            width = 0
+        width += len(text) + (1 if line else 0)
+        line.append(word)
+    if line:
+        lines.append(line)
+    for first in range(0, len(lines), max(1, layout.max_line_count)):
+        cue_lines = lines[first:first + max(1, layout.max_line_count)]
+        cue_words = [word for cue_line in cue_lines for word in cue_line]
+        texts = ["".join(word.text for word in cue_line).strip() for cue_line in cue_lines]
+        if cue_words[0].speaker is not None:
+            texts[0] = f"[{cue_words[0].speaker}]: {texts[0]}"
+        yield Cue(cue_words[0].start, cue_words[-1].end, tuple(texts), tuple(cue_words))
+
+
+def layout_cues(data, layout):
+    words = transcript_words(data)
+    if layout.one_word:
+        return [Cue(word.start, word.end, (word.text.strip(),), (word,)) for word in words]
+    if layout.sentence:
+        groups = sentence_groups(words, layout)
+    else:
+        groups = {}
+        for word in words:
+            groups.setdefault(word.segment, []).append(word)
+        groups = groups.values()
+    return [cue for group in groups for cue in wrap_group(group, layout)]
+
+
+def highlighted(cues):
+    # Like the executable's --highlight_words: one cue per word with that
+    # word underlined, and the plain cue in the gaps between words.
+    for cue in cues:
+        previous_end = cue.start
+        for i, current in enumerate(cue.words):
+            if current.start > previous_end:
+                yield previous_end, current.start, "\n".join(cue.lines)
+            texts = [f"<u>{word.text.strip()}</u>" if j == i else word.text.strip() for j, word in enumerate(cue.words)]
+            yield current.start, current.end, " ".join(texts)
+            previous_end = current.end
+
+
+def timed_cues(cues, layout):
+    if layout.highlight_words:
+        return list(highlighted(cues))
+    return [(cue.start, cue.end, "\n".join(cue.lines)) for cue in cues]
+
+
+def render_srt(cues, layout):
+    return "".join(f"{i + 1}\n{format_time(start, ',')} --> {format_time(end, ',')}\n{text}\n\n"
+                   for i, (start, end, text) in enumerate(timed_cues(cues, layout)))
+
+
+def render_vtt(cues, layout):
+    return "WEBVTT\n\n" + "".join(
+        f"{format_time(start, '.', False)} --> {format_time(end, '.', False)}\n{text}\n\n"
+        for start, end, text in timed_cues(cues, layout))
+
+
+def render_tsv(cues, layout):
+    return "start\tend\ttext\n" + "".join(
+        f"{round(cue.start * 1000)}\t{round(cue.end * 1000)}\t{' '.join(cue.lines)}\n" for cue in cues)
+
+
+def render_txt(cues, layout):
+    return "".join(" ".join(cue.lines) + "\n" for cue in cues)
+
+
+RENDERERS = {
+    "srt": render_srt,
+    "vtt": render_vtt,
+    "tsv": render_tsv,
+    "txt": render_txt,
+}
+
+
+def render_outputs(transcript, prefix, formats, layout):
+    # Writes prefix + "." + format for every requested format from a JSON
+    # transcript with word timestamps.
+    with open(transcript, encoding='utf-8') as f:
+        data = json.load(f)
+    cues = layout_cues(data, layout)
+    written = []
+    for fmt in formats:
+        if fmt not in RENDERERS:
+            continue
+        destination = f"{prefix}.{fmt}"
+        with open(destination, 'w', encoding='utf-8') as f:
+            f.write(RENDERERS[fmt](cues, layout))
+        written.append(destination)
+    return written
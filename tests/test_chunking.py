@@ -0,0 +1,99 @@
+import os
+import sys
+import json
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chunking import SplitJob, merge_srt, merge_tsv, plan_chunks, plan_cuts, stitch_outputs
+
+# Two chunks of a 100 s recording cut at 50 s with 5 s of overlap: the
+# second chunk starts at 45 s, so "two" and "three" are heard by both.
+FIRST = [(10, 12, "one"), (48, 51, "two"), (52, 54, "three")]
+SECOND = [(3, 6, "two"), (7, 9, "three"), (20, 22, "four")]
+
+
+def srt(cues):
+    return "".join(f"{i}\n00:00:{start:02d},000 --> 00:00:{end:02d},000\n{text}\n\n"
+                   for i, (start, end, text) in enumerate(cues, 1))
+
+
+def transcript(cues):
+    return json.dumps({"language": "en", "segments": [
+        {"start": start, "end": end, "text": f" {text}",
+         "words": [{"word": f" {text}", "start": start, "end": end}]}
+        for start, end, text in cues]})
+
+
+class PlanTest(unittest.TestCase):
+    def test_cuts_are_evenly_spaced(self):
+        self.assertEqual(plan_cuts(100, 30), [100 / 3, 200 / 3])
+        self.assertEqual(plan_cuts(40, 30), [])
+
+    def test_keep_windows_meet_at_the_cuts(self):
+        chunks = plan_chunks("work", "talk", 100, [50, 75], 5)
+        self.assertEqual([(c.start, c.end) for c in chunks], [(0, 55), (45, 80), (70, 100)])
+        self.assertEqual([(c.keep_start, c.keep_end) for c in chunks],
+                         [(float("-inf"), 50), (50, 75), (75, float("inf"))])
+        self.assertEqual(os.path.basename(chunks[1].path), "talk.part001.wav")
+        # Seconds are relative to the chunk; the midpoint decides.
+        self.assertTrue(chunks[1].keeps(5, 6))
+        self.assertFalse(chunks[1].keeps(3, 6))
+
+
+class MergeTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.chunks = plan_chunks(self.tmp.name, "talk", 100, [50], 5)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, chunk, suffix, text):
+        path = os.path.splitext(chunk.path)[0] + suffix
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def parts(self, suffix, render):
+        return [(chunk, self.write(chunk, suffix, render(cues))) for chunk, cues in zip(self.chunks, (FIRST, SECOND))]
+
+    def test_srt_drops_the_overlap_and_renumbers(self):
+        self.assertEqual(merge_srt(self.parts(".srt", srt)),
+                         "1\n00:00:10,000 --> 00:00:12,000\none\n\n"
+                         "2\n00:00:48,000 --> 00:00:51,000\ntwo\n\n"
+                         "3\n00:00:52,000 --> 00:00:54,000\nthree\n\n"
+                         "4\n00:01:05,000 --> 00:01:07,000\nfour\n\n")
+
+    def test_tsv(self):
+        def tsv(cues):
+            return "start\tend\ttext\n" + "".join(f"{s * 1000}\t{e * 1000}\t{t}\n" for s, e, t in cues)
+
+        self.assertEqual(merge_tsv(self.parts(".tsv", tsv)),
+                         "start\tend\ttext\n10000\t12000\tone\n48000\t51000\ttwo\n"
+                         "52000\t54000\tthree\n65000\t67000\tfour\n")
+
+    def test_stitched_outputs_are_named_after_the_input(self):
+        split = SplitJob(0, "in/talk.wav", self.tmp.name, self.chunks, ["exe", "", "--model", "x"])
+        for index, (chunk, cues) in enumerate(zip(self.chunks, (FIRST, SECOND))):
+            # Plain text is rebuilt from the JSON, so the chunks' own is ignored.
+            split.chunk_finished(index, [self.write(chunk, ".json", transcript(cues)),
+                                         self.write(chunk, ".txt", "unused\n"),
+                                         self.write(chunk, "_en.srt", srt(cues))])
+        out = os.path.join(self.tmp.name, "merged")
+        written = stitch_outputs(split, out, ["srt", "txt", "json"])
+        self.assertEqual(sorted(os.path.basename(path) for path in written), ["talk.json", "talk.txt", "talk_en.srt"])
+
+        with open(os.path.join(out, "talk.json"), encoding="utf-8") as f:
+            data = json.load(f)
+        self.assertEqual(data["language"], "en")
+        self.assertEqual([(s["id"], s["start"], s["end"]) for s in data["segments"]],
+                         [(0, 10, 12), (1, 48, 51), (2, 52, 54), (3, 65, 67)])
+        self.assertEqual(data["segments"][3]["words"][0]["start"], 65)
+        with open(os.path.join(out, "talk.txt"), encoding="utf-8") as f:
+            self.assertEqual(f.read(), "one\ntwo\nthree\nfour\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import sys
+import stat
+import subprocess
+import tempfile
+import unittest
+
+CLI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cli.py")
+
+# Writes a .txt for every input and succeeds.
+FAKE_EXECUTABLE = """#!{python}
+import os
+import sys
+
+args = sys.argv[1:]
+inputs = []
+while args and not args[0].startswith("--"):
+    inputs.append(args.pop(0))
+output_dir = args[args.index("--output_dir") + 1]
+os.makedirs(output_dir, exist_ok=True)
+for path in inputs:
+    with open(os.path.join(output_dir, os.path.splitext(os.path.basename(path))[0] + ".txt"), "w") as f:
+        f.write("text\\n")
+"""
+
+
+@unittest.skipIf(os.name == "nt", "needs an executable script")
+class ConfigFileTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        exe = os.path.join(self.tmp.name, "fake-whisper")
+        with open(exe, "w") as f:
+            f.write(FAKE_EXECUTABLE.format(python=sys.executable))
+        os.chmod(exe, os.stat(exe).st_mode | stat.S_IEXEC)
+        with open(os.path.join(self.tmp.name, "my.ini"), "w") as f:
+            f.write(f"[Settings]\nexe_path = {exe}\nenable_logging = False\nff_mdx_kim2 = False\n")
+        with open(os.path.join(self.tmp.name, "a.wav"), "w") as f:
+            f.write("x")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_logging_follows_the_given_config(self):
+        result = subprocess.run([sys.executable, CLI, "--config", "my.ini", "--no-journal", "--quiet",
+                                 "--output-dir", "out", "a.wav"],
+                                cwd=self.tmp.name, capture_output=True, text=True, timeout=60)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertTrue(os.path.isfile(os.path.join(self.tmp.name, "out", "a.txt")))
+        self.assertFalse(os.path.exists(os.path.join(self.tmp.name, "config.ini")))
+        self.assertFalse(os.path.exists(os.path.join(self.tmp.name, "transcription.log")))
+
+
+if __name__ == "__main__":
+    unittest.main()
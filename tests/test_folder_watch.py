@@ -0,0 +1,51 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from folder_watch import FolderWatcher
+
+
+class FolderWatchStateTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.inbox = os.path.join(self.tmp.name, "inbox")
+        os.makedirs(self.inbox)
+        for name in ("a.wav", "b.wav"):
+            with open(os.path.join(self.inbox, name), "w") as f:
+                f.write("x")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def watch(self):
+        watcher = FolderWatcher([self.inbox], lambda path: True, settle_seconds=0.1, use_polling=True,
+                                poll_interval=0.05, state_file=os.path.join(self.tmp.name, "watch_state.db"))
+        watcher.start()
+        self.addCleanup(watcher.stop)
+        return watcher
+
+    def names(self, batch):
+        return sorted(os.path.basename(path) for path in batch)
+
+    def test_only_finished_files_are_remembered(self):
+        watcher = self.watch()
+        batch = watcher.next_batch(timeout=5)
+        self.assertEqual(self.names(batch), ["a.wav", "b.wav"])
+        watcher.finished(os.path.join(self.inbox, "a.wav"), "done")
+        watcher.stop()
+
+        # b.wav was handed over but never finished, so it comes back.
+        watcher = self.watch()
+        self.assertEqual(self.names(watcher.next_batch(timeout=5)), ["b.wav"])
+        watcher.finished(os.path.join(self.inbox, "b.wav"), "failed")
+        watcher.stop()
+
+        watcher = self.watch()
+        self.assertEqual(self.names(watcher.next_batch(timeout=5)), ["b.wav"])
+
+
+if __name__ == "__main__":
+    unittest.main()
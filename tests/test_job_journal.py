@@ -0,0 +1,79 @@
+import os
+import sys
+import sqlite3
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import job_journal
+from job_journal import JobJournal
+
+
+class IncompleteBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "journal.db")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_only_unfinished_cli_and_gui_batches_are_resumed(self):
+        journal = JobJournal(self.path)
+        self.addCleanup(journal.close)
+        crashed = journal.start_batch(["a.wav"], {})
+        self.assertEqual(journal.incomplete_batch(), crashed)
+
+        finished = journal.start_batch(["a.wav", "b.wav"], {}, job_journal.GUI)
+        journal.set_state(finished, 0, job_journal.DONE)
+        journal.set_state(finished, 1, job_journal.FAILED, error="boom")
+        journal.finish_batch(finished)
+        self.assertEqual(journal.incomplete_batch(), crashed)
+
+        journal.start_batch(["c.wav"], {}, job_journal.WATCH)
+        journal.start_batch(["d.wav"], {}, job_journal.SERVICE)
+        self.assertEqual(journal.incomplete_batch(), crashed)
+
+        resumed = journal.start_batch(["e.wav"], {}, job_journal.GUI)
+        self.assertEqual(journal.incomplete_batch(), resumed)
+
+    def test_batches_from_older_journals_are_not_resumed(self):
+        db = sqlite3.connect(self.path)
+        db.execute("CREATE TABLE batches (id INTEGER PRIMARY KEY AUTOINCREMENT, settings TEXT NOT NULL,"
+                   " created_at REAL NOT NULL, finished_at REAL)")
+        db.execute("INSERT INTO batches (settings, created_at) VALUES ('{}', 0)")
+        db.commit()
+        db.close()
+
+        journal = JobJournal(self.path)
+        self.addCleanup(journal.close)
+        self.assertIsNone(journal.incomplete_batch())
+        batch_id = journal.start_batch(["a.wav"], {})
+        self.assertEqual(journal.incomplete_batch(), batch_id)
+
+
+class ResumeItemsTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.journal = JobJournal(os.path.join(tmp.name, "journal.db"))
+        self.addCleanup(self.journal.close)
+        sources = ["queued.wav", "downloading.wav", "transcribing.wav", "done.wav", "failed.wav"]
+        self.batch_id = self.journal.start_batch(sources, {})
+        self.journal.set_state(self.batch_id, 1, job_journal.DOWNLOADING)
+        self.journal.set_state(self.batch_id, 2, job_journal.TRANSCRIBING)
+        self.journal.set_state(self.batch_id, 3, job_journal.DONE)
+        self.journal.set_state(self.batch_id, 4, job_journal.FAILED, error="boom")
+
+    def test_failed_and_done_items_are_skipped(self):
+        jobs = self.journal.resume_items(self.batch_id)
+        self.assertEqual([source for _, source in jobs], ["queued.wav", "downloading.wav", "transcribing.wav"])
+
+    def test_failed_items_are_retried_on_request(self):
+        jobs = self.journal.resume_items(self.batch_id, retry_failed=True)
+        self.assertEqual([source for _, source in jobs],
+                         ["queued.wav", "downloading.wav", "transcribing.wav", "failed.wav"])
+
+
+if __name__ == "__main__":
+    unittest.main()
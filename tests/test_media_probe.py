@@ -0,0 +1,128 @@
+import os
+import sys
+import wave
+import struct
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from media_probe import MediaInfo, MediaInfoCache, probe, probe_files
+
+
+def mp4_box(box_type, *children):
+    payload = b"".join(children)
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def ebml(element_id, payload):
+    size = bytes([0x80 | len(payload)]) if len(payload) < 127 else struct.pack(">H", 0x4000 | len(payload))
+    return element_id + size + payload
+
+
+def ogg_page(granule, sequence, packet):
+    return (b"OggS" + bytes([0, 0]) + struct.pack("<qII", granule, 1, sequence) + bytes(4)
+            + bytes([1, len(packet)]) + packet)
+
+
+class ProbeTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, data):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_wav(self):
+        path = os.path.join(self.tmp.name, "a.wav")
+        with wave.open(path, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(16000)
+            w.writeframes(bytes(2 * 32000))
+        self.assertEqual(probe(path, use_ffprobe=False), MediaInfo("wav", "pcm", 2.0, 1, 16000))
+
+    def test_flac(self):
+        # sample rate, channels - 1, bits per sample - 1, total samples
+        bits = (44100 << 44) | (1 << 41) | (15 << 36) | (44100 * 3)
+        streaminfo = bytes(10) + bits.to_bytes(8, "big") + bytes(16)
+        path = self.write("a.flac", b"fLaC" + b"\x80\x00\x00\x22" + streaminfo)
+        self.assertEqual(probe(path, use_ffprobe=False), MediaInfo("flac", "flac", 3.0, 2, 44100))
+
+    def test_constant_bitrate_mp3(self):
+        # MPEG-1 layer III, 128 kbit/s, 44.1 kHz, stereo: 417-byte frames.
+        frame = b"\xff\xfb\x90\x00" + bytes(413)
+        path = self.write("a.mp3", frame * 100)
+        info = probe(path, use_ffprobe=False)
+        self.assertEqual((info.container, info.codec, info.channels, info.sample_rate), ("mp3", "mp3", 2, 44100))
+        self.assertAlmostEqual(info.duration, 41700 * 8 / 128000)
+
+    def test_ogg_opus(self):
+        head = b"OpusHead" + bytes([1, 2]) + struct.pack("<HIhB", 312, 16000, 0, 0)
+        path = self.write("a.opus", ogg_page(0, 0, head) + ogg_page(312 + 48000 * 5, 1, bytes(10)))
+        self.assertEqual(probe(path, use_ffprobe=False), MediaInfo("ogg", "opus", 5.0, 2, 16000))
+
+    def test_mp4_with_moov_at_the_end(self):
+        times = bytes(12) + struct.pack(">II", 44100, 44100 * 7)
+        sample_entry = mp4_box(b"mp4a", bytes(16) + struct.pack(">HHHHI", 2, 16, 0, 0, 44100 << 16))
+        trak = mp4_box(b"trak", mp4_box(
+            b"mdia",
+            mp4_box(b"mdhd", times),
+            mp4_box(b"hdlr", bytes(8) + b"soun" + bytes(12)),
+            mp4_box(b"minf", mp4_box(b"stbl", mp4_box(b"stsd", bytes(4) + struct.pack(">I", 1) + sample_entry))),
+        ))
+        moov = mp4_box(b"moov", mp4_box(b"mvhd", bytes(12) + struct.pack(">II", 1000, 6000)), trak)
+        path = self.write("a.m4a", mp4_box(b"ftyp", b"M4A \0\0\0\0") + mp4_box(b"mdat", bytes(1000)) + moov)
+        self.assertEqual(probe(path, use_ffprobe=False), MediaInfo("mp4", "aac", 7.0, 2, 44100))
+
+    def test_matroska(self):
+        info = ebml(b"\x15\x49\xa9\x66", ebml(b"\x2a\xd7\xb1", (1000000).to_bytes(3, "big"))
+                    + ebml(b"\x44\x89", struct.pack(">d", 4500.0)))
+        audio = ebml(b"\xe1", ebml(b"\xb5", struct.pack(">d", 48000.0)) + ebml(b"\x9f", b"\x02"))
+        video = ebml(b"\xae", ebml(b"\x83", b"\x01") + ebml(b"\x86", b"V_VP9"))
+        opus = ebml(b"\xae", ebml(b"\x83", b"\x02") + ebml(b"\x86", b"A_OPUS") + audio)
+        tracks = ebml(b"\x16\x54\xae\x6b", video + opus)
+        path = self.write("a.webm", ebml(b"\x1a\x45\xdf\xa3", b"") + ebml(b"\x18\x53\x80\x67", info + tracks))
+        self.assertEqual(probe(path, use_ffprobe=False), MediaInfo("matroska", "opus", 4.5, 2, 48000))
+
+    def test_unknown_file(self):
+        self.assertIsNone(probe(self.write("a.bin", b"not media"), use_ffprobe=False))
+
+
+class MediaInfoCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = MediaInfoCache(os.path.join(self.tmp.name, "media_info.db"))
+        self.path = os.path.join(self.tmp.name, "a.flac")
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def write_flac(self, seconds):
+        bits = (8000 << 44) | (15 << 36) | (8000 * seconds)
+        with open(self.path, "wb") as f:
+            f.write(b"fLaC" + b"\x80\x00\x00\x22" + bytes(10) + bits.to_bytes(8, "big") + bytes(16))
+
+    def test_changed_files_are_probed_again(self):
+        self.write_flac(2)
+        self.assertEqual(probe_files([self.path], self.cache, use_ffprobe=False)[self.path].duration, 2.0)
+        self.write_flac(5)
+        os.utime(self.path, ns=(0, 10 ** 9))
+        self.assertEqual(probe_files([self.path], self.cache, use_ffprobe=False)[self.path].duration, 5.0)
+
+    def test_unchanged_files_come_from_the_cache(self):
+        self.write_flac(2)
+        probe_files([self.path], self.cache, use_ffprobe=False)
+        st = os.stat(self.path)
+        found = self.cache.lookup({os.path.abspath(self.path): (st.st_size, st.st_mtime_ns)})
+        self.assertEqual(found, {os.path.abspath(self.path): MediaInfo("flac", "flac", 2.0, 1, 8000)})
+
+
+if __name__ == "__main__":
+    unittest.main()
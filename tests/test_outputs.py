@@ -0,0 +1,96 @@
+import os
+import sys
+import stat
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from transcription import TranscriptionPipeline, find_outputs
+
+# Writes a .txt for every input except those named call.*, and then fails
+# like a real run that lost one input of its group.
+FAKE_EXECUTABLE = """#!{python}
+import os
+import sys
+
+args = sys.argv[1:]
+inputs = []
+while args and not args[0].startswith("--"):
+    inputs.append(args.pop(0))
+output_dir = args[args.index("--output_dir") + 1]
+os.makedirs(output_dir, exist_ok=True)
+failed = False
+for path in inputs:
+    stem = os.path.splitext(os.path.basename(path))[0]
+    if stem == "call":
+        failed = True
+        continue
+    with open(os.path.join(output_dir, stem + ".txt"), "w") as f:
+        f.write("text\\n")
+sys.exit(1 if failed else 0)
+"""
+
+
+def touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write("x")
+
+
+class FindOutputsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.out = os.path.join(self.tmp.name, "out")
+        for name in ("call.srt", "call_bob.txt", "call_en.txt"):
+            touch(os.path.join(self.out, name))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def names(self, *args, **kwargs):
+        return sorted(os.path.basename(path) for path in find_outputs(self.out, *args, **kwargs))
+
+    def test_exact_stem(self):
+        self.assertEqual(self.names("in/call.wav", 0), ["call.srt"])
+        self.assertEqual(self.names("in/call_bob.wav", 0), ["call_bob.txt"])
+
+    def test_postfix(self):
+        self.assertEqual(self.names("in/call.wav", 0, postfix=True), ["call.srt", "call_bob.txt", "call_en.txt"])
+        self.assertEqual(self.names("in/call.wav", 0, postfix=True, other_stems={"call", "call_bob"}),
+                         ["call.srt", "call_en.txt"])
+
+
+@unittest.skipIf(os.name == "nt", "needs an executable script")
+class GroupCollisionTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        with open("config.ini", "w") as f:
+            f.write("[Settings]\nenable_logging = False\n")
+        self.exe = os.path.join(self.tmp.name, "fake-whisper")
+        with open(self.exe, "w") as f:
+            f.write(FAKE_EXECUTABLE.format(python=sys.executable))
+        os.chmod(self.exe, os.stat(self.exe).st_mode | stat.S_IEXEC)
+        for name in ("call.wav", "call_bob.wav", "x.wav"):
+            touch(os.path.join("in", name))
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_prefix_stems_are_not_mixed_up(self):
+        finished = {}
+        pipeline = TranscriptionPipeline(
+            ["in/call.wav", "in/call_bob.wav", "in/x.wav"],
+            {"exe_path": self.exe, "output_dir": "out", "files_per_run": "3", "ff_mdx_kim2": "False"},
+            on_file_finished=lambda filename, status: finished.__setitem__(filename, status),
+        )
+        self.assertTrue(pipeline.run())
+        self.assertEqual(finished, {"in/call.wav": "failed", "in/call_bob.wav": "done", "in/x.wav": "done"})
+        self.assertEqual(pipeline.failed_jobs, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import os
+import sys
+import stat
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from transcription import TranscriptionPipeline
+
+# Writes a .txt for every input and succeeds.
+FAKE_EXECUTABLE = """#!{python}
+import os
+import sys
+
+args = sys.argv[1:]
+inputs = []
+while args and not args[0].startswith("--"):
+    inputs.append(args.pop(0))
+output_dir = args[args.index("--output_dir") + 1]
+os.makedirs(output_dir, exist_ok=True)
+for path in inputs:
+    with open(os.path.join(output_dir, os.path.splitext(os.path.basename(path))[0] + ".txt"), "w") as f:
+        f.write("text\\n")
+"""
+
+
+def run_with_timeout(pipeline, seconds=20):
+    result = []
+    thread = threading.Thread(target=lambda: result.append(pipeline.run()), daemon=True)
+    thread.start()
+    thread.join(seconds)
+    if thread.is_alive():
+        raise AssertionError("run() did not return")
+    return result[0]
+
+
+class PipelineErrorTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        with open("config.ini", "w") as f:
+            f.write("[Settings]\nenable_logging = False\n")
+        os.makedirs("in")
+        for name in ("a.wav", "b.wav"):
+            with open(os.path.join("in", name), "w") as f:
+                f.write("x")
+        self.exe = os.path.join(self.tmp.name, "fake-whisper")
+        with open(self.exe, "w") as f:
+            f.write(FAKE_EXECUTABLE.format(python=sys.executable))
+        os.chmod(self.exe, os.stat(self.exe).st_mode | stat.S_IEXEC)
+        self.finished = {}
+        self.errors = []
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def pipeline(self, **settings):
+        return TranscriptionPipeline(
+            ["in/a.wav", "in/b.wav"],
+            dict({"exe_path": sys.executable, "output_dir": "out", "ff_mdx_kim2": "False"}, **settings),
+            on_error=self.errors.append,
+            on_file_finished=lambda filename, status: self.finished.__setitem__(filename, status),
+        )
+
+    def test_failed_preparation_does_not_hang(self):
+        pipeline = self.pipeline()
+
+        def start_job(position, filename):
+            raise PermissionError(13, "Permission denied", filename)
+
+        pipeline.needs_preparation = lambda filename: True
+        pipeline.should_split = lambda filename: True
+        pipeline.start_job = start_job
+        self.assertTrue(run_with_timeout(pipeline))
+        self.assertEqual(self.finished, {"in/a.wav": "failed", "in/b.wav": "failed"})
+        self.assertEqual(pipeline.failed_jobs, 2)
+
+    def check_unexpected_error(self, files_per_run):
+        pipeline = self.pipeline(exe_path=self.exe, files_per_run=files_per_run)
+
+        def retime(position, outputs):
+            raise ValueError("malformed JSON output")
+
+        pipeline.retime = retime
+        self.assertTrue(run_with_timeout(pipeline))
+        self.assertEqual(self.finished, {"in/a.wav": "failed", "in/b.wav": "failed"})
+        self.assertEqual((pipeline.completed_jobs, pipeline.failed_jobs), (2, 2))
+        self.assertTrue(all("malformed JSON output" in error for error in self.errors))
+
+    @unittest.skipIf(os.name == "nt", "needs an executable script")
+    def test_unexpected_error_fails_the_file(self):
+        self.check_unexpected_error("1")
+
+    @unittest.skipIf(os.name == "nt", "needs an executable script")
+    def test_unexpected_error_fails_the_group(self):
+        self.check_unexpected_error("2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import sys
+import stat
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from result_cache import ResultCache
+from transcription import TranscriptionPipeline
+
+# Writes a .txt for every input and succeeds.
+FAKE_EXECUTABLE = """#!{python}
+import os
+import sys
+
+args = sys.argv[1:]
+inputs = []
+while args and not args[0].startswith("--"):
+    inputs.append(args.pop(0))
+output_dir = args[args.index("--output_dir") + 1]
+os.makedirs(output_dir, exist_ok=True)
+for path in inputs:
+    with open(os.path.join(output_dir, os.path.splitext(os.path.basename(path))[0] + ".txt"), "w") as f:
+        f.write("text\\n")
+"""
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ResultCache(os.path.join(self.tmp.name, "cache"))
+        self.out = os.path.join(self.tmp.name, "out")
+        os.makedirs(self.out)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def test_restored_outputs_do_not_share_the_cached_object(self):
+        output = os.path.join(self.out, "a.srt")
+        with open(output, "w") as f:
+            f.write("original\n")
+        self.cache.store("key", "in/a.wav", [output])
+
+        restored = self.cache.lookup("key", "in/b.wav", self.out)
+        self.assertEqual(restored, [os.path.join(self.out, "b.srt")])
+        with open(restored[0], "r+") as f:
+            f.write("edited!!\n")
+
+        restored = self.cache.lookup("key", "in/c.wav", self.out)
+        with open(restored[0]) as f:
+            self.assertEqual(f.read(), "original\n")
+
+
+@unittest.skipIf(os.name == "nt", "needs an executable script")
+class PreparedCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        with open("config.ini", "w") as f:
+            f.write("[Settings]\nenable_logging = False\n")
+        os.makedirs("in")
+        with open(os.path.join("in", "a.wav"), "w") as f:
+            f.write("x")
+        self.exe = os.path.join(self.tmp.name, "fake-whisper")
+        with open(self.exe, "w") as f:
+            f.write(FAKE_EXECUTABLE.format(python=sys.executable))
+        os.chmod(self.exe, os.stat(self.exe).st_mode | stat.S_IEXEC)
+        self.stripped = []
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def run_pipeline(self):
+        finished = {}
+        pipeline = TranscriptionPipeline(
+            ["in/a.wav"],
+            {"exe_path": self.exe, "output_dir": "out", "ff_mdx_kim2": "False", "cache_enabled": "True",
+             "strip_silence": "True"},
+            on_file_finished=lambda filename, status: finished.__setitem__(filename, status),
+        )
+        pipeline.strip_tool = lambda: "ffmpeg"
+        pipeline.should_split = lambda filename: False
+
+        def strip_file(position, filename):
+            self.stripped.append(filename)
+            return filename
+
+        pipeline.strip_file = strip_file
+        self.assertTrue(pipeline.run())
+        return finished, pipeline.cache_stats
+
+    def test_cache_hit_skips_preparation(self):
+        finished, stats = self.run_pipeline()
+        self.assertEqual(finished, {"in/a.wav": "done"})
+        self.assertEqual(self.stripped, ["in/a.wav"])
+        finished, stats = self.run_pipeline()
+        self.assertEqual(finished, {"in/a.wav": "cached"})
+        self.assertEqual(self.stripped, ["in/a.wav"])
+        self.assertTrue(os.path.isfile(os.path.join("out", "a.txt")))
+
+    def test_every_file_counts_once(self):
+        # The source, content and render keys are all probed for a new file.
+        _, stats = self.run_pipeline()
+        self.assertEqual((stats['hits'], stats['misses']), (0, 1))
+        _, stats = self.run_pipeline()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
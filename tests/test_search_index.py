@@ -0,0 +1,79 @@
+import os
+import sys
+import json
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from search_index import SearchIndex, match_expression
+
+
+class MatchExpressionTest(unittest.TestCase):
+    def test_tokens_are_quoted(self):
+        self.assertEqual(match_expression('budget  "Q3" NOT-final'), '"budget" """Q3""" "NOT-final"')
+        self.assertEqual(match_expression("   "), "")
+
+
+class SearchIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.out = os.path.join(self.tmp.name, "out")
+        os.makedirs(os.path.join(self.out, "2024"))
+        self.index = SearchIndex(os.path.join(self.tmp.name, "search_index.db"))
+
+    def tearDown(self):
+        self.index.close()
+        self.tmp.cleanup()
+
+    def write(self, name, text):
+        path = os.path.join(self.out, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_richest_format_is_indexed_once(self):
+        self.write("meeting.json", json.dumps({"segments": [
+            {"start": 1.5, "end": 3.0, "text": " We moved the budget review.", "speaker": "SPEAKER_01"}]}))
+        self.write("meeting.srt", "1\n00:00:01,500 --> 00:00:03,000\nWe moved the budget review.\n\n")
+        self.write("meeting.txt", "We moved the budget review.\n")
+        self.write(os.path.join("2024", "call.srt"),
+                   "1\n00:01:00,000 --> 00:01:02,000\n[SPEAKER_00]: The Budget is final.\n\n")
+        self.assertEqual(self.index.update(self.out), (2, 0))
+
+        hits = self.index.search("budget")
+        self.assertEqual(len(hits), 2)
+        by_file = {os.path.basename(hit.path): hit for hit in hits}
+        self.assertEqual(sorted(by_file), ["call.srt", "meeting.json"])
+        self.assertEqual((by_file["meeting.json"].start_ms, by_file["meeting.json"].speaker), (1500, "SPEAKER_01"))
+        call = by_file["call.srt"]
+        self.assertEqual((call.start_ms, call.end_ms, call.speaker, call.text),
+                         (60000, 62000, "SPEAKER_00", "The Budget is final."))
+        self.assertIn("[Budget]", call.snippet)
+
+        self.assertEqual(self.index.update(self.out, recursive=False), (0, 0))
+        self.assertEqual(len(self.index.search("budget final")), 1)
+
+    def test_only_changed_and_removed_files_are_touched(self):
+        first = self.write("a.txt", "apples\n")
+        second = self.write("b.txt", "pears\n")
+        self.assertEqual(self.index.update(self.out), (2, 0))
+        self.assertEqual(self.index.update(self.out), (0, 0))
+
+        self.write("a.txt", "oranges and more\n")
+        os.remove(second)
+        self.assertEqual(self.index.update(self.out), (1, 1))
+        self.assertEqual(self.index.search("apples"), [])
+        self.assertEqual(self.index.search("pears"), [])
+        self.assertEqual([hit.path for hit in self.index.search("oranges")], [first])
+
+    def test_hits_name_the_recording(self):
+        output = self.write("talk.txt", "café au lait\n")
+        self.index.record_sources([output], "/media/talk.mp4")
+        self.index.update(self.out)
+        # Diacritics are folded, so a query typed without them matches.
+        self.assertEqual([hit.source for hit in self.index.search("cafe")], ["/media/talk.mp4"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import sys
+import json
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from silence_strip import np, voiced_ranges
+from subtitles import Timeline, retime_outputs
+
+# Kept pieces: 0-10 s of the original, then from 25 s, then from 100 s;
+# in the stripped audio they start at 0, 10 and 30 s.
+PIECES = [(0.0, 0.0), (10.0, 25.0), (30.0, 100.0)]
+
+
+class TimelineTest(unittest.TestCase):
+    def test_times_map_back_to_the_original(self):
+        timeline = Timeline(PIECES)
+        self.assertEqual([timeline(t) for t in (0.0, 9.5, 10.0, 12.5, 30.0, 31.25)],
+                         [0.0, 9.5, 25.0, 27.5, 100.0, 101.25])
+
+
+class RetimeOutputsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, text):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def read(self, path):
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+
+    def test_every_timed_format_is_rewritten(self):
+        srt = self.write("a.srt", "1\n00:00:09,000 --> 00:00:12,500\nhello\n\n")
+        vtt = self.write("a.vtt", "WEBVTT\n\n00:31.000 --> 00:32.000 align:start\nthere\n\n")
+        tsv = self.write("a.tsv", "start\tend\ttext\n9000\t12500\thello\n")
+        transcript = self.write("a.json", json.dumps({"segments": [
+            {"start": 9.0, "end": 12.5, "text": "hello", "words": [{"word": "hello", "start": 11.0, "end": 12.5}]}]}))
+        txt = self.write("a.txt", "00:00:09,000 stays as it is\n")
+        retime_outputs([srt, vtt, tsv, transcript, txt], Timeline(PIECES))
+
+        self.assertEqual(self.read(srt), "1\n00:00:09,000 --> 00:00:27,500\nhello\n\n")
+        self.assertEqual(self.read(vtt), "WEBVTT\n\n01:41.000 --> 01:42.000 align:start\nthere\n\n")
+        self.assertEqual(self.read(tsv), "start\tend\ttext\n9000\t27500\thello\n")
+        segment = json.loads(self.read(transcript))["segments"][0]
+        self.assertEqual((segment["start"], segment["end"]), (9.0, 27.5))
+        self.assertEqual((segment["words"][0]["start"], segment["words"][0]["end"]), (26.0, 27.5))
+        self.assertEqual(self.read(txt), "00:00:09,000 stays as it is\n")
+
+
+@unittest.skipIf(np is None, "needs numpy")
+class VoicedRangesTest(unittest.TestCase):
+    def levels(self, pattern):
+        return np.array([-20.0 if c == "#" else -80.0 for c in pattern], dtype=np.float32)
+
+    def test_long_silences_are_cut_with_padding(self):
+        # Frames 4-13 are silent; one frame of padding stays on each side.
+        self.assertEqual(voiced_ranges(self.levels("####..........####"), -45, 5, 1), [(0, 5), (13, 18)])
+
+    def test_short_silences_are_kept(self):
+        self.assertEqual(voiced_ranges(self.levels("####...####"), -45, 5, 1), [(0, 11)])
+
+    def test_leading_and_trailing_silence_is_cut(self):
+        self.assertEqual(voiced_ranges(self.levels("......####......"), -45, 5, 1), [(5, 11)])
+
+    def test_silent_throughout(self):
+        self.assertEqual(voiced_ranges(self.levels("........"), -45, 5, 1), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import os
+import sys
+import json
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from subtitles import Layout, layout_cues, render_outputs, render_srt, render_tsv, render_txt, timed_cues
+from transcription import build_layout
+
+
+def words(*items):
+    return [{"word": text, "start": start, "end": end} for text, start, end in items]
+
+
+TRANSCRIPT = {"segments": [
+    {"start": 0.0, "end": 1.4, "text": " Hello there. How",
+     "words": words((" Hello", 0.0, 0.5), (" there.", 0.5, 1.0), (" How", 1.2, 1.4))},
+    {"start": 1.5, "end": 6.5, "text": " are you? Fine",
+     "words": words((" are", 1.5, 1.7), (" you?", 1.7, 2.0), (" Fine", 6.0, 6.5))},
+]}
+
+
+def texts(cues):
+    return [(cue.start, cue.end, cue.lines) for cue in cues]
+
+
+class LayoutTest(unittest.TestCase):
+    def test_segments_by_default(self):
+        self.assertEqual(texts(layout_cues(TRANSCRIPT, Layout())),
+                         [(0.0, 1.4, ("Hello there. How",)), (1.5, 6.5, ("are you? Fine",))])
+
+    def test_sentences(self):
+        self.assertEqual(texts(layout_cues(TRANSCRIPT, Layout(sentence=True))),
+                         [(0.0, 1.0, ("Hello there.",)), (1.2, 2.0, ("How are you?",)), (6.0, 6.5, ("Fine",))])
+
+    def test_long_gaps_end_a_sentence(self):
+        data = {"segments": [{"text": " a b", "words": words((" a", 0.0, 0.5), (" b", 4.0, 4.5))}]}
+        self.assertEqual(len(layout_cues(data, Layout(sentence=True))), 2)
+        self.assertEqual(len(layout_cues(data, Layout(sentence=True, max_gap=5.0))), 1)
+
+    def test_lines_and_cues_are_wrapped(self):
+        cues = layout_cues(TRANSCRIPT, Layout(sentence=True, max_line_width=9, max_line_count=2))
+        self.assertEqual(cues[1].lines, ("How are", "you?"))
+        cues = layout_cues(TRANSCRIPT, Layout(sentence=True, max_line_width=9))
+        self.assertEqual(texts(cues)[2:4], [(1.2, 1.7, ("How are",)), (1.7, 2.0, ("you?",))])
+
+    def test_one_word(self):
+        self.assertEqual([cue.lines for cue in layout_cues(TRANSCRIPT, Layout(one_word=True))],
+                         [("Hello",), ("there.",), ("How",), ("are",), ("you?",), ("Fine",)])
+
+    def test_speakers_prefix_the_first_line(self):
+        data = {"segments": [dict(segment, speaker="SPEAKER_00") for segment in TRANSCRIPT["segments"]]}
+        self.assertEqual(layout_cues(data, Layout())[0].lines, ("[SPEAKER_00]: Hello there. How",))
+
+    def test_transcripts_without_words_are_refused(self):
+        with self.assertRaises(ValueError):
+            layout_cues({"segments": [{"start": 0.0, "end": 1.0, "text": " hi"}]}, Layout())
+
+    def test_standard_preset(self):
+        layout = build_layout({"standard": "True"})
+        self.assertEqual((layout.sentence, layout.max_line_width, layout.max_line_count, layout.max_comma_cent),
+                         (True, 42, 2, 70))
+
+
+class RenderTest(unittest.TestCase):
+    def setUp(self):
+        self.layout = Layout(sentence=True)
+        self.cues = layout_cues(TRANSCRIPT, self.layout)
+
+    def test_srt(self):
+        self.assertEqual(render_srt(self.cues, self.layout),
+                         "1\n00:00:00,000 --> 00:00:01,000\nHello there.\n\n"
+                         "2\n00:00:01,200 --> 00:00:02,000\nHow are you?\n\n"
+                         "3\n00:00:06,000 --> 00:00:06,500\nFine\n\n")
+
+    def test_tsv_and_txt(self):
+        self.assertEqual(render_tsv(self.cues, self.layout),
+                         "start\tend\ttext\n0\t1000\tHello there.\n1200\t2000\tHow are you?\n6000\t6500\tFine\n")
+        self.assertEqual(render_txt(self.cues, self.layout), "Hello there.\nHow are you?\nFine\n")
+
+    def test_highlighted_words_fill_the_gaps_with_the_plain_cue(self):
+        layout = Layout(sentence=True, highlight_words=True)
+        self.assertEqual(timed_cues(self.cues[1:2], layout), [
+            (1.2, 1.4, "<u>How</u> are you?"),
+            (1.4, 1.5, "How are you?"),
+            (1.5, 1.7, "How <u>are</u> you?"),
+            (1.7, 2.0, "How are <u>you?</u>"),
+        ])
+
+    def test_render_outputs_writes_each_format(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            transcript = os.path.join(tmp, "cached.json")
+            with open(transcript, "w", encoding="utf-8") as f:
+                json.dump(TRANSCRIPT, f)
+            written = render_outputs(transcript, os.path.join(tmp, "talk"), ["srt", "txt", "json"], self.layout)
+            self.assertEqual([os.path.basename(path) for path in written], ["talk.srt", "talk.txt"])
+            with open(written[1], encoding="utf-8") as f:
+                self.assertEqual(f.read(), "Hello there.\nHow are you?\nFine\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
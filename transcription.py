@@ -0,0 +1,1829 @@
+import os
+import re
+import subprocess
+import logging
+import configparser
+import time
+import threading
+import queue
+import collections
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import job_journal
+from audio_extract import AUDIO_CACHE_DIR, EXTRACT_FORMAT_OPTIONS, AudioExtractor, is_video
+from chunking import MERGED_FORMATS, SplitJob, extract_chunk, ffmpeg_path, find_cut, plan_chunks, plan_cuts, \
+    stitch_outputs
+from download_cache import DOWNLOAD_DIR, DOWNLOAD_TEMPLATE, DownloadCache
+from fingerprint import FINGERPRINT_FILE, FingerprintIndex, fingerprint_available
+from folder_watch import SETTLE_SECONDS, WATCH_STATE_FILE, FolderWatcher
+from media_probe import PROBE_CACHE_FILE, MediaInfoCache, probe
+from media_scan import normalized_path, scan_media
+from progress import DURATION_PATTERN, BatchProgress, OutputParser
+from result_cache import ResultCache, copy_file, hash_file, hash_options
+from silence_strip import strip_available, strip_silence
+from subtitles import Layout, Timeline, render_outputs, retime_outputs
+from scheduler import SCHEDULE_POLICIES, describe_schedule, probe_durations, schedule_jobs
+from search_index import SEARCH_INDEX_FILE, SearchIndex
+from ytdlp_engine import DownloadEngine, engine_available
+
+
+SUPPORTED_LANGUAGES = [
+    "Auto Detect", "Arabic", "Bengali", "Cantonese", "Catalan", "Chinese", "Czech", "Danish", "Dutch", "English",
+    "Finnish", "French", "German", "Greek", "Haitian Creole", "Hebrew", "Hindi", "Hungarian", "Indonesian", "Italian",
+    "Japanese", "Korean", "Norwegian", "Polish", "Portuguese", "Romanian", "Russian", "Slovak", "Slovenian", "Spanish",
+    "Swedish", "Tagalog", "Thai", "Turkish", "Ukrainian", "Urdu", "Vietnamese"
+]
+
+WHISPER_MODELS = [
+    "base", "base.en", "small", "small.en", "medium", "medium.en",
+    "large", "large-v2", "large-v3", "large-v3-turbo", "distil-large-v2", "distil-large-v3"
+]
+
+TASK_OPTIONS = ["transcribe", "translate"]
+OUTPUT_FORMAT_OPTIONS = ["txt", "vtt", "srt", "tsv", "json", "all"]
+VAD_METHOD_OPTIONS = [
+    "silero_v3", "silero_v4", "silero_v5", "silero_v4_fw",
+    "silero_v5_fw", "pyannote_v3", "pyannote_onnx_v3",
+    "auditok", "webrtc"
+]
+COMPUTE_TYPE_OPTIONS = [
+    "default", "auto", "int8", "int8_float16", "int8_float32", "int8_bfloat16",
+    "int16", "float16", "float32", "bfloat16"
+]
+DIARIZE_METHOD_OPTIONS = ["pyannote_v3.0", "pyannote_v3.1", "reverb_v1", "reverb_v2"]
+DOWNLOAD_ENGINE_OPTIONS = ["subprocess", "in-process"]
+
+DEFAULT_VALUES = {
+    "language": "Auto Detect",
+    "model": "large-v2",
+    "task": "transcribe",
+    "output_dir": "",
+    "vad_method": "pyannote_v3",
+    "compute_type": "auto",
+    "temperature": "0.0",
+    "beam_size": "5",
+    "best_of": "5",
+    "mdx_chunk": "15",
+    "mdx_device": "cuda",
+    "exe_path": ""
+}
+
+CONFIG_FILE = "config.ini"
+
+# (min_value, allow_empty) for every setting that is passed to the executable as a number.
+NUMERIC_SETTINGS = {
+    'temperature': (0, False),
+    'beam_size': (0, False),
+    'best_of': (0, False),
+    'mdx_chunk': (0, False),
+    'num_speakers': (1, True),
+    'min_speakers': (1, True),
+    'max_speakers': (1, True),
+    'batch_size': (1, True),
+    'max_workers': (1, True),
+    'max_downloads': (1, True),
+    'files_per_run': (1, True),
+    'cache_max_mb': (0, False),
+    'dedupe_similarity': (0, False),
+    'watch_settle_seconds': (0, False),
+    'service_port': (1, True),
+    'service_jobs': (1, True),
+    'strip_threshold_db': (None, False),
+    'strip_min_silence': (0, False),
+    'split_minutes': (1, False),
+    'split_overlap': (0, False),
+    'language_detection_threshold': (0, False),
+    'language_detection_segments': (1, False),
+    'patience': (0, False),
+    'length_penalty': (0, False),
+    'repetition_penalty': (0, False),
+    'no_repeat_ngram_size': (0, False),
+    'prompt_reset_on_temperature': (0, False),
+    'max_initial_timestamp': (0, False),
+    'compression_ratio_threshold': (0, False),
+    'logprob_threshold': (None, False),
+    'no_speech_threshold': (0, False),
+    'threads': (0, True),
+    'vad_threshold': (0, False),
+    'vad_min_speech_duration_ms': (0, True),
+    'vad_max_speech_duration_s': (0, True),
+    'vad_min_silence_duration_ms': (0, True),
+    'vad_speech_pad_ms': (0, True),
+    'vad_window_size_samples': (0, True),
+    'hallucination_silence_threshold': (0, True),
+    'max_new_tokens': (1, True),
+    'chunk_length': (1, True),
+    'max_comma': (0, False),
+    'max_gap': (0, False),
+    'max_line_width': (1, False),
+    'max_line_count': (1, False),
+    'ff_fftdn': (0, False),
+    'ff_tempo': (0, False),
+    'diarize_threads': (0, True),
+}
+
+
+DEFAULT_SETTINGS = {
+    'language': DEFAULT_VALUES['language'],
+    'model': DEFAULT_VALUES['model'],
+    'task': DEFAULT_VALUES['task'],
+    'output_format': 'txt',
+    'output_dir': DEFAULT_VALUES['output_dir'],
+    'vad_filter': 'True',
+    'vad_method': DEFAULT_VALUES['vad_method'],
+    'word_timestamps': 'True',
+    'temperature': DEFAULT_VALUES['temperature'],
+    'beam_size': DEFAULT_VALUES['beam_size'],
+    'best_of': DEFAULT_VALUES['best_of'],
+    'sentence': 'False',
+    'ff_mdx_kim2': 'True',
+    'mdx_chunk': DEFAULT_VALUES['mdx_chunk'],
+    'mdx_device': DEFAULT_VALUES['mdx_device'],
+    'compute_type': DEFAULT_VALUES['compute_type'],
+    'enable_logging': 'True',
+    'exe_path': DEFAULT_VALUES['exe_path'],
+    'diarize': 'False',
+    'diarize_method': DIARIZE_METHOD_OPTIONS[0],
+    'num_speakers': '',
+    'min_speakers': '',
+    'max_speakers': '',
+    'diarize_dump': '',
+    'hotwords': '',
+    'rehot': 'False',
+    'ignore_dupe_prompt': '2',
+    'multilingual': 'False',
+    'batch_size': '',
+    'batched': 'False',
+    'unmerged': 'False',
+    'max_workers': '1',
+    'max_downloads': '2',
+    'files_per_run': '1',
+    'schedule': SCHEDULE_POLICIES[0],
+    'extract_audio': 'False',
+    'extract_format': EXTRACT_FORMAT_OPTIONS[0],
+    'audio_cache_dir': AUDIO_CACHE_DIR,
+    'strip_silence': 'False',
+    'strip_threshold_db': '-45',
+    'strip_min_silence': '2',
+    'split_long_files': 'False',
+    'split_minutes': '20',
+    'split_overlap': '3',
+    'cache_enabled': 'False',
+    'cache_dir': 'cache',
+    'cache_max_mb': '2048',
+    'dedupe_audio': 'False',
+    'dedupe_similarity': '0.6',
+    'download_dir': DOWNLOAD_DIR,
+    'download_engine': DOWNLOAD_ENGINE_OPTIONS[0],
+    'journal_file': job_journal.JOURNAL_FILE,
+    'probe_cache_file': PROBE_CACHE_FILE,
+    'search_index': 'False',
+    'search_index_file': SEARCH_INDEX_FILE,
+    'watch_dirs': '',
+    'watch_settle_seconds': str(int(SETTLE_SECONDS)),
+    'watch_polling': 'False',
+    'watch_state_file': WATCH_STATE_FILE,
+    'service_host': '127.0.0.1',
+    'service_port': '8765',
+    'service_jobs': '2',
+    'window_geometry': '',
+
+    # Additional defaults for new fields
+    'language_detection_threshold': '0.5',
+    'language_detection_segments': '1',
+    'patience': '2.0',
+    'length_penalty': '1.0',
+    'repetition_penalty': '1.0',
+    'no_repeat_ngram_size': '0',
+    'suppress_blank': 'True',
+    'suppress_tokens': '-1',
+    'initial_prompt': 'auto',
+    'prefix': '',
+    'condition_on_previous_text': 'True',
+    'prompt_reset_on_temperature': '0.5',
+    'without_timestamps': 'False',
+    'max_initial_timestamp': '1.0',
+    'temperature_increment_on_fallback': '0.2',
+    'compression_ratio_threshold': '2.4',
+    'logprob_threshold': '-1.0',
+    'no_speech_threshold': '0.6',
+    'highlight_words': 'False',
+    'prepend_punctuations': "'“¿([{-)",
+    'append_punctuations': "'.。,，!！?？:：”)]}、)",
+    'threads': '0',
+    'vad_threshold': '0.45',
+    'vad_min_speech_duration_ms': '250',
+    'vad_max_speech_duration_s': '',
+    'vad_min_silence_duration_ms': '3000',
+    'vad_speech_pad_ms': '900',
+    'vad_window_size_samples': '1536',
+    'vad_dump': 'False',
+    'vad_dump_aud': 'False',
+    'vad_device': 'cuda',
+    'hallucination_silence_threshold': '',
+    'hallucination_silence_th_temp': '1.0',
+    'clip_timestamps': '0',
+    'max_new_tokens': '',
+    'chunk_length': '',
+    'postfix': 'False',
+    'skip': 'False',
+    'beep_off': 'False',
+    'check_files': 'False',
+    'alt_writer_off': 'False',
+    'hallucinations_list_off': 'False',
+    'v3_offsets_off': 'False',
+    'prompt_reset_on_no_end': '2',
+    'one_word': '0',
+    'standard': 'False',
+    'standard_asia': 'False',
+    'max_comma': '250',
+    'max_comma_cent': '100',
+    'max_gap': '3.0',
+    'max_line_width': '1000',
+    'max_line_count': '1',
+    'min_dist_to_end': '0',
+    'ff_dump': 'False',
+    'ff_track': '1',
+    'ff_fc': 'False',
+    'ff_mp3': 'False',
+    'ff_sync': 'False',
+    'ff_rnndn_sh': 'False',
+    'ff_rnndn_xiph': 'False',
+    'ff_fftdn': '0',
+    'ff_tempo': '1.0',
+    'ff_gate': 'False',
+    'ff_speechnorm': 'False',
+    'ff_loudnorm': 'False',
+    'ff_silence_suppress': '0 3.0',
+    'ff_lowhighpass': 'False',
+    'diarize_device': 'cuda',
+    'diarize_threads': '0',
+    'speaker': 'SPEAKER',
+}
+
+
+class AppConfig:
+    def __init__(self, config_file="config.ini", default_values=None):
+        self.config_file = config_file
+        self.default_values = default_values or {}
+        self.config = configparser.ConfigParser()
+        self.load_config()
+
+    def load_config(self):
+        if os.path.exists(self.config_file):
+            self.config.read(self.config_file)
+        else:
+            self.config['Settings'] = self.default_values
+            self.save_config()
+
+    def save_config(self, settings=None):
+        if settings:
+            # Keep keys that only live in config.ini (window geometry, cache_dir, ...).
+            merged = dict(self.config['Settings']) if self.config.has_section('Settings') else {}
+            merged.update(settings)
+            self.config['Settings'] = merged
+        with open(self.config_file, 'w') as configfile:
+            self.config.write(configfile)
+
+    def get(self, section, option, fallback=None):
+        return self.config.get(section, option, fallback=fallback)
+
+    def get_boolean(self, section, option, fallback=None):
+        return self.config.getboolean(section, option, fallback=fallback)
+
+    def settings(self):
+        merged = dict(self.default_values)
+        if self.config.has_section('Settings'):
+            merged.update(self.config['Settings'])
+        return merged
+
+
+_config = None
+_logging_enabled = None
+
+
+def get_config():
+    # config.ini is read (and created on first run) when it is first needed
+    # rather than on import.
+    global _config
+    if _config is None:
+        _config = AppConfig(config_file=CONFIG_FILE, default_values=DEFAULT_SETTINGS)
+    return _config
+
+
+def setup_logging(enabled=None):
+    # Headless runs pass the flag from their own settings, so that logging
+    # never reads (or creates) config.ini; the GUI follows config.ini.
+    global _logging_enabled
+    _logging_enabled = enabled
+    if enable_logging():
+        logging.basicConfig(filename='transcription.log', level=logging.INFO,
+                            format='%(asctime)s - %(levelname)s - %(message)s')
+
+
+def enable_logging():
+    if _logging_enabled is not None:
+        return _logging_enabled
+    return get_config().get_boolean('Settings', 'enable_logging', fallback=True)
+
+
+def validate_file_extension(filename):
+    valid_extensions = ('.wav', '.mp3', '.m4a', '.ogg', '.mp4',
+                        '.mkv', '.avi', '.webm')
+    return any(filename.lower().endswith(ext) for ext in valid_extensions)
+
+
+def validate_numeric_input(value, min_value=None, max_value=None, allow_empty=True):
+    if allow_empty and value.strip() == '':
+        return True
+    try:
+        numeric_value = float(value)
+        if min_value is not None and numeric_value < min_value:
+            return False
+        if max_value is not None and numeric_value > max_value:
+            return False
+        return True
+    except ValueError:
+        return False
+
+
+# yt-dlp reports the final path itself once the file has been moved into place.
+DOWNLOAD_REPORT = "%(extractor_key)s\t%(id)s\t%(filepath)s"
+# Flat extraction lists the entries of a playlist or channel without resolving
+# each of them; playlist_id is empty when the link is a single video.
+EXPAND_REPORT = "%(playlist_id|)s\t%(webpage_url,url)s"
+
+
+def is_url(source):
+    return source.startswith(("http://", "https://"))
+
+
+def expand_url(url, engine=None):
+    if engine is not None:
+        return engine.expand(url)
+
+    command = ["yt-dlp", "--flat-playlist", "--print", EXPAND_REPORT, url]
+    if enable_logging():
+        logging.info(f"Executing yt-dlp command: {' '.join(command)}")
+    result = subprocess.run(command, check=True, text=True, capture_output=True)
+
+    entries = []
+    for line in result.stdout.splitlines():
+        playlist_id, sep, link = line.strip().partition('\t')
+        if sep and playlist_id and is_url(link):
+            entries.append(link)
+    return entries or [url]
+
+
+def download_audio(url, download_dir=DOWNLOAD_DIR, cache=None):
+    if cache is not None:
+        cached = cache.lookup_url(url)
+        if cached is not None:
+            if enable_logging():
+                logging.info(f"Using the earlier download of {url}: {cached}")
+            return cached
+
+    os.makedirs(download_dir, exist_ok=True)
+    command = [
+        "yt-dlp",
+        "-f", "bestaudio",
+        "--output", os.path.join(download_dir, DOWNLOAD_TEMPLATE),
+        "--continue",
+        "--no-playlist",
+        "--print", "after_move:" + DOWNLOAD_REPORT,
+        url
+    ]
+
+    if enable_logging():
+        logging.info(f"Executing yt-dlp command: {' '.join(command)}")
+
+    result = subprocess.run(command, check=True, text=True, capture_output=True)
+    if enable_logging():
+        logging.info(f"yt-dlp stdout: {result.stdout}")
+        logging.info(f"yt-dlp stderr: {result.stderr}")
+
+    reported = None
+    for line in result.stdout.splitlines():
+        fields = line.strip().split('\t')
+        if len(fields) == 3 and fields[2]:
+            reported = fields
+
+    if reported is None or not os.path.isfile(reported[2]):
+        raise Exception(f"yt-dlp did not report the downloaded file for {url}.")
+
+    extractor, video_id, output_filename = reported
+    if cache is not None:
+        cache.store(url, extractor, video_id, output_filename)
+
+    if enable_logging():
+        logging.info(f"Downloaded file location: {output_filename}")
+
+    return output_filename
+
+
+def setting_str(settings, key):
+    return str(settings.get(key, DEFAULT_SETTINGS.get(key, '')))
+
+
+def setting_bool(settings, key):
+    return setting_str(settings, key).strip().lower() in ('1', 'yes', 'true', 'on')
+
+
+def setting_int(settings, key, default=1):
+    try:
+        return max(1, int(setting_str(settings, key).strip()))
+    except ValueError:
+        return default
+
+
+def build_command_args(settings, filename):
+    language = setting_str(settings, 'language')
+    if language == "Auto Detect":
+        language = None
+    model = setting_str(settings, 'model')
+    task = setting_str(settings, 'task')
+
+    selected_formats = [fmt for fmt in setting_str(settings, 'output_format').split()
+                        if fmt in OUTPUT_FORMAT_OPTIONS]
+    if not selected_formats:
+        selected_formats = ["txt"]
+
+    output_dir = setting_str(settings, 'output_dir') or "output"
+    exe_path = setting_str(settings, 'exe_path') or "faster-whisper-xxl.exe"
+
+    ff_mdx_kim2 = setting_bool(settings, 'ff_mdx_kim2')
+
+    vad_filter_val = "True" if setting_bool(settings, 'vad_filter') else "False"
+    vad_method = setting_str(settings, 'vad_method') if setting_bool(settings, 'vad_filter') else ""
+
+    word_timestamps_val = "True" if setting_bool(settings, 'word_timestamps') else "False"
+    sentence = setting_bool(settings, 'sentence')
+    diarize = setting_bool(settings, 'diarize')
+    diarize_method = setting_str(settings, 'diarize_method').strip()
+    num_speakers = setting_str(settings, 'num_speakers').strip()
+    min_speakers = setting_str(settings, 'min_speakers').strip()
+    max_speakers = setting_str(settings, 'max_speakers').strip()
+    diarize_dump = setting_str(settings, 'diarize_dump').strip()
+    hotwords = setting_str(settings, 'hotwords').strip()
+    rehot = setting_bool(settings, 'rehot')
+
+    ignore_dupe_prompt_val = setting_str(settings, 'ignore_dupe_prompt').strip()
+    if ignore_dupe_prompt_val == '':
+        ignore_dupe_prompt_val = '2'
+    try:
+        int(ignore_dupe_prompt_val)
+    except ValueError:
+        ignore_dupe_prompt_val = '2'
+
+    multilingual_val = "True" if setting_bool(settings, 'multilingual') else "False"
+    batch_size = setting_str(settings, 'batch_size').strip()
+    batched = setting_bool(settings, 'batched')
+    unmerged = setting_bool(settings, 'unmerged')
+
+    # Additional arguments from UI
+    language_detection_threshold = setting_str(settings, 'language_detection_threshold')
+    language_detection_segments = setting_str(settings, 'language_detection_segments')
+    patience = setting_str(settings, 'patience')
+    length_penalty = setting_str(settings, 'length_penalty')
+    repetition_penalty = setting_str(settings, 'repetition_penalty')
+    no_repeat_ngram_size = setting_str(settings, 'no_repeat_ngram_size')
+    suppress_blank_val = "True" if setting_bool(settings, 'suppress_blank') else "False"
+    suppress_tokens = setting_str(settings, 'suppress_tokens')
+    initial_prompt = setting_str(settings, 'initial_prompt')
+    prefix = setting_str(settings, 'prefix')
+    condition_on_previous_text_val = "True" if setting_bool(settings, 'condition_on_previous_text') else "False"
+    prompt_reset_on_temperature = setting_str(settings, 'prompt_reset_on_temperature')
+    without_timestamps_val = "True" if setting_bool(settings, 'without_timestamps') else "False"
+    max_initial_timestamp = setting_str(settings, 'max_initial_timestamp')
+    temperature_increment_on_fallback = setting_str(settings, 'temperature_increment_on_fallback')
+    compression_ratio_threshold = setting_str(settings, 'compression_ratio_threshold')
+    logprob_threshold = setting_str(settings, 'logprob_threshold')
+    no_speech_threshold = setting_str(settings, 'no_speech_threshold')
+    highlight_words_val = "True" if setting_bool(settings, 'highlight_words') else "False"
+    prepend_punctuations = setting_str(settings, 'prepend_punctuations')
+    append_punctuations = setting_str(settings, 'append_punctuations')
+    threads = setting_str(settings, 'threads')
+    temperature = setting_str(settings, 'temperature')
+    beam_size = setting_str(settings, 'beam_size')
+    best_of = setting_str(settings, 'best_of')
+    mdx_chunk = setting_str(settings, 'mdx_chunk')
+    mdx_device = setting_str(settings, 'mdx_device')
+    compute_type = setting_str(settings, 'compute_type')
+
+    vad_threshold = setting_str(settings, 'vad_threshold')
+    vad_min_speech_duration_ms = setting_str(settings, 'vad_min_speech_duration_ms')
+    vad_max_speech_duration_s = setting_str(settings, 'vad_max_speech_duration_s')
+    vad_min_silence_duration_ms = setting_str(settings, 'vad_min_silence_duration_ms')
+    vad_speech_pad_ms = setting_str(settings, 'vad_speech_pad_ms')
+    vad_window_size_samples = setting_str(settings, 'vad_window_size_samples')
+    vad_dump = "True" if setting_bool(settings, 'vad_dump') else "False"
+    vad_dump_aud = "True" if setting_bool(settings, 'vad_dump_aud') else "False"
+    vad_device = setting_str(settings, 'vad_device')
+    hallucination_silence_threshold = setting_str(settings, 'hallucination_silence_threshold')
+    hallucination_silence_th_temp = setting_str(settings, 'hallucination_silence_th_temp')
+    clip_timestamps = setting_str(settings, 'clip_timestamps')
+    max_new_tokens = setting_str(settings, 'max_new_tokens')
+    chunk_length = setting_str(settings, 'chunk_length')
+
+    postfix = setting_bool(settings, 'postfix')
+    skip = setting_bool(settings, 'skip')
+    beep_off = setting_bool(settings, 'beep_off')
+    check_files = setting_bool(settings, 'check_files')
+    alt_writer_off = setting_bool(settings, 'alt_writer_off')
+    hallucinations_list_off = setting_bool(settings, 'hallucinations_list_off')
+    v3_offsets_off = setting_bool(settings, 'v3_offsets_off')
+    prompt_reset_on_no_end = setting_str(settings, 'prompt_reset_on_no_end')
+    rehot_val = rehot
+    one_word = setting_str(settings, 'one_word')
+    sentence_val = sentence
+    standard = setting_bool(settings, 'standard')
+    standard_asia = setting_bool(settings, 'standard_asia')
+    max_comma = setting_str(settings, 'max_comma')
+    max_comma_cent = setting_str(settings, 'max_comma_cent')
+    max_gap = setting_str(settings, 'max_gap')
+    max_line_width = setting_str(settings, 'max_line_width')
+    max_line_count = setting_str(settings, 'max_line_count')
+    min_dist_to_end = setting_str(settings, 'min_dist_to_end')
+
+    ff_dump = setting_bool(settings, 'ff_dump')
+    ff_track = setting_str(settings, 'ff_track')
+    ff_fc = setting_bool(settings, 'ff_fc')
+    ff_mp3 = setting_bool(settings, 'ff_mp3')
+    ff_sync = setting_bool(settings, 'ff_sync')
+    ff_rnndn_sh = setting_bool(settings, 'ff_rnndn_sh')
+    ff_rnndn_xiph = setting_bool(settings, 'ff_rnndn_xiph')
+    ff_fftdn = setting_str(settings, 'ff_fftdn')
+    ff_tempo = setting_str(settings, 'ff_tempo')
+    ff_gate = setting_bool(settings, 'ff_gate')
+    ff_speechnorm = setting_bool(settings, 'ff_speechnorm')
+    ff_loudnorm = setting_bool(settings, 'ff_loudnorm')
+    ff_silence_suppress = setting_str(settings, 'ff_silence_suppress')
+    ff_lowhighpass = setting_bool(settings, 'ff_lowhighpass')
+
+    diarize_device = setting_str(settings, 'diarize_device')
+    diarize_threads = setting_str(settings, 'diarize_threads')
+    speaker = setting_str(settings, 'speaker')
+
+    command = [exe_path, filename, "--model", model]
+    if task != "transcribe":
+        command.extend(["--task", task])
+    command.extend(["--output_dir", output_dir])
+
+    for fmt in selected_formats:
+        command.extend(["--output_format", fmt])
+    command.extend(["--compute_type", compute_type])
+
+    if language:
+        command.extend(["--language", language])
+    if ff_mdx_kim2:
+        command.extend(["--ff_mdx_kim2", "--mdx_chunk", mdx_chunk, "--mdx_device", mdx_device])
+
+    command.extend(["--vad_filter", vad_filter_val])
+    if setting_bool(settings, 'vad_filter') and vad_method:
+        command.extend(["--vad_method", vad_method])
+
+    command.extend(["--word_timestamps", word_timestamps_val])
+    if sentence_val:
+        command.append("--sentence")
+
+    command.extend(["--temperature", temperature])
+    command.extend(["--beam_size", beam_size])
+    command.extend(["--best_of", best_of])
+
+    # Additional arguments
+    if diarize:
+        command.extend(["--diarize", diarize_method])
+        if num_speakers:
+            command.extend(["--num_speakers", num_speakers])
+        if min_speakers:
+            command.extend(["--min_speakers", min_speakers])
+        if max_speakers:
+            command.extend(["--max_speakers", max_speakers])
+        if diarize_dump.strip():
+            command.append("--diarize_dump")
+
+    if hotwords.strip():
+        command.extend(["--hotwords", hotwords])
+    if rehot_val:
+        command.append("--rehot")
+
+    command.extend(["--ignore_dupe_prompt", ignore_dupe_prompt_val])
+    command.extend(["--multilingual", multilingual_val])
+
+    if batch_size:
+        command.extend(["--batch_size", batch_size])
+    if batched:
+        command.append("--batched")
+    if unmerged:
+        command.append("--unmerged")
+
+    # Additional decoding/prompting parameters
+    command.extend(["--language_detection_threshold", language_detection_threshold])
+    command.extend(["--language_detection_segments", language_detection_segments])
+    command.extend(["--patience", patience])
+    command.extend(["--length_penalty", length_penalty])
+    command.extend(["--repetition_penalty", repetition_penalty])
+    command.extend(["--no_repeat_ngram_size", no_repeat_ngram_size])
+    command.extend(["--suppress_blank", suppress_blank_val])
+    if suppress_tokens.strip():
+        command.extend(["--suppress_tokens", suppress_tokens])
+    if initial_prompt.strip():
+        command.extend(["--initial_prompt", initial_prompt])
+    if prefix.strip():
+        command.extend(["--prefix", prefix])
+    command.extend(["--condition_on_previous_text", condition_on_previous_text_val])
+    command.extend(["--prompt_reset_on_temperature", prompt_reset_on_temperature])
+    if without_timestamps_val == "True":
+        command.append("--without_timestamps")
+    command.extend(["--max_initial_timestamp", max_initial_timestamp])
+    if temperature_increment_on_fallback.strip() and temperature_increment_on_fallback.lower() != 'none':
+        command.extend(["--temperature_increment_on_fallback", temperature_increment_on_fallback])
+    command.extend(["--compression_ratio_threshold", compression_ratio_threshold])
+    command.extend(["--logprob_threshold", logprob_threshold])
+    command.extend(["--no_speech_threshold", no_speech_threshold])
+    if highlight_words_val == "True":
+        command.append("--highlight_words")
+    if prepend_punctuations.strip():
+        command.extend(["--prepend_punctuations", prepend_punctuations])
+    if append_punctuations.strip():
+        command.extend(["--append_punctuations", append_punctuations])
+    if threads.strip():
+        command.extend(["--threads", threads])
+
+    # VAD related arguments
+    command.extend(["--vad_threshold", vad_threshold])
+    if vad_min_speech_duration_ms.strip():
+        command.extend(["--vad_min_speech_duration_ms", vad_min_speech_duration_ms])
+    if vad_max_speech_duration_s.strip():
+        command.extend(["--vad_max_speech_duration_s", vad_max_speech_duration_s])
+    if vad_min_silence_duration_ms.strip():
+        command.extend(["--vad_min_silence_duration_ms", vad_min_silence_duration_ms])
+    if vad_speech_pad_ms.strip():
+        command.extend(["--vad_speech_pad_ms", vad_speech_pad_ms])
+    if vad_window_size_samples.strip():
+        command.extend(["--vad_window_size_samples", vad_window_size_samples])
+    if vad_dump == "True":
+        command.append("--vad_dump")
+    if vad_dump_aud == "True":
+        command.append("--vad_dump_aud")
+    if vad_device.strip():
+        command.extend(["--vad_device", vad_device])
+
+    # Hallucination silence
+    if hallucination_silence_threshold.strip():
+        command.extend(["--hallucination_silence_threshold", hallucination_silence_threshold])
+    if hallucination_silence_th_temp != "1.0":
+        command.extend(["--hallucination_silence_th_temp", hallucination_silence_th_temp])
+
+    # Clip timestamps
+    if clip_timestamps.strip() != "0":
+        command.extend(["--clip_timestamps", clip_timestamps])
+
+    # max_new_tokens, chunk_length
+    if max_new_tokens.strip():
+        command.extend(["--max_new_tokens", max_new_tokens])
+    if chunk_length.strip():
+        command.extend(["--chunk_length", chunk_length])
+
+    # Post-processing options
+    if postfix:
+        command.append("--postfix")
+    if skip:
+        command.append("--skip")
+    if beep_off:
+        command.append("--beep_off")
+    if check_files:
+        command.append("--check_files")
+    if alt_writer_off:
+        command.append("--alt_writer_off")
+    if hallucinations_list_off:
+        command.append("--hallucinations_list_off")
+    if v3_offsets_off:
+        command.append("--v3_offsets_off")
+    if prompt_reset_on_no_end != "2":
+        command.extend(["--prompt_reset_on_no_end", prompt_reset_on_no_end])
+    if rehot_val:
+        command.append("--rehot")
+    if one_word != "0":
+        command.extend(["--one_word", one_word])
+    if standard:
+        command.append("--standard")
+    if standard_asia:
+        command.append("--standard_asia")
+    if max_comma.strip() != "250":
+        command.extend(["--max_comma", max_comma])
+    if max_comma_cent != "100":
+        command.extend(["--max_comma_cent", max_comma_cent])
+    if max_gap.strip() != "3.0":
+        command.extend(["--max_gap", max_gap])
+    if max_line_width.strip() != "1000":
+        command.extend(["--max_line_width", max_line_width])
+    if max_line_count.strip() != "1":
+        command.extend(["--max_line_count", max_line_count])
+    if min_dist_to_end != "0":
+        command.extend(["--min_dist_to_end", min_dist_to_end])
+
+    # Audio filters (ff_...)
+    if ff_dump:
+        command.append("--ff_dump")
+    if ff_track != "1":
+        command.extend(["--ff_track", ff_track])
+    if ff_fc:
+        command.append("--ff_fc")
+    if ff_mp3:
+        command.append("--ff_mp3")
+    if ff_sync:
+        command.append("--ff_sync")
+    if ff_rnndn_sh:
+        command.append("--ff_rnndn_sh")
+    if ff_rnndn_xiph:
+        command.append("--ff_rnndn_xiph")
+    if ff_fftdn != "0":
+        command.extend(["--ff_fftdn", ff_fftdn])
+    if ff_tempo != "1.0":
+        command.extend(["--ff_tempo", ff_tempo])
+    if ff_gate:
+        command.append("--ff_gate")
+    if ff_speechnorm:
+        command.append("--ff_speechnorm")
+    if ff_loudnorm:
+        command.append("--ff_loudnorm")
+    if ff_silence_suppress.strip() != "0 3.0":
+        # expected "noise duration"
+        ss_parts = ff_silence_suppress.split()
+        if len(ss_parts) == 2:
+            command.extend(["--ff_silence_suppress", ss_parts[0], ss_parts[1]])
+    if ff_lowhighpass:
+        command.append("--ff_lowhighpass")
+
+    # Diarization device, threads, speaker
+    if diarize_device.strip():
+        command.extend(["--diarize_device", diarize_device])
+    if diarize_threads.strip() != "0":
+        command.extend(["--diarize_threads", diarize_threads])
+    if speaker.strip() != "SPEAKER":
+        command.extend(["--speaker", speaker])
+
+    return command
+
+
+# Options that only change how the transcript is laid out in the output
+# files. Results that differ from an earlier run in nothing else are rendered
+# from the word-level JSON kept from that run instead of transcribing again.
+RENDER_OPTIONS = (
+    '--output_dir', '--output_format', '--sentence', '--standard', '--standard_asia', '--one_word', '--max_comma',
+    '--max_comma_cent', '--max_gap', '--max_line_width', '--max_line_count', '--min_dist_to_end', '--highlight_words',
+)
+
+
+def build_layout(settings):
+    def number(key, default):
+        try:
+            return float(setting_str(settings, key))
+        except ValueError:
+            return default
+
+    # --standard and --standard_asia are the executable's presets: sentences
+    # in two lines of 42 (or 16) characters, broken at commas from 70%.
+    standard = setting_bool(settings, 'standard') or setting_bool(settings, 'standard_asia')
+    return Layout(
+        sentence=standard or setting_bool(settings, 'sentence'),
+        one_word=number('one_word', 0) != 0,
+        highlight_words=setting_bool(settings, 'highlight_words'),
+        max_line_width=(16 if setting_bool(settings, 'standard_asia') else 42) if standard
+        else int(number('max_line_width', 1000)),
+        max_line_count=2 if standard else int(number('max_line_count', 1)),
+        max_comma=int(number('max_comma', 250)),
+        max_comma_cent=70 if standard else number('max_comma_cent', 100),
+        max_gap=number('max_gap', 3.0),
+        min_dist_to_end=int(number('min_dist_to_end', 0)),
+    )
+
+
+def output_formats(settings):
+    formats = [fmt for fmt in setting_str(settings, 'output_format').split() if fmt in OUTPUT_FORMAT_OPTIONS]
+    if "all" in formats:
+        return list(MERGED_FORMATS)
+    return formats or ["txt"]
+
+
+# What may follow the input's stem in an output name: a single extension,
+# and with --postfix a language code before it.
+OUTPUT_SUFFIX_PATTERN = re.compile(r'^\.\w+$')
+POSTFIX_SUFFIX_PATTERN = re.compile(r'^(?:_[A-Za-z]{2,3})?\.\w+$')
+
+
+def output_stem(filename):
+    return os.path.splitext(os.path.basename(filename))[0]
+
+
+def find_outputs(output_dir, filename, since, postfix=False, other_stems=()):
+    # With --postfix, "call_bob.txt" could be the outputs of "call.wav" in
+    # language "bob"; names that are the stem of another input of the batch
+    # are never taken for a postfix.
+    if output_dir == "source":
+        output_dir = os.path.dirname(filename) or "."
+    stem = output_stem(filename)
+    pattern = POSTFIX_SUFFIX_PATTERN if postfix else OUTPUT_SUFFIX_PATTERN
+    outputs = []
+    try:
+        entries = os.scandir(output_dir)
+    except OSError:
+        return outputs
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if not name.startswith(stem) or not pattern.match(name[len(stem):]):
+                continue
+            base = name.rsplit(".", 1)[0]
+            if base != stem and base in other_stems:
+                continue
+            # Allow for coarse filesystem timestamps.
+            if entry.is_file() and entry.stat().st_mtime >= since - 2:
+                outputs.append(entry.path)
+    return outputs
+
+
+def search_transcripts(settings, query, limit=50):
+    # The index is brought up to date with the output folder first, which
+    # only reads the files that changed since the last search.
+    index = SearchIndex(setting_str(settings, 'search_index_file') or SEARCH_INDEX_FILE)
+    try:
+        output_dir = setting_str(settings, 'output_dir') or "output"
+        if output_dir != "source" and os.path.isdir(output_dir):
+            index.update(output_dir)
+        return index.search(query, limit)
+    finally:
+        index.close()
+
+
+def expand_folders(files):
+    # Folders stand for every media file below them, in name order.
+    expanded = []
+    seen = set()
+    for source in files:
+        if os.path.isdir(source):
+            for chunk in scan_media([source], validate_file_extension, seen):
+                expanded.extend(chunk)
+        elif is_url(source):
+            expanded.append(source)
+        elif normalized_path(source) not in seen:
+            seen.add(normalized_path(source))
+            expanded.append(source)
+    return expanded
+
+
+def watch_directories(settings):
+    return [directory.strip() for directory in setting_str(settings, 'watch_dirs').split(os.pathsep)
+            if directory.strip()]
+
+
+def open_folder_watch(settings, directories=None):
+    # Returns a started watcher; files found in the folders are handed over
+    # through next_batch() once they have stopped changing.
+    watcher = FolderWatcher(
+        directories or watch_directories(settings),
+        validate_file_extension,
+        settle_seconds=float(setting_str(settings, 'watch_settle_seconds') or SETTLE_SECONDS),
+        use_polling=setting_bool(settings, 'watch_polling'),
+        state_file=setting_str(settings, 'watch_state_file') or WATCH_STATE_FILE,
+    )
+    watcher.start()
+    if enable_logging():
+        logging.info(f"Watching {', '.join(watcher.roots)} ({watcher.mode()}).")
+        if watcher.fallback:
+            logging.warning(f"Polling the watched folders: {watcher.fallback}.")
+    return watcher
+
+
+def validate_settings(settings):
+    errors = []
+    for key, (min_value, allow_empty) in NUMERIC_SETTINGS.items():
+        value = setting_str(settings, key)
+        if not validate_numeric_input(value, min_value=min_value, allow_empty=allow_empty):
+            errors.append(f"{key} ({value!r})")
+    temperature_increment = setting_str(settings, 'temperature_increment_on_fallback').strip()
+    if temperature_increment.lower() != 'none' and not validate_numeric_input(temperature_increment, min_value=0):
+        errors.append(f"temperature_increment_on_fallback ({temperature_increment!r})")
+    for key in ('max_workers', 'max_downloads', 'files_per_run', 'service_port', 'service_jobs'):
+        value = setting_str(settings, key).strip()
+        if value and not value.isdigit():
+            errors.append(f"{key} ({value!r})")
+    similarity = setting_str(settings, 'dedupe_similarity').strip()
+    if similarity and not validate_numeric_input(similarity, max_value=1):
+        errors.append(f"dedupe_similarity ({similarity!r})")
+    schedule = setting_str(settings, 'schedule')
+    if schedule and schedule not in SCHEDULE_POLICIES:
+        errors.append(f"schedule ({schedule!r})")
+    if errors:
+        raise ValueError("Invalid settings: " + ", ".join(errors))
+
+
+@dataclass(frozen=True, slots=True)
+class TranscriptionSettings:
+    values: MappingProxyType
+    exe_path: str
+    output_dir: str
+    max_workers: int
+    max_downloads: int
+    files_per_run: int
+    base_args: tuple
+    extracted_args: tuple
+
+    @classmethod
+    def from_mapping(cls, settings):
+        validate_settings(settings)
+        values = dict(DEFAULT_SETTINGS)
+        values.update((key, str(value)) for key, value in settings.items())
+
+        # Everything after the input filename is the same for every file of a
+        # batch, so it is built once here instead of once per file.
+        command = build_command_args(values, "")
+        return cls(
+            values=MappingProxyType(values),
+            exe_path=command[0],
+            output_dir=setting_str(values, 'output_dir') or "output",
+            max_workers=setting_int(values, 'max_workers'),
+            max_downloads=setting_int(values, 'max_downloads', default=2),
+            files_per_run=setting_int(values, 'files_per_run'),
+            base_args=tuple(command[2:]),
+            # Extracted audio holds only the selected track.
+            extracted_args=tuple(build_command_args(dict(values, ff_track="1"), "")[2:]),
+        )
+
+    def get(self, key, fallback=None):
+        return self.values.get(key, fallback)
+
+    def command_for(self, *filenames, extracted=False):
+        return [self.exe_path, *filenames, *(self.extracted_args if extracted else self.base_args)]
+
+
+class TranscriptionPipeline:
+    def __init__(self, file_list, settings, on_progress=None, on_error=None, on_file_finished=None,
+                 journal=None, batch_id=None, on_file_progress=None, expand_urls=False, on_expanded=None,
+                 origin=job_journal.CLI, retry_failed=False):
+        self.file_list = list(file_list)
+        if not isinstance(settings, TranscriptionSettings):
+            settings = TranscriptionSettings.from_mapping(settings)
+        self.settings = settings
+        self.on_progress = on_progress or (lambda progress, message: None)
+        self.on_error = on_error or (lambda message: None)
+        self.on_file_finished = on_file_finished or (lambda filename, status: None)
+        self.on_file_progress = on_file_progress or (lambda filename, percent: None)
+        self.on_expanded = on_expanded or (lambda url, entries: None)
+        self.expand_urls = expand_urls
+        self.journal = journal
+        self.batch_id = batch_id
+        self.origin = origin
+        self.retry_failed = retry_failed
+        self.progress_lock = threading.Lock()
+        self.cancelled = threading.Event()
+        self.processes = set()
+        self.progress = None
+        self.total_files = 0
+        self.completed_jobs = 0
+        self.failed_jobs = 0
+        self.finished_positions = set()
+
+        self.cache = None
+        self.cache_stats = None
+        self.fingerprints = None
+        self.pending_fingerprints = {}
+        self.search = None
+        self.output_dirs = set()
+        self.batch_settings = settings
+        self.requested_formats = output_formats(settings.values)
+        self.render_hash = None
+        self.layout = None
+        if setting_bool(settings.values, 'cache_enabled'):
+            self.cache = ResultCache(
+                settings.get('cache_dir') or 'cache',
+                max_bytes=int(float(settings.get('cache_max_mb')) * 1024 * 1024),
+            )
+            self.options_hash = hash_options(settings.base_args)
+            # With word timestamps the JSON output holds everything the other
+            # formats are made of, so it is always written and kept in the
+            # cache under a key that leaves out the layout options.
+            if setting_bool(settings.values, 'word_timestamps'):
+                self.render_hash = hash_options(settings.base_args, ignored=RENDER_OPTIONS)
+                self.layout = build_layout(settings.values)
+                if "json" not in self.requested_formats:
+                    formats = " ".join([*settings.get('output_format').split(), "json"])
+                    self.settings = TranscriptionSettings.from_mapping(dict(settings.values, output_format=formats))
+
+        self.download_dir = settings.get('download_dir') or DOWNLOAD_DIR
+        self.downloads = None
+        self.engine = None
+        self.ffmpeg = None
+        self.extractor = None
+        self.strip_ffmpeg = None
+        self.sources = {}
+        self.source_keys = {}
+        self.queued = {}
+        self.stems = set()
+        self.timelines = {}
+        self.work_dirs = {}
+        self.split_seconds = None
+        self.durations = {}
+
+    def record(self, position, state, **kwargs):
+        if self.journal is not None:
+            self.journal.set_state(self.batch_id, position, state, **kwargs)
+
+    def cancel(self):
+        # Files that have not started are skipped and running processes are
+        # stopped; both are reported as cancelled. Finished files stay done.
+        self.cancelled.set()
+        with self.progress_lock:
+            processes = list(self.processes)
+        for process in processes:
+            process.terminate()
+        if enable_logging():
+            logging.info(f"Cancelled the batch, stopping {len(processes)} running process(es).")
+
+    def run_command(self, jobs, command, split=None, chunk_index=None):
+        # The executable's output is streamed rather than inherited so segment
+        # timestamps can be turned into per-file progress while it runs. When
+        # several inputs share one process, a line naming another input or a
+        # second duration line marks the switch to the next file.
+        index = 0
+        labels = [os.path.basename(filename) for _, filename in jobs]
+        parser = OutputParser()
+        tail = collections.deque(maxlen=20)
+        env = dict(os.environ, PYTHONUNBUFFERED='1')
+        if self.cancelled.is_set():
+            raise OSError("the batch was cancelled")
+        with subprocess.Popen(command, shell=False, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, encoding='utf-8', errors='replace', env=env) as process:
+            with self.progress_lock:
+                self.processes.add(process)
+            if self.cancelled.is_set():
+                process.terminate()
+            for line in process.stdout:
+                line = line.rstrip()
+                if not line:
+                    continue
+                tail.append(line)
+                if len(jobs) > 1:
+                    named = max((i for i, label in enumerate(labels) if label in line),
+                                key=lambda i: len(labels[i]), default=None)
+                    if named is None and parser.duration is not None and index + 1 < len(jobs) \
+                            and DURATION_PATTERN.search(line):
+                        named = index + 1
+                    if named is not None and named != index:
+                        index = named
+                        parser = OutputParser()
+                position, filename = jobs[index]
+                media_position = parser.feed(line)
+                fraction = parser.fraction()
+                if media_position is None or fraction is None:
+                    continue
+                if split is not None:
+                    fraction = split.progress(chunk_index, fraction)
+                filename = self.sources.get(position, filename)
+                update = self.progress.update_file(position, fraction, media_position, labels[index])
+                if update is not None:
+                    self.on_progress(*update)
+                    self.on_file_progress(self.queued.get(position, filename), int(fraction * 100))
+        with self.progress_lock:
+            self.processes.discard(process)
+
+        if process.returncode:
+            names = ", ".join(filename for _, filename in jobs)
+            if enable_logging():
+                logging.error(f"Output of the failed command for {names}:\n" + "\n".join(tail))
+            raise subprocess.CalledProcessError(process.returncode, command, output="\n".join(tail))
+
+    def start_job(self, position, filename):
+        self.record(position, job_journal.TRANSCRIBING, filename=filename)
+        self.progress.start_file(position)
+
+        if self.cache is None or not os.path.isfile(filename):
+            return None, None, None
+        content_hash = hash_file(filename)
+        status, restored = self.lookup_cached(position, filename, content_hash)
+        self.cache.count(restored is not None)
+        return content_hash, status, restored
+
+    def lookup_cached(self, position, filename, content_hash):
+        restored = self.cache.lookup(self.cache.key_for_content(content_hash, self.options_hash), filename,
+                                     self.settings.output_dir)
+        if restored is not None:
+            if enable_logging():
+                logging.info(f"Reused cached transcription for {filename}.")
+            if self.fingerprints is not None and not self.fingerprints.contains(content_hash):
+                fingerprint = self.fingerprint(filename)
+                if fingerprint is not None:
+                    self.fingerprints.add(content_hash, fingerprint)
+            return "cached", restored
+        if self.render_hash is not None:
+            restored = self.render_transcript(content_hash, filename)
+            if restored is not None:
+                return "rendered", restored
+        if self.fingerprints is not None:
+            restored = self.find_duplicate(position, filename, content_hash)
+            if restored is not None:
+                return "duplicate", restored
+        return None, None
+
+    def render_transcript(self, content_hash, filename):
+        # Only layout options differ from an earlier run of the same audio:
+        # the outputs are written from its word-level JSON in a few
+        # milliseconds instead of running the executable.
+        transcripts = self.cache.lookup_files(self.cache.key_for_content(content_hash, self.render_hash))
+        if transcripts is None:
+            return None
+        output_dir = self.settings.output_dir
+        if output_dir == "source":
+            output_dir = os.path.dirname(filename) or "."
+        stem = os.path.splitext(os.path.basename(filename))[0]
+        outputs = []
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+            for suffix, transcript in transcripts.items():
+                prefix = os.path.join(output_dir, stem + suffix.rsplit(".", 1)[0])
+                outputs.extend(render_outputs(transcript, prefix, self.requested_formats, self.layout))
+                if "json" in self.requested_formats:
+                    copy_file(transcript, prefix + ".json")
+                    outputs.append(prefix + ".json")
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            if enable_logging():
+                logging.error(f"Could not render the cached transcript of {filename}, transcribing it again: {e}")
+            return None
+        if enable_logging():
+            logging.info(f"Rendered the outputs of {filename} from its cached transcript.")
+        return outputs
+
+    def fingerprint(self, filename):
+        try:
+            return self.fingerprints.fingerprint(filename)
+        except (OSError, ValueError, subprocess.CalledProcessError) as e:
+            if enable_logging():
+                logging.error(f"Could not fingerprint {filename}: {e}")
+            return None
+
+    def find_duplicate(self, position, filename, content_hash):
+        # The same recording in another container or bitrate has a different
+        # content hash but nearly the same fingerprint. Its transcript is only
+        # reused if it was made with the same options.
+        fingerprint = self.fingerprint(filename)
+        if fingerprint is None:
+            return None
+        self.pending_fingerprints[position] = fingerprint
+        for match, similarity in self.fingerprints.find(fingerprint):
+            if match == content_hash:
+                continue
+            restored = self.cache.lookup(self.cache.key_for_content(match, self.options_hash), filename,
+                                         self.settings.output_dir)
+            if restored is not None:
+                if enable_logging():
+                    logging.info(f"Reused the transcription of a near-duplicate recording for {filename} "
+                                 f"(similarity {similarity:.2f}).")
+                return restored
+        return None
+
+    def store_result(self, position, content_hash, filename, outputs):
+        if self.render_hash is not None:
+            transcripts = [output for output in outputs if output.endswith(".json")]
+            self.cache.store(self.cache.key_for_content(content_hash, self.render_hash), filename, transcripts)
+            if "json" not in self.requested_formats:
+                for transcript in transcripts:
+                    os.remove(transcript)
+                outputs = [output for output in outputs if output not in transcripts]
+        self.cache.store(self.cache.key_for_content(content_hash, self.options_hash), filename, outputs)
+        source_key = self.source_keys.pop(position, None)
+        if source_key is not None:
+            self.cache.store(source_key, filename, outputs)
+        fingerprint = self.pending_fingerprints.pop(position, None)
+        if fingerprint is not None and outputs:
+            self.fingerprints.add(content_hash, fingerprint)
+        return outputs
+
+    def transcribe_file(self, position, filename):
+        content_hash, status, restored = self.start_job(position, filename)
+        if restored is not None:
+            return status, restored
+
+        command = self.settings.command_for(filename, extracted=position in self.sources)
+        if enable_logging():
+            logging.info("Command:")
+            logging.info(" ".join(command))
+        started = time.time()
+        self.run_command([(position, filename)], command)
+
+        outputs = []
+        if content_hash is not None or self.journal is not None or self.search is not None \
+                or position in self.timelines:
+            outputs = self.outputs_of(filename, started)
+        self.retime(position, outputs)
+        if content_hash is not None:
+            outputs = self.store_result(position, content_hash, filename, outputs)
+        return "done", outputs
+
+    def outputs_of(self, filename, since, output_dir=None):
+        return find_outputs(output_dir or self.settings.output_dir, filename, since,
+                            setting_bool(self.settings.values, 'postfix'), self.stems)
+
+    def transcribe_group(self, jobs):
+        # Runs on the executor without a done-callback, so nothing may escape.
+        try:
+            self.run_group(jobs)
+        except Exception as e:
+            for position, filename in jobs:
+                self.job_finished(position, filename, f"An error occurred during transcription of {filename}: {e}")
+
+    def run_group(self, jobs):
+        pending = []
+        for position, filename in jobs:
+            content_hash, status, restored = self.start_job(position, filename)
+            if restored is not None:
+                self.job_finished(position, filename, status=status, outputs=restored)
+            else:
+                pending.append((position, filename, content_hash))
+        if not pending:
+            return
+
+        # One process for the whole group, so the model is loaded once. The
+        # exit code only says whether every input succeeded; which ones did is
+        # read back from the files each input left in the output folder.
+        command = self.settings.command_for(*(filename for _, filename, _ in pending),
+                                            extracted=pending[0][0] in self.sources)
+        if enable_logging():
+            logging.info(f"Command for a group of {len(pending)} file(s):")
+            logging.info(" ".join(command))
+        started = time.time()
+        failure = None
+        try:
+            self.run_command([(position, filename) for position, filename, _ in pending], command)
+        except subprocess.CalledProcessError as e:
+            failure = e
+        except OSError as e:
+            for position, filename, _ in pending:
+                self.job_finished(position, filename, f"An error occurred during transcription of {filename}: {e}")
+            return
+
+        # With --skip the executable leaves existing results alone, so older
+        # outputs count as well.
+        since = 0 if setting_bool(self.settings.values, 'skip') else started
+        for position, filename, content_hash in pending:
+            outputs = self.outputs_of(filename, since)
+            if not outputs:
+                reason = failure or "no output files were written"
+                self.job_finished(position, filename, f"An error occurred during transcription of {filename}: {reason}")
+                continue
+            self.retime(position, outputs)
+            if content_hash is not None:
+                outputs = self.store_result(position, content_hash, filename, outputs)
+            self.job_finished(position, filename, outputs=outputs)
+
+    def job_finished(self, position, filename, error=None, status="done", outputs=None):
+        # A file is reported once; the error handlers below may fail files
+        # that were already finished before the error.
+        with self.progress_lock:
+            if position in self.finished_positions:
+                return
+            self.finished_positions.add(position)
+        filename = self.sources.get(position, filename)
+        self.pending_fingerprints.pop(position, None)
+        if position in self.work_dirs:
+            shutil.rmtree(self.work_dirs.pop(position), ignore_errors=True)
+        with self.progress_lock:
+            self.completed_jobs += 1
+            if error is not None:
+                self.failed_jobs += 1
+
+        if error is None:
+            self.record(position, job_journal.DONE, outputs=outputs or [])
+            if self.search is not None and outputs:
+                self.search.record_sources(outputs, os.path.abspath(filename))
+                self.output_dirs.update(os.path.dirname(os.path.abspath(output)) for output in outputs)
+            self.on_file_finished(self.queued.get(position, filename), status)
+            if enable_logging():
+                logging.info(f"Transcription complete for {filename}.")
+        elif self.cancelled.is_set():
+            self.record(position, job_journal.FAILED, error="Cancelled")
+            self.on_file_finished(self.queued.get(position, filename), "cancelled")
+        else:
+            self.record(position, job_journal.FAILED, error=error)
+            self.on_file_finished(self.queued.get(position, filename), "failed")
+            self.on_error(error)
+            if enable_logging():
+                logging.error(error)
+
+        self.on_progress(*self.progress.finish_file(position))
+
+    def transcription_done(self, future, position, filename):
+        try:
+            status, outputs = future.result()
+        except Exception as e:
+            self.job_finished(position, filename, f"An error occurred during transcription of {filename}: {e}")
+        else:
+            self.job_finished(position, filename, status=status, outputs=outputs)
+
+    def download_progress(self, url, fraction):
+        update = self.progress.update_download(url, fraction)
+        if update is not None:
+            self.on_progress(*update)
+            self.on_file_progress(url, int(fraction * 100))
+
+    def download_file(self, position, url, ready_files):
+        if self.cancelled.is_set():
+            self.job_finished(position, url, "Cancelled")
+            ready_files.put((position, None, None))
+            return
+        self.record(position, job_journal.DOWNLOADING)
+        try:
+            if self.engine is not None:
+                filename = self.engine.download(url)
+            else:
+                filename = download_audio(url, self.download_dir, self.downloads)
+        except Exception as e:
+            self.job_finished(position, url, f"Failed to download from {url}: {e}")
+            ready_files.put((position, None, None))
+        else:
+            self.prepare_file(position, filename, ready_files)
+
+    def needs_preparation(self, filename):
+        return (self.strip_ffmpeg is not None or (self.extractor is not None and is_video(filename))
+                or self.should_split(filename))
+
+    def prepare_file(self, position, filename, ready_files):
+        # Every file has to reach ready_files, even when extracting,
+        # stripping or splitting it fails, or run() waits for it forever.
+        try:
+            self.prepare(position, filename, ready_files)
+        except Exception as e:
+            self.job_finished(position, filename, f"Could not prepare {filename}: {e}")
+            ready_files.put((position, None, None))
+
+    def source_key(self, filename):
+        # Extracted or stripped audio only exists after the ffmpeg work, so
+        # its results are also kept under the hash of the file it was made
+        # from, with the preparation settings added to the options.
+        args = list(self.batch_settings.base_args)
+        if self.extractor is not None and is_video(filename):
+            args.extend(["--extract_audio", self.extractor.audio_format])
+        if self.strip_ffmpeg is not None:
+            args.extend(["--strip_silence", self.settings.get('strip_threshold_db'),
+                         self.settings.get('strip_min_silence')])
+        return self.cache.key_for(filename, hash_options(args))
+
+    def restore_source(self, position, filename):
+        key = self.source_key(filename)
+        restored = self.cache.lookup(key, filename, self.settings.output_dir)
+        if restored is None:
+            # Counted once the prepared file is looked up in start_job.
+            self.source_keys[position] = key
+            return False
+        self.cache.count(True)
+        if enable_logging():
+            logging.info(f"Reused cached transcription for {filename} without preparing it.")
+        self.record(position, job_journal.TRANSCRIBING, filename=filename)
+        self.progress.start_file(position)
+        self.job_finished(position, filename, status="cached", outputs=restored)
+        return True
+
+    def prepare(self, position, filename, ready_files):
+        if self.cache is not None and os.path.isfile(filename) \
+                and (self.strip_ffmpeg is not None or (self.extractor is not None and is_video(filename))) \
+                and self.restore_source(position, filename):
+            ready_files.put((position, None, None))
+            return
+        if self.extractor is not None and is_video(filename):
+            try:
+                extracted = self.extractor.extract(filename, self.settings.get('ff_track') or "1")
+            except (OSError, ValueError, subprocess.CalledProcessError) as e:
+                if enable_logging():
+                    logging.error(f"Could not extract the audio of {filename}, using the file as it is: {e}")
+            else:
+                if enable_logging():
+                    logging.info(f"Using extracted audio {extracted} for {filename}.")
+                self.sources[position] = filename
+                filename = extracted
+        if self.strip_ffmpeg is not None:
+            stripped = self.strip_file(position, filename)
+            if stripped is None:
+                self.job_finished(position, filename, status="silent", outputs=[])
+                ready_files.put((position, None, None))
+                return
+            filename = stripped
+        if self.should_split(filename):
+            self.prepare_split(position, filename, ready_files)
+        else:
+            ready_files.put((position, filename, None))
+
+    def strip_file(self, position, filename):
+        # Long silences are cut out of a 16 kHz mono copy (or one at the
+        # source rate for MDX separation) that keeps the original stem, and
+        # the timeline of the kept pieces is used afterwards to move every
+        # output timestamp back onto the original recording.
+        sample_rate, channels = 16000, 1
+        if setting_bool(self.settings.values, 'ff_mdx_kim2'):
+            try:
+                info = probe(filename)
+            except OSError:
+                info = None
+            if info is not None and info.sample_rate and info.channels:
+                sample_rate, channels = info.sample_rate, info.channels
+        work_dir = tempfile.mkdtemp(prefix="strip-")
+        destination = os.path.join(work_dir, os.path.splitext(os.path.basename(filename))[0] + ".wav")
+        try:
+            pieces = strip_silence(self.strip_ffmpeg, filename, destination,
+                                   float(self.settings.get('strip_threshold_db')),
+                                   float(self.settings.get('strip_min_silence')), sample_rate, channels)
+        except (OSError, ValueError, subprocess.CalledProcessError) as e:
+            pieces = None
+            if enable_logging():
+                logging.error(f"Could not strip the silence of {filename}, using the file as it is: {e}")
+        if not pieces:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            if pieces == []:
+                if enable_logging():
+                    logging.info(f"Skipping {filename}: it is silent throughout.")
+                return None
+            return filename
+
+        self.sources.setdefault(position, filename)
+        self.work_dirs[position] = work_dir
+        self.timelines[position] = Timeline(pieces)
+        if enable_logging():
+            logging.info(f"Stripped the silence of {filename}: kept {len(pieces)} piece(s).")
+        return destination
+
+    def retime(self, position, outputs):
+        if position in self.timelines:
+            retime_outputs(outputs, self.timelines[position])
+
+    def should_split(self, filename):
+        if self.ffmpeg is None:
+            return False
+        if filename not in self.durations:
+            try:
+                info = probe(filename)
+            except OSError:
+                info = None
+            self.durations[filename] = info.duration if info is not None else None
+        duration = self.durations[filename]
+        return duration is not None and duration > self.split_seconds * 1.5
+
+    def prepare_split(self, position, filename, ready_files):
+        content_hash, status, restored = self.start_job(position, filename)
+        if restored is not None:
+            self.job_finished(position, filename, status=status, outputs=restored)
+            ready_files.put((position, None, None))
+            return
+        split = self.split_file(position, filename)
+        if split is not None:
+            split.content_hash = content_hash
+        ready_files.put((position, filename, split))
+
+    def split_file(self, position, filename):
+        # Cuts are placed at the silence nearest to evenly spaced targets, and
+        # every chunk reaches split_overlap seconds into its neighbours so a
+        # word cut at a missed pause is still heard whole by one of them.
+        duration = self.durations[filename]
+        stem = os.path.splitext(os.path.basename(filename))[0]
+        work_dir = tempfile.mkdtemp(prefix="split-")
+        audio_dir = os.path.join(work_dir, "audio")
+        output_dir = os.path.join(work_dir, "out")
+        window = min(30.0, self.split_seconds / 4)
+        # MDX vocal separation wants the original sample rate and channels.
+        keep_format = setting_bool(self.settings.values, 'ff_mdx_kim2')
+        try:
+            os.makedirs(audio_dir)
+            with ThreadPoolExecutor(max_workers=self.settings.max_workers) as pool:
+                cuts = list(pool.map(lambda target: find_cut(self.ffmpeg, filename, target, window),
+                                     plan_cuts(duration, self.split_seconds)))
+                chunks = plan_chunks(audio_dir, stem, duration, cuts, float(self.settings.get('split_overlap')))
+                list(pool.map(lambda chunk: extract_chunk(self.ffmpeg, filename, chunk, keep_format), chunks))
+        except (OSError, subprocess.CalledProcessError) as e:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            if enable_logging():
+                logging.error(f"Could not split {filename}, transcribing it in one piece: {e}")
+            return None
+
+        # Chunks always produce JSON as well: its timestamps are what the
+        # plain text output is rebuilt from.
+        formats = self.settings.get('output_format').split()
+        if "all" not in formats and "json" not in formats:
+            formats.append("json")
+        values = dict(self.settings.values, output_dir=output_dir, output_format=" ".join(formats))
+        if position in self.sources:
+            values['ff_track'] = "1"
+        if enable_logging():
+            logging.info(f"Split {filename} ({duration:.0f} s) into {len(chunks)} chunks at "
+                         + ", ".join(f"{cut:.1f}" for cut in cuts) + " s.")
+        return SplitJob(position, filename, work_dir, chunks, build_command_args(values, ""))
+
+    def transcribe_chunk(self, split, index):
+        chunk = split.chunks[index]
+        command = split.command_for(index)
+        if enable_logging():
+            logging.info(f"Command for chunk {index + 1}/{len(split.chunks)} of {split.filename}:")
+            logging.info(" ".join(command))
+        self.run_command([(split.position, chunk.path)], command, split=split, chunk_index=index)
+        outputs = self.outputs_of(chunk.path, 0, split.output_dir)
+        if not outputs:
+            raise OSError(f"no output files were written for {chunk.path}")
+        return outputs
+
+    def chunk_done(self, future, split, index):
+        try:
+            outputs, error = future.result(), None
+        except Exception as e:
+            outputs, error = None, e
+        if split.chunk_finished(index, outputs, error):
+            try:
+                self.finish_split(split)
+            except Exception as e:
+                self.job_finished(split.position, split.filename,
+                                  f"An error occurred during transcription of {split.filename}: {e}")
+
+    def finish_split(self, split):
+        filename = split.filename
+        try:
+            if split.errors:
+                self.job_finished(split.position, filename,
+                                  f"An error occurred during transcription of {filename}: {split.errors[0]}")
+                return
+            output_dir = self.settings.output_dir
+            if output_dir == "source":
+                output_dir = os.path.dirname(filename) or "."
+            formats = self.settings.get('output_format').split()
+            if "all" in formats:
+                formats = MERGED_FORMATS
+            try:
+                outputs = stitch_outputs(split, output_dir, formats)
+            except (OSError, ValueError) as e:
+                self.job_finished(split.position, filename, f"Could not merge the chunks of {filename}: {e}")
+                return
+            self.retime(split.position, outputs)
+            if split.content_hash is not None:
+                outputs = self.store_result(split.position, split.content_hash, filename, outputs)
+            self.job_finished(split.position, filename, outputs=outputs)
+        finally:
+            shutil.rmtree(split.work_dir, ignore_errors=True)
+
+    def open_downloads(self, sources):
+        if not any(is_url(source) for source in sources):
+            return
+        self.downloads = DownloadCache(self.download_dir)
+        if self.settings.get('download_engine') == "in-process":
+            if engine_available():
+                self.engine = DownloadEngine(self.download_dir, self.downloads, on_progress=self.download_progress)
+            elif enable_logging():
+                logging.warning("The yt_dlp package is not installed; downloading with the yt-dlp executable.")
+
+    def close_downloads(self):
+        if self.engine is not None:
+            self.engine.close()
+        if self.downloads is not None:
+            self.downloads.close()
+
+    def expand_sources(self, sources):
+        # Playlist and channel links are replaced by their entries before the
+        # batch starts, so every entry is downloaded, transcribed and reported
+        # on its own. A link that cannot be listed is kept as it is and fails
+        # at download time like any other broken link.
+        urls = list(dict.fromkeys(source for source in sources if is_url(source)))
+        if not urls:
+            return sources
+        with ThreadPoolExecutor(max_workers=self.settings.max_downloads) as pool:
+            futures = {url: pool.submit(expand_url, url, self.engine) for url in urls}
+        expanded = {}
+        for url, future in futures.items():
+            try:
+                expanded[url] = future.result()
+            except Exception as e:
+                expanded[url] = [url]
+                if enable_logging():
+                    logging.error(f"Could not list the entries of {url}: {e}")
+            if expanded[url] != [url]:
+                self.on_expanded(url, expanded[url])
+                if enable_logging():
+                    logging.info(f"Expanded {url} into {len(expanded[url])} entries.")
+        return [entry for source in sources for entry in expanded.get(source, [source])]
+
+    def media_durations(self, jobs):
+        # Links are probed once they are downloaded, which is too late to
+        # change their place; they count as long files.
+        local_files = list(dict.fromkeys(source for _, source in jobs if not is_url(source)))
+        cache = MediaInfoCache(self.settings.get('probe_cache_file') or PROBE_CACHE_FILE)
+        try:
+            return probe_durations(local_files, cache, max_workers=max(8, self.settings.max_workers))
+        finally:
+            cache.close()
+
+    def schedule(self, jobs):
+        policy = self.settings.get('schedule') or SCHEDULE_POLICIES[0]
+        if policy == "fifo":
+            return jobs
+        jobs = schedule_jobs(jobs, policy, self.durations)
+        if enable_logging():
+            for message in describe_schedule(jobs, policy, self.durations):
+                logging.info(message)
+        return jobs
+
+    def split_tool(self):
+        if not setting_bool(self.settings.values, 'split_long_files'):
+            return None
+        ffmpeg = ffmpeg_path()
+        if ffmpeg is None and enable_logging():
+            logging.warning("ffmpeg was not found on PATH; long files are transcribed in one piece.")
+        return ffmpeg
+
+    def strip_tool(self):
+        if not setting_bool(self.settings.values, 'strip_silence'):
+            return None
+        if self.settings.output_dir == "source":
+            if enable_logging():
+                logging.warning("Silence stripping is not used when results are saved next to the source files.")
+            return None
+        ffmpeg = ffmpeg_path()
+        if (ffmpeg is None or not strip_available()) and enable_logging():
+            logging.warning("Silence stripping needs ffmpeg on PATH and the numpy package; files are used as they are.")
+        return ffmpeg if strip_available() else None
+
+    def open_fingerprints(self):
+        if not setting_bool(self.settings.values, 'dedupe_audio'):
+            return None
+        if self.cache is None:
+            if enable_logging():
+                logging.warning("Near-duplicate detection reuses transcripts from the result cache; "
+                                "enable the cache to use it.")
+            return None
+        ffmpeg = ffmpeg_path()
+        if ffmpeg is None or not fingerprint_available():
+            if enable_logging():
+                logging.warning("Near-duplicate detection needs ffmpeg on PATH and the numpy package.")
+            return None
+        return FingerprintIndex(ffmpeg, os.path.join(self.cache.cache_dir, FINGERPRINT_FILE),
+                                min_similarity=float(self.settings.get('dedupe_similarity')))
+
+    def update_search_index(self):
+        # Results saved next to their sources are indexed folder by folder,
+        # without walking the rest of the media library.
+        if self.settings.output_dir == "source":
+            roots = [(directory, False) for directory in sorted(self.output_dirs)]
+        else:
+            roots = [(self.settings.output_dir, True)]
+        for root, recursive in roots:
+            indexed, removed = self.search.update(root, recursive)
+            if enable_logging():
+                logging.info(f"Search index for {root}: {indexed} file(s) indexed, {removed} removed.")
+
+    def open_extractor(self):
+        if not setting_bool(self.settings.values, 'extract_audio'):
+            return None
+        # With output_dir "source" the executable would write next to the
+        # extracted audio instead of the original file.
+        if self.settings.output_dir == "source":
+            if enable_logging():
+                logging.warning("Audio pre-extraction is not used when results are saved next to the source files.")
+            return None
+        ffmpeg = ffmpeg_path()
+        if ffmpeg is None:
+            if enable_logging():
+                logging.warning("ffmpeg was not found on PATH; video files are passed to the executable as they are.")
+            return None
+        return AudioExtractor(ffmpeg, self.settings.get('audio_cache_dir') or AUDIO_CACHE_DIR,
+                              audio_format=self.settings.get('extract_format'),
+                              keep_format=setting_bool(self.settings.values, 'ff_mdx_kim2'))
+
+    def run(self):
+        if self.journal is not None and self.batch_id is not None:
+            jobs = self.journal.resume_items(self.batch_id, self.retry_failed)
+            if not jobs:
+                # Only finished or failed files are left.
+                self.journal.finish_batch(self.batch_id)
+                self.on_error(f"Batch {self.batch_id} has no unfinished files left to resume.")
+                return False
+            self.open_downloads([source for _, source in jobs])
+            if enable_logging():
+                logging.info(f"Resuming batch {self.batch_id} with {len(jobs)} unfinished file(s).")
+        else:
+            self.open_downloads(self.file_list)
+            if self.expand_urls:
+                self.file_list = self.expand_sources(self.file_list)
+            jobs = list(enumerate(self.file_list))
+            if self.journal is not None and jobs:
+                self.batch_id = self.journal.start_batch(self.file_list, self.batch_settings.values, self.origin)
+
+        if not jobs:
+            self.close_downloads()
+            self.on_error("Please select at least one file or provide a link.")
+            return False
+
+        # Callbacks name every file as it was queued, so that a link keeps
+        # its name after it has been downloaded.
+        self.queued = dict(jobs)
+        self.stems = {output_stem(source) for _, source in jobs if not is_url(source)}
+        self.total_files = len(jobs)
+        self.completed_jobs = 0
+        self.failed_jobs = 0
+        self.finished_positions = set()
+        self.progress = BatchProgress(self.total_files)
+        self.on_progress(0, f"Progress: 0/{self.total_files}")
+
+        max_workers = self.settings.max_workers
+        max_downloads = self.settings.max_downloads
+        # Groups are capped so that every parallel job still gets a share of
+        # the batch.
+        group_size = max(1, min(self.settings.files_per_run, -(-self.total_files // max_workers)))
+        if enable_logging():
+            logging.info(f"Transcribing {self.total_files} file(s) with {max_workers} parallel job(s), "
+                         f"{group_size} file(s) per run and {max_downloads} parallel download(s).")
+
+        self.ffmpeg = self.split_tool()
+        self.extractor = self.open_extractor()
+        self.strip_ffmpeg = self.strip_tool()
+        self.fingerprints = self.open_fingerprints()
+        if setting_bool(self.settings.values, 'search_index'):
+            self.search = SearchIndex(self.settings.get('search_index_file') or SEARCH_INDEX_FILE)
+            self.output_dirs = set()
+        self.split_seconds = float(self.settings.get('split_minutes')) * 60
+        self.durations = {}
+        if (self.settings.get('schedule') or "fifo") != "fifo" or self.ffmpeg is not None:
+            self.durations = self.media_durations(jobs)
+        jobs = self.schedule(jobs)
+
+        # Downloads, audio extraction and splitting run in their own pools and
+        # hand finished files over through ready_files, so they overlap with
+        # earlier files that are already transcribing.
+        ready_files = queue.Queue()
+        with ThreadPoolExecutor(max_workers=max_downloads) as downloader, \
+                ThreadPoolExecutor(max_workers=max_workers) as preparer, \
+                ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for position, file_path in jobs:
+                if is_url(file_path):
+                    downloader.submit(self.download_file, position, file_path, ready_files)
+                elif self.needs_preparation(file_path):
+                    preparer.submit(self.prepare_file, position, file_path, ready_files)
+                else:
+                    ready_files.put((position, file_path, None))
+
+            group = []
+            for _ in range(self.total_files):
+                position, filename, split = ready_files.get()
+                if filename is None:
+                    continue
+                self.stems.add(output_stem(filename))
+                if self.cancelled.is_set():
+                    if split is not None:
+                        shutil.rmtree(split.work_dir, ignore_errors=True)
+                    self.job_finished(position, filename, "Cancelled")
+                    continue
+
+                if split is not None:
+                    for index in range(len(split.chunks)):
+                        future = executor.submit(self.transcribe_chunk, split, index)
+                        future.add_done_callback(
+                            lambda f, split=split, index=index: self.chunk_done(f, split, index))
+                    continue
+
+                if group_size == 1:
+                    future = executor.submit(self.transcribe_file, position, filename)
+                    future.add_done_callback(
+                        lambda f, position=position, name=filename: self.transcription_done(f, position, name))
+                    continue
+
+                # Inputs sharing a stem would write the same output names, and
+                # with one stem a prefix of the other ("call", "call_bob") the
+                # outputs could be mistaken for each other's. Extracted audio is
+                # run without --ff_track.
+                stem = output_stem(filename)
+                if any(other.startswith(stem) or stem.startswith(other)
+                       for other in (output_stem(name) for _, name in group)) \
+                        or (group and (group[0][0] in self.sources) != (position in self.sources)):
+                    executor.submit(self.transcribe_group, group)
+                    group = []
+                group.append((position, filename))
+                if len(group) >= group_size:
+                    executor.submit(self.transcribe_group, group)
+                    group = []
+            if group:
+                executor.submit(self.transcribe_group, group)
+
+        if self.journal is not None:
+            self.journal.finish_batch(self.batch_id)
+        self.close_downloads()
+        if self.extractor is not None:
+            if enable_logging():
+                logging.info(f"Audio extraction: {self.extractor.hits} reused, {self.extractor.misses} extracted.")
+            self.extractor.close()
+        if self.cache is not None:
+            stats = self.cache_stats = self.cache.stats()
+            if enable_logging():
+                logging.info(f"Result cache: {stats['hits']} hit(s), {stats['misses']} miss(es), "
+                             f"{stats['entries']} entries, {stats['size_bytes']} bytes.")
+            self.cache.close()
+        if self.fingerprints is not None:
+            self.fingerprints.close()
+        if self.search is not None:
+            self.update_search_index()
+            self.search.close()
+        return True
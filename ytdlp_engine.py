@@ -0,0 +1,103 @@
+import os
+import logging
+import threading
+
+from download_cache import DOWNLOAD_DIR, DOWNLOAD_TEMPLATE
+
+try:
+    import yt_dlp
+except ImportError:
+    yt_dlp = None
+
+
+def engine_available():
+    return yt_dlp is not None
+
+
+class DownloadEngine:
+    def __init__(self, download_dir=DOWNLOAD_DIR, cache=None, on_progress=None, options=None):
+        if yt_dlp is None:
+            raise RuntimeError("The yt_dlp package is not installed.")
+        self.download_dir = download_dir
+        self.cache = cache
+        self.on_progress = on_progress or (lambda url, fraction: None)
+        self.options = {
+            'format': 'bestaudio',
+            'outtmpl': os.path.join(download_dir, DOWNLOAD_TEMPLATE),
+            'continuedl': True,
+            'noplaylist': True,
+            'quiet': True,
+            'no_warnings': True,
+            'noprogress': True,
+            'logger': logging.getLogger('yt_dlp'),
+        }
+        self.options.update(options or {})
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.instances = []
+
+    def instance(self, flat=False):
+        # YoutubeDL is not thread-safe, so every download thread keeps one
+        # long-lived instance. Its extractors and HTTP connections are reused
+        # for every URL that thread handles.
+        name = 'flat_ydl' if flat else 'ydl'
+        ydl = getattr(self.local, name, None)
+        if ydl is None:
+            if flat:
+                ydl = yt_dlp.YoutubeDL(dict(self.options, extract_flat='in_playlist'))
+            else:
+                ydl = yt_dlp.YoutubeDL(self.options)
+                ydl.add_progress_hook(self.progress_hook)
+            with self.lock:
+                self.instances.append(ydl)
+            setattr(self.local, name, ydl)
+        return ydl
+
+    def progress_hook(self, status):
+        url = getattr(self.local, 'url', None)
+        if url is None:
+            return
+        if status.get('status') == 'finished':
+            self.on_progress(url, 1.0)
+            return
+        total = status.get('total_bytes') or status.get('total_bytes_estimate')
+        if status.get('status') == 'downloading' and total:
+            self.on_progress(url, min(1.0, status.get('downloaded_bytes', 0) / total))
+
+    def expand(self, url):
+        info = self.instance(flat=True).extract_info(url, download=False)
+        if info.get('_type') != 'playlist':
+            return [url]
+        entries = []
+        for entry in info.get('entries') or []:
+            link = entry and (entry.get('webpage_url') or entry.get('url'))
+            if link:
+                entries.append(link)
+        return entries or [url]
+
+    def download(self, url):
+        if self.cache is not None:
+            cached = self.cache.lookup_url(url)
+            if cached is not None:
+                return cached
+
+        os.makedirs(self.download_dir, exist_ok=True)
+        self.local.url = url
+        try:
+            info = self.instance().extract_info(url, download=True)
+        finally:
+            self.local.url = None
+
+        requested = info.get('requested_downloads') or [info]
+        filename = requested[-1].get('filepath')
+        if not filename or not os.path.isfile(filename):
+            raise Exception(f"yt-dlp did not report the downloaded file for {url}.")
+        if self.cache is not None:
+            self.cache.store(url, info.get('extractor_key') or '', str(info.get('id') or ''), filename)
+        return filename
+
+    def close(self):
+        with self.lock:
+            for ydl in self.instances:
+                ydl.close()
+            self.instances = []